@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 from functools import partial
+from typing import TYPE_CHECKING
 from toolz import compose
 from aenum import constant  # type: ignore[import-untyped]
 
@@ -13,6 +14,7 @@ from kfactory.kcell import LayerEnum, kcl, show, vcell
 from kfactory import logger
 import klayout.db as kdb
 
+from gdsfactory.lazy_module import make_lazy
 from gdsfactory.cell import cell
 from gdsfactory.path import Path
 from gdsfactory.component import (
@@ -28,51 +30,105 @@ from gdsfactory.config import CONF, PATH
 from gdsfactory.port import Port
 from gdsfactory.read.import_gds import import_gds
 from gdsfactory.cross_section import CrossSection, Section
-from gdsfactory.difftest import difftest, diff
-from gdsfactory.boolean import boolean
 
 from gdsfactory import cross_section
 from gdsfactory import port
-from gdsfactory import components
-from gdsfactory import labels
-from gdsfactory import typings
 from gdsfactory import path
-from gdsfactory import snap
-from gdsfactory import read
-from gdsfactory import add_ports
-from gdsfactory import write_cells
-from gdsfactory import add_pins
-from gdsfactory import technology
-from gdsfactory import routing
-from gdsfactory import export
-from gdsfactory import functions
 
-from gdsfactory.add_padding import (
-    add_padding,
-    add_padding_container,
-    get_padding_points,
-)
-from gdsfactory.pack import pack
-from gdsfactory.pdk import (
-    Pdk,
-    get_component,
-    get_cross_section,
-    get_layer,
-    get_layer_name,
-    get_active_pdk,
-    get_cell,
-    get_constant,
-)
-from gdsfactory.get_factories import get_cells
-from gdsfactory.cross_section import get_cross_sections
-from gdsfactory.grid import grid, grid_with_text
+if TYPE_CHECKING:
+    from gdsfactory import components
+    from gdsfactory import labels
+    from gdsfactory import typings
+    from gdsfactory import snap
+    from gdsfactory import read
+    from gdsfactory import add_ports
+    from gdsfactory import write_cells
+    from gdsfactory import add_pins
+    from gdsfactory import technology
+    from gdsfactory import routing
+    from gdsfactory import export
+    from gdsfactory import functions
+
+    from gdsfactory.add_padding import (
+        add_padding,
+        add_padding_container,
+        get_padding_points,
+    )
+    from gdsfactory.boolean import boolean
+    from gdsfactory.difftest import difftest, diff
+    from gdsfactory.pack import pack
+    from gdsfactory.pdk import (
+        Pdk,
+        get_component,
+        get_cross_section,
+        get_layer,
+        get_layer_name,
+        get_active_pdk,
+        get_cell,
+        get_constant,
+    )
+    from gdsfactory.get_factories import get_cells
+    from gdsfactory.cross_section import get_cross_sections
+    from gdsfactory.grid import grid, grid_with_text
 
-c = components
+    c = components
+
+# submodules and attributes imported on first access, to keep `import gdsfactory` fast
+_lazy_modules = {
+    "add_pins": "gdsfactory.add_pins",
+    "add_ports": "gdsfactory.add_ports",
+    "c": "gdsfactory.components",
+    "components": "gdsfactory.components",
+    "constants": "gdsfactory.constants",
+    "export": "gdsfactory.export",
+    "functions": "gdsfactory.functions",
+    "generic_tech": "gdsfactory.generic_tech",
+    "get_factories": "gdsfactory.get_factories",
+    "labels": "gdsfactory.labels",
+    "pdk": "gdsfactory.pdk",
+    "read": "gdsfactory.read",
+    "routing": "gdsfactory.routing",
+    "samples": "gdsfactory.samples",
+    "schematic": "gdsfactory.schematic",
+    "snap": "gdsfactory.snap",
+    "symbols": "gdsfactory.symbols",
+    "technology": "gdsfactory.technology",
+    "typings": "gdsfactory.typings",
+    "write_cells": "gdsfactory.write_cells",
+}
+_lazy_attributes = {
+    "add_padding": "gdsfactory.add_padding",
+    "add_padding_container": "gdsfactory.add_padding",
+    "boolean": "gdsfactory.boolean",
+    "diff": "gdsfactory.difftest",
+    "difftest": "gdsfactory.difftest",
+    "get_active_pdk": "gdsfactory.pdk",
+    "get_cell": "gdsfactory.pdk",
+    "get_cells": "gdsfactory.get_factories",
+    "get_component": "gdsfactory.pdk",
+    "get_constant": "gdsfactory.pdk",
+    "get_cross_section": "gdsfactory.pdk",
+    "get_cross_sections": "gdsfactory.cross_section",
+    "get_layer": "gdsfactory.pdk",
+    "get_layer_name": "gdsfactory.pdk",
+    "get_padding_points": "gdsfactory.add_padding",
+    "grid": "gdsfactory.grid",
+    "grid_with_text": "gdsfactory.grid",
+    "pack": "gdsfactory.pack",
+    "Pdk": "gdsfactory.pdk",
+}
+make_lazy(__name__)
 
 
 def clear_cache(kcl: kf.KCLayout = kf.kcl) -> None:
     """Clears the whole layout object cache for the default layout."""
+    from gdsfactory.cell import cell_caches
+    from gdsfactory.path import extrusion_cache
+
     kcl.clear_kcells()
+    for cache in cell_caches:
+        cache.clear()
+    extrusion_cache.clear()
 
 
 __all__ = (
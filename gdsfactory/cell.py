@@ -1,12 +1,33 @@
-from collections.abc import Callable, Iterable
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import pathlib
+import tempfile
+import weakref
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    ValuesView,
+)
 from typing import Any, ParamSpec, Protocol, overload
 
+import kfactory as kf
 from cachetools import Cache
+from kfactory import logger
 from kfactory.conf import CHECK_INSTANCES
 from kfactory.kcell import KCell, MetaData
 from kfactory.kcell import cell as _cell
 
 from gdsfactory.component import Component
+from gdsfactory.config import CONF, __version__
 
 ComponentParams = ParamSpec("ComponentParams")
 
@@ -17,6 +38,614 @@ class ComponentFunc(Protocol[ComponentParams]):
     ) -> Component: ...
 
 
+def get_cell_size(cell: KCell) -> int:
+    """Returns the number of shapes of a cell (not including its instances).
+
+    Can be used as `getsizeof` of a CellCache to bound the number of cached shapes.
+    """
+    return sum(
+        cell._kdb_cell.shapes(layer_index).size()
+        for layer_index in cell.kcl.layer_indexes()
+    )
+
+
+def _is_owned(cell: KCell) -> bool:
+    """Returns True if the cell is instantiated by another cell of the layout."""
+    return not cell._destroyed() and cell._kdb_cell.parent_cells() > 0
+
+
+class CellCache(MutableMapping[Hashable, KCell]):
+    """Least recently used cache of the cells of one cell factory.
+
+    When the cache is full, the least recently used cell that is not instantiated
+    by another cell is evicted and deleted from its layout, freeing its memory.
+    Cells instantiated by other cells are only evicted if all cells are, and
+    are kept in the layout.
+
+    Args:
+        maxsize: maximum size of the cache. Defaults to CONF.cell_cache_maxsize.
+        getsizeof: returns the size of a cell. Defaults to 1 for each cell.
+        name: of the factory.
+        delete_evicted: delete evicted cells that are not instantiated from the layout.
+    """
+
+    def __init__(
+        self,
+        maxsize: float | None = None,
+        getsizeof: Callable[[KCell], float] | None = None,
+        name: str | None = None,
+        delete_evicted: bool = True,
+    ) -> None:
+        """Creates an empty cache."""
+        self._maxsize = maxsize
+        self._getsizeof = getsizeof
+        self.name = name
+        self.delete_evicted = delete_evicted
+        self._data: OrderedDict[Hashable, KCell] = OrderedDict()
+        self._sizes: dict[Hashable, float] = {}
+        self.currsize: float = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> float:
+        if self._maxsize is not None:
+            return self._maxsize
+        return CONF.cell_cache_maxsize or math.inf
+
+    def getsizeof(self, cell: KCell) -> float:
+        return self._getsizeof(cell) if self._getsizeof else 1
+
+    def __getitem__(self, key: Hashable) -> KCell:
+        """Returns a cached cell and marks it as recently used."""
+        try:
+            cell = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._data.move_to_end(key)
+        return cell
+
+    def __setitem__(self, key: Hashable, cell: KCell) -> None:
+        """Caches a cell, evicting cells while the cache is full."""
+        size = self.getsizeof(cell)
+        if key in self._data:
+            self.currsize -= self._sizes.pop(key)
+            del self._data[key]
+        while self._data and self.currsize + size > self.maxsize:
+            self.popitem()
+        self._data[key] = cell
+        self._sizes[key] = size
+        self.currsize += size
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Removes a cell from the cache without deleting it."""
+        del self._data[key]
+        self.currsize -= self._sizes.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Returns True if the key is cached, without marking it as used."""
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterates over a snapshot of the keys, least recently used first."""
+        return iter(list(self._data))
+
+    def items(self) -> ItemsView[Hashable, KCell]:
+        """Returns a snapshot of the items, without marking them as used."""
+        return self._data.copy().items()
+
+    def values(self) -> ValuesView[KCell]:
+        """Returns a snapshot of the cells, without marking them as used."""
+        return self._data.copy().values()
+
+    def __len__(self) -> int:
+        """Returns the number of cached cells."""
+        return len(self._data)
+
+    # caches are compared by identity, to register them in cell_caches
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __bool__(self) -> bool:
+        """Returns True, also if empty (kfactory checks `cache or Cache()`)."""
+        return True
+
+    def popitem(self) -> tuple[Hashable, KCell]:
+        """Evicts and returns the least recently used cell, preferring unowned cells."""
+        if not self._data:
+            raise KeyError(f"{type(self).__name__} is empty")
+        key = next(
+            (key for key, cell in self._data.items() if not _is_owned(cell)),
+            next(iter(self._data)),
+        )
+        cell = self._data[key]
+        del self[key]
+        self.evictions += 1
+        if self.delete_evicted and not cell._destroyed() and not _is_owned(cell):
+            cell.delete()
+        return key, cell
+
+    def evict(self) -> int:
+        """Evicts all cells and returns the number of evicted cells."""
+        n = len(self)
+        while self._data:
+            self.popitem()
+        return n
+
+    def clear(self) -> None:
+        """Forgets all cells without deleting them from the layout."""
+        self._data.clear()
+        self._sizes.clear()
+        self.currsize = 0
+
+    def stats(self) -> dict[str, float]:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self),
+            currsize=self.currsize,
+            maxsize=self.maxsize,
+        )
+
+
+cell_caches: weakref.WeakSet[CellCache] = weakref.WeakSet()
+
+
+def _get_caches(factory: str | Callable[..., Any] | None) -> list[CellCache]:
+    if factory is None:
+        return list(cell_caches)
+    name = factory if isinstance(factory, str) else getattr(factory, "__name__", None)
+    return [cache for cache in cell_caches if cache.name == name]
+
+
+def get_cache_stats(
+    factory: str | Callable[..., Any] | None = None,
+) -> dict[str, dict[str, float]]:
+    """Returns hits, misses, evictions and size of the cell cache of each factory.
+
+    Args:
+        factory: name or function of the factory. Defaults to all factories.
+    """
+    stats: dict[str, dict[str, float]] = {}
+    for cache in _get_caches(factory):
+        name = cache.name or ""
+        if name in stats:
+            for key, value in cache.stats().items():
+                stats[name][key] += value
+        else:
+            stats[name] = cache.stats()
+    return stats
+
+
+def evict(factory: str | Callable[..., Any] | None = None) -> int:
+    """Evicts the cached cells of a factory and returns the number of evicted cells.
+
+    Evicted cells that are not instantiated by other cells are deleted from the layout.
+
+    Args:
+        factory: name or function of the factory. Defaults to all factories.
+    """
+    return sum(cache.evict() for cache in _get_caches(factory))
+
+
+def _get_source_hash(func: Callable[..., Any]) -> str:
+    """Returns a hash of the source code of a function."""
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+    return hashlib.sha256(source).hexdigest()
+
+
+def get_disk_cache_key(func: Callable[..., Any], **params: Any) -> str:
+    """Returns the persistent cache key of a cell.
+
+    The key changes with the factory source code, the settings, the active PDK
+    name and version and the gdsfactory version.
+    Changes in the source code of other factories called by the factory are not
+    detected, change the PDK version to invalidate them.
+    """
+    from gdsfactory.pdk import get_active_pdk
+    from gdsfactory.serialization import clean_value_json
+
+    pdk = get_active_pdk()
+    data = dict(
+        function=f"{func.__module__}.{func.__qualname__}",
+        source=_get_source_hash(func),
+        settings=clean_value_json(params),
+        pdk=pdk.name,
+        pdk_version=pdk.version,
+        gdsfactory=__version__,
+    )
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _get_layer_spec(component: KCell, layer: int) -> str | tuple[int, int]:
+    """Returns the PDK layer name of a layer index or (layer, datatype)."""
+    if isinstance(layer, kf.LayerEnum):
+        return layer.name
+    info = component.kcl.get_info(layer)
+    return info.layer, info.datatype
+
+
+def _get_metadata(component: KCell) -> dict[str, Any]:
+    """Returns the name, ports, info and settings of a component as JSON data."""
+    from gdsfactory.serialization import clean_value_json
+
+    ports = [
+        dict(
+            name=port.name,
+            trans=port.trans.to_s() if port._trans else None,
+            dcplx_trans=None if port._trans else port.dcplx_trans.to_s(),
+            width=port.width,
+            layer=_get_layer_spec(component, port.layer),
+            port_type=port.port_type,
+        )
+        for port in component.ports
+    ]
+    bbox = component.dbbox()
+    return dict(
+        name=component.name,
+        function_name=getattr(component, "function_name", None),
+        ports=ports,
+        info=clean_value_json(component.info.model_dump()),
+        settings=clean_value_json(component.settings.model_dump()),
+        dbbox=[bbox.left, bbox.bottom, bbox.right, bbox.top],
+    )
+
+
+def _write_disk_cache(component: KCell, path: pathlib.Path) -> None:
+    """Writes a component to OASIS and its ports and info to a JSON sidecar."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    metadata = _get_metadata(component)
+    # write to temporary files first, so concurrent readers never see partial files
+    suffix = f".{os.getpid()}.tmp"
+    save_options = kf.kcell.save_layout_options()
+    save_options.format = "OASIS"
+    component.write(str(path) + suffix, save_options)
+    path.with_suffix(".json" + suffix).write_text(json.dumps(metadata))
+    os.replace(str(path) + suffix, path)
+    os.replace(path.with_suffix(".json" + suffix), path.with_suffix(".json"))
+
+
+def _read_disk_cache(path: pathlib.Path) -> Component:
+    """Reads a component written by _write_disk_cache.
+
+    Child cells that already exist in the layout with the same name are reused.
+    """
+    return _read_component(path, json.loads(path.with_suffix(".json").read_text()))
+
+
+def _create_ports(ports: kf.Ports, metadata: dict[str, Any]) -> None:
+    """Adds the ports of the JSON metadata of a component."""
+    from gdsfactory.pdk import get_layer
+
+    for port in metadata["ports"]:
+        if port["trans"]:
+            trans = dict(trans=kf.kdb.Trans.from_s(port["trans"]))
+        else:
+            trans = dict(dcplx_trans=kf.kdb.DCplxTrans.from_s(port["dcplx_trans"]))
+        ports.create_port(
+            name=port["name"],
+            width=port["width"],
+            layer=get_layer(
+                port["layer"]
+                if isinstance(port["layer"], str)
+                else tuple(port["layer"])
+            ),
+            port_type=port["port_type"],
+            **trans,
+        )
+
+
+def _read_component(path: pathlib.Path, metadata: dict[str, Any]) -> Component:
+    c = Component()
+    options = kf.kcell.load_layout_options()
+    options.cell_conflict_resolution = (
+        kf.kdb.LoadLayoutOptions.CellConflictResolution.SkipNewCell
+    )
+    for cell_index in c._kdb_cell.read(str(path), options):
+        child = c.kcl[cell_index]
+        child.rebuild()
+        child.get_meta_data()
+    c.rebuild()
+    _create_ports(c.ports, metadata)
+    c.info.update(metadata["info"])
+    c._settings = kf.kcell.KCellSettings(**metadata["settings"])
+    if metadata.get("function_name"):
+        c.function_name = metadata["function_name"]
+    return c
+
+
+def component_to_bytes(component: KCell) -> tuple[bytes, dict[str, Any]]:
+    """Returns the OASIS bytes and the JSON metadata of a component.
+
+    Used to send components built in other processes back to the main process.
+    """
+    with tempfile.TemporaryDirectory() as dirpath:
+        path = pathlib.Path(dirpath) / "component.oas"
+        _write_disk_cache(component, path)
+        return path.read_bytes(), json.loads(path.with_suffix(".json").read_text())
+
+
+# names of the cells merged by component_from_bytes that are not yet
+# in the cache of their factory
+_merged_cells: set[str] = set()
+
+
+def component_from_bytes(data: bytes, metadata: dict[str, Any]) -> Component:
+    """Returns the component serialized by component_to_bytes.
+
+    The component keeps its original name. If a cell with that name
+    already exists it is returned instead, and existing child cells are reused.
+    The factories of the merged cells return them instead of building
+    cells with the same names.
+    """
+    if kf.kcl.layout.cell(metadata["name"]) is not None:
+        return kf.kcl[metadata["name"]]
+
+    with tempfile.TemporaryDirectory() as dirpath:
+        path = pathlib.Path(dirpath) / "component.oas"
+        path.write_bytes(data)
+        c = _read_component(path, metadata)
+    c.name = metadata["name"]
+    c._locked = True
+    _merged_cells.add(c.name)
+    _merged_cells.update(kf.kcl[i].name for i in c.called_cells())
+    return c
+
+
+def _get_disk_cache_path(
+    func: Callable[..., Any], **params: Any
+) -> pathlib.Path | None:
+    """Returns the OASIS path of a cell in CONF.cell_disk_cache_dir.
+
+    Returns None if there is no disk cache or the settings can not be hashed.
+    """
+    if not CONF.cell_disk_cache_dir:
+        return None
+
+    try:
+        key = get_disk_cache_key(func, **params)
+    except Exception as e:
+        logger.debug(f"Not caching {func.__name__} on disk: {e}")
+        return None
+    return pathlib.Path(CONF.cell_disk_cache_dir) / key[:2] / f"{key}.oas"
+
+
+def _with_disk_cache(
+    func: ComponentFunc[ComponentParams],
+) -> ComponentFunc[ComponentParams]:
+    """Returns func that reads and writes its cells to CONF.cell_disk_cache_dir."""
+
+    @functools.wraps(func)
+    def wrapper(**params: Any) -> Component:
+        path = _get_disk_cache_path(func, **params)
+        if path is None:
+            return func(**params)
+
+        if path.exists() and path.with_suffix(".json").exists():
+            logger.debug(f"Loading {func.__name__} from disk cache {path}")
+            return _read_disk_cache(path)
+
+        component = func(**params)
+        try:
+            _write_disk_cache(component, path)
+        except Exception as e:
+            logger.debug(f"Not caching {func.__name__} on disk: {e}")
+        return component
+
+    return wrapper
+
+
+class LazyComponent:
+    """Footprint of a cell that only builds the cell when needed.
+
+    Returned by factories decorated with `gf.cell(lazy=True)` when the cell is in
+    the disk cache. The name, bbox, ports, info and settings are read from the JSON
+    sidecar, so floorplanning (for example `gf.pack`) does not build the cell.
+    Any other attribute (shapes, instances, write_gds ...) builds the cell
+    and is forwarded to it.
+
+    Args:
+        factory: returns the cell.
+        metadata: JSON sidecar of the cell in the disk cache.
+    """
+
+    def __init__(
+        self, factory: Callable[[], Component], metadata: dict[str, Any]
+    ) -> None:
+        """Creates the footprint of a cell."""
+        self._factory = factory
+        self._metadata = metadata
+        self._component: Component | None = None
+        self._ports: kf.Ports | None = None
+
+    def build(self) -> Component:
+        """Returns the cell, building it on first use."""
+        if self._component is None:
+            self._component = self._factory()
+        return self._component
+
+    @property
+    def is_built(self) -> bool:
+        return self._component is not None
+
+    @property
+    def name(self) -> str:
+        return self._metadata["name"]
+
+    @property
+    def function_name(self) -> str | None:
+        return self._metadata.get("function_name")
+
+    @property
+    def settings(self) -> kf.kcell.KCellSettings:
+        return kf.kcell.KCellSettings(**self._metadata["settings"])
+
+    @property
+    def info(self) -> kf.kcell.Info:
+        return kf.kcell.Info(**self._metadata["info"])
+
+    @property
+    def ports(self) -> kf.Ports:
+        if self._component is not None:
+            return self._component.ports
+        if self._ports is None:
+            self._ports = kf.Ports(kf.kcl)
+            _create_ports(self._ports, self._metadata)
+        return self._ports
+
+    def dbbox(self) -> kf.kdb.DBox:
+        return kf.kdb.DBox(*self._metadata["dbbox"])
+
+    def bbox(self) -> kf.kdb.Box:
+        return self.dbbox().to_itype(kf.kcl.dbu)
+
+    @property
+    def dxmin(self) -> float:
+        return self.dbbox().left
+
+    @property
+    def dymin(self) -> float:
+        return self.dbbox().bottom
+
+    @property
+    def dxmax(self) -> float:
+        return self.dbbox().right
+
+    @property
+    def dymax(self) -> float:
+        return self.dbbox().top
+
+    @property
+    def dxsize(self) -> float:
+        return self.dbbox().width()
+
+    @property
+    def dysize(self) -> float:
+        return self.dbbox().height()
+
+    def __getattr__(self, name: str) -> Any:
+        """Builds the cell and returns its attribute."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.build(), name)
+
+    def __repr__(self) -> str:
+        """Returns the name and whether the cell is built."""
+        return f"LazyComponent({self.name!r}, built={self.is_built})"
+
+
+def _with_lazy(
+    cell_func: ComponentFunc[ComponentParams],
+    func: Callable[..., Any],
+    basename: str | None = None,
+    drop_params: tuple[str, ...] = ("self", "cls"),
+) -> ComponentFunc[ComponentParams]:
+    """Returns cell_func that returns a LazyComponent for cells in the disk cache."""
+    from kfactory.kcell import get_cell_name
+
+    from gdsfactory.serialization import clean_value_json
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(cell_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Component | LazyComponent:
+        # same parameters that the cell decorator passes to the disk cache
+        params = {p.name: p.default for p in signature.parameters.values()}
+        params.update(zip(signature.parameters, args))
+        params.update(kwargs)
+        params = {
+            key: value
+            for key, value in params.items()
+            if value is not inspect.Parameter.empty
+        }
+
+        path = _get_disk_cache_path(func, **params)
+        if path is None or not path.with_suffix(".json").exists():
+            return cell_func(*args, **kwargs)
+
+        # the sidecar has the cell returned by func, before the cell decorator
+        # names it and sets its settings
+        name = get_cell_name(basename or func.__name__, **params)
+        metadata = json.loads(path.with_suffix(".json").read_text())
+        if "dbbox" not in metadata or kf.kcl.layout.cell(name):
+            return cell_func(*args, **kwargs)
+
+        settings = {k: v for k, v in params.items() if k not in drop_params}
+        metadata |= dict(
+            name=name,
+            function_name=func.__name__,
+            settings=clean_value_json(settings),
+        )
+        return LazyComponent(functools.partial(cell_func, *args, **kwargs), metadata)
+
+    return wrapper
+
+
+def _with_merged_cells(
+    cell_func: ComponentFunc[ComponentParams],
+    func: Callable[..., Any],
+    cache: Cache[Any, Any] | dict[Any, Any],
+    basename: str | None = None,
+) -> ComponentFunc[ComponentParams]:
+    """Returns cell_func that caches the merged cell with the same name first."""
+    from cachetools.keys import hashkey
+    from kfactory.kcell import (
+        get_cell_name,
+        rec_dict_to_frozenset,
+        rec_frozenset_to_dict,
+    )
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(cell_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Component:
+        if _merged_cells:
+            # same parameters, cache key and name as the cell decorator
+            params = {p.name: p.default for p in signature.parameters.values()}
+            params.update(zip(signature.parameters, args))
+            params.update(kwargs)
+            params = {
+                key: rec_dict_to_frozenset(value) if isinstance(value, dict) else value
+                for key, value in params.items()
+                if value is not inspect.Parameter.empty
+            }
+            name = get_cell_name(
+                basename or func.__name__,
+                **{
+                    key: rec_frozenset_to_dict(value)
+                    if isinstance(value, frozenset)
+                    else value
+                    for key, value in params.items()
+                },
+            )
+            if name in _merged_cells:
+                _merged_cells.discard(name)
+                key = hashkey(**params)
+                kdb_cell = kf.kcl.layout.cell(name)
+                if kdb_cell is not None and key not in cache:
+                    cache[key] = kf.kcl[kdb_cell.cell_index()]
+        return cell_func(*args, **kwargs)
+
+    return wrapper
+
+
+def _get_function_name(func: Callable[..., Any]) -> str | None:
+    if hasattr(func, "__name__"):
+        return func.__name__
+    if hasattr(func, "func"):
+        return func.func.__name__
+    return None
+
+
 @overload
 def cell(
     _func: ComponentFunc[ComponentParams],
@@ -39,6 +668,9 @@ def cell(
     layout_cache: bool | None = None,
     info: dict[str, MetaData] | None = None,
     post_process: Iterable[Callable[[KCell], None]] | None = None,
+    maxsize: float | None = None,
+    disk_cache: bool = True,
+    lazy: bool = False,
 ) -> Callable[[ComponentFunc[ComponentParams]], ComponentFunc[ComponentParams]]: ...
 
 
@@ -60,26 +692,82 @@ def cell(
     layout_cache: bool | None = None,
     info: dict[str, MetaData] | None = None,
     post_process: Iterable[Callable[[KCell], None]] | None = None,
+    maxsize: float | None = None,
+    disk_cache: bool = True,
+    lazy: bool = False,
 ) -> (
     ComponentFunc[ComponentParams]
     | Callable[[ComponentFunc[ComponentParams]], ComponentFunc[ComponentParams]]
 ):
+    """Decorator to cache and auto name the cell.
+
+    Unless a cache is given, the cells are cached in a CellCache,
+    see get_cache_stats and evict.
+    If CONF.cell_disk_cache_dir is set, cells missing in the CellCache are
+    read from (or written to) that directory before calling the factory.
+
+    Args:
+        set_settings: copy the args & kwargs into the settings dictionary.
+        set_name: auto create the name of the cell from the function name and args.
+        check_ports: check uniqueness of port names.
+        check_instances: check for complex (off-grid or non-90°) instances.
+        snap_ports: snap the centers of the ports onto the grid.
+        add_port_layers: add the netlist layers of the ports.
+        cache: cache to use instead of a CellCache.
+        basename: overwrite the name inferred from the function name.
+        drop_params: parameters not written to the settings.
+        register_factory: register the function in the factories of the layout.
+        overwrite_existing: delete other cells with the same name.
+        layout_cache: reuse cells of the layout with the same name.
+        info: additional metadata to put into info.
+        post_process: functions to call after the cell has been created.
+        maxsize: maximum number of cached cells. Defaults to CONF.cell_cache_maxsize.
+        disk_cache: if False, never caches the cells of this factory on disk.
+        lazy: returns a LazyComponent for cells in the disk cache,
+            which only builds the cell when more than its footprint is needed.
+    """
     if post_process is None:
         post_process = []
-    return _cell(  # type: ignore
-        _func,
-        set_settings=set_settings,
-        set_name=set_name,
-        check_ports=check_ports,
-        check_instances=check_instances,
-        snap_ports=snap_ports,
-        add_port_layers=add_port_layers,
-        cache=cache,
-        basename=basename,
-        drop_params=list(drop_params),
-        register_factory=register_factory,
-        overwrite_existing=overwrite_existing,
-        layout_cache=layout_cache,
-        info=info,
-        post_process=post_process,
-    )
+
+    def decorator(
+        func: ComponentFunc[ComponentParams],
+    ) -> ComponentFunc[ComponentParams]:
+        _cache = cache
+        if _cache is None:
+            _cache = CellCache(
+                maxsize=maxsize, name=basename or _get_function_name(func)
+            )
+            cell_caches.add(_cache)
+
+        original_func = func
+        if disk_cache and hasattr(func, "__name__"):
+            func = _with_disk_cache(func)
+
+        cell_func = _cell(  # type: ignore
+            func,
+            set_settings=set_settings,
+            set_name=set_name,
+            check_ports=check_ports,
+            check_instances=check_instances,
+            snap_ports=snap_ports,
+            add_port_layers=add_port_layers,
+            cache=_cache,
+            basename=basename,
+            drop_params=list(drop_params),
+            register_factory=register_factory,
+            overwrite_existing=overwrite_existing,
+            layout_cache=layout_cache,
+            info=info,
+            post_process=post_process,
+        )
+        if set_name and hasattr(original_func, "__name__"):
+            cell_func = _with_merged_cells(
+                cell_func, original_func, _cache, basename=basename
+            )
+        if lazy and set_name and disk_cache and hasattr(original_func, "__name__"):
+            return _with_lazy(
+                cell_func, original_func, basename=basename, drop_params=drop_params
+            )
+        return cell_func
+
+    return decorator if _func is None else decorator(_func)
@@ -11,7 +11,7 @@ from rich import print as pprint
 
 from gdsfactory import show as _show
 from gdsfactory.config import print_version_plugins
-from gdsfactory.difftest import diff
+from gdsfactory.difftest import diff, diff_batch
 from gdsfactory.install import install_gdsdiff, install_klayout_package
 from gdsfactory.read.from_updk import from_updk
 from gdsfactory.watch import watch as _watch
@@ -74,11 +74,17 @@ def merge_gds(dirpath: str = "", gdspath: str = "") -> None:
 def watch(
     path: str = str(pathlib.Path.cwd()),
     pdk: str = typer.Option(None, "--pdk", "-pdk", help="PDK name"),
+    debounce: float = typer.Option(
+        0.3, "--debounce", help="Seconds without changes before rebuilding a file"
+    ),
+    max_workers: int = typer.Option(
+        1, "--max-workers", help="Processes building cells (0: build in a thread)"
+    ),
 ) -> None:
     """Filewatch a folder for changes in *.py or *.pic.yml files."""
     path = pathlib.Path(path)
     path = path.parent if path.is_dir() else path
-    _watch(str(path), pdk=pdk)
+    _watch(str(path), pdk=pdk, debounce=debounce, max_workers=max_workers)
 
 
 @app.command()
@@ -93,6 +99,35 @@ def gds_diff(gdspath1: str, gdspath2: str, xor: bool = False) -> None:
     diff(gdspath1, gdspath2, xor=xor)
 
 
+@app.command()
+def gds_diff_batch(
+    dirpath_ref: str,
+    dirpath_run: str,
+    xor: bool = True,
+    report: str = "",
+    manifest: str = "",
+    workers: int = 0,
+    update_ref: bool = False,
+) -> None:
+    """Compare all GDS files in dirpath_run with the ones in dirpath_ref in parallel."""
+    run_files = sorted(pathlib.Path(dirpath_run).glob("*.gds"))
+    diff_report = diff_batch(
+        run_files=run_files,
+        dirpath_ref=dirpath_ref,
+        xor=xor,
+        manifest=manifest or None,
+        report=report or None,
+        max_workers=workers or None,
+        update_ref=update_ref,
+    )
+    pprint(diff_report["summary"])
+    if not update_ref and any(
+        cell["status"] in {"changed", "error", "new"}
+        for cell in diff_report["cells"].values()
+    ):
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def install_klayout_genericpdk() -> None:
     """Install Klayout generic PDK."""
@@ -15,7 +15,11 @@ from kfactory import Instance, kdb, logger
 from kfactory.kcell import cell, save_layout_options
 
 from gdsfactory.config import GDSDIR_TEMP
-from gdsfactory.functions import get_polygons, get_polygons_points
+from gdsfactory.functions import (
+    get_polygons,
+    get_polygons_arrays,
+    get_polygons_points,
+)
 from gdsfactory.port import pprint_ports, select_ports, to_dict
 from gdsfactory.serialization import clean_value_json
 
@@ -25,6 +29,7 @@ if TYPE_CHECKING:
         CrossSectionSpec,
         Layer,
         LayerSpec,
+        LayerSpecs,
         LayerStack,
         LayerViews,
         PathType,
@@ -660,6 +665,25 @@ class ComponentBase:
         """
         return get_polygons_points(self, merge=merge, scale=scale, by=by)
 
+    def get_polygons_arrays(
+        self,
+        merge: bool = False,
+        scale: float | None = None,
+        by: Literal["index"] | Literal["name"] | Literal["tuple"] = "index",
+        layers: LayerSpecs | None = None,
+    ) -> dict[int | str | tuple[int, int], tuple[np.ndarray, np.ndarray]]:
+        """Returns a dict with (points, offsets) arrays per layer.
+
+        Polygon i of a layer is ``points[offsets[i]:offsets[i + 1]]``.
+
+        Args:
+            merge: if True, merges the polygons.
+            scale: if True, scales the points.
+            by: the format of the resulting keys in the dictionary ('index', 'name', 'tuple')
+            layers: optional layers to extract. Defaults to all layers with shapes.
+        """
+        return get_polygons_arrays(self, merge=merge, scale=scale, by=by, layers=layers)
+
     def get_labels(
         self, layer: LayerSpec, recursive: bool = True
     ) -> list[kf.kdb.DText]:
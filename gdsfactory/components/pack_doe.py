@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import itertools as it
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any
 
 import gdsfactory as gf
 from gdsfactory.component import Component
-from gdsfactory.grid import grid, grid_with_text
 from gdsfactory.pack import pack
 from gdsfactory.typings import CellSpec, ComponentSpec
 
@@ -13,38 +15,80 @@ _doe = "mmi1x2"
 _settings = dict(length_mmi=(2.5, 100), width_mmi=(4, 10))
 
 
+def _build_doe(
+    settings: dict[str, Any], doe: ComponentSpec, function: CellSpec | None = None
+) -> Component:
+    component = gf.get_component(doe, **settings)
+    if function:
+        function = gf.get_cell(function)
+        if not callable(function):
+            raise ValueError(f"Error {function!r} needs to be callable.")
+        component = function(component)
+    return component
+
+
+def _build_doe_bytes(
+    settings: dict[str, Any], doe: ComponentSpec, function: CellSpec | None = None
+) -> tuple[bytes, dict[str, Any]]:
+    from gdsfactory.cell import component_to_bytes
+
+    return component_to_bytes(_build_doe(settings, doe=doe, function=function))
+
+
 def generate_doe(
     doe: ComponentSpec,
     settings: dict[str, list[Any]],
     do_permutations: bool = False,
     function: CellSpec | None = None,
+    max_workers: int | None = 1,
+    progress: Callable[[int, int], Any] | None = None,
 ) -> tuple[tuple[Component, ...], tuple[dict, ...]]:
     """Generates a component DOE (Design of Experiment).
 
     which can then be packed, or used elsewhere.
 
+    With max_workers > 1 the components are built in worker processes and
+    sent back as OASIS bytes, then merged into the layout with the same names
+    and in the same order as a serial build.
+    Worker processes need the same active PDK (inherited when processes are forked).
+    Later calls of the factories return the merged cells instead of building them.
+
     Args:
         doe: function to return Components.
         settings: component settings.
         do_permutations: for each setting.
         function: for the component (add padding, grating couplers ...)
+        max_workers: number of processes to build the components.
+            None defaults to the number of cores.
+        progress: called with (number of built components, total) after each build.
     """
+    from gdsfactory.cell import component_from_bytes
+    from gdsfactory.config import get_number_of_cores
+
     if do_permutations:
         settings_list = [dict(zip(settings, t)) for t in it.product(*settings.values())]
     else:
         settings_list = [dict(zip(settings, t)) for t in zip(*settings.values())]
 
-    if function:
-        function = gf.get_cell(function)
-        if not callable(function):
-            raise ValueError(f"Error {function!r} needs to be callable.")
-        component_list = [
-            function(gf.get_component(doe, **settings)) for settings in settings_list
-        ]
+    total = len(settings_list)
+    max_workers = min(max_workers or get_number_of_cores(), total)
+    component_list = []
+
+    if max_workers <= 1:
+        for settings in settings_list:
+            component_list.append(_build_doe(settings, doe=doe, function=function))
+            if progress:
+                progress(len(component_list), total)
     else:
-        component_list = [
-            gf.get_component(doe, **settings) for settings in settings_list
-        ]
+        build = partial(_build_doe_bytes, doe=doe, function=function)
+        chunksize = max(total // (4 * max_workers), 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for data, metadata in executor.map(
+                build, settings_list, chunksize=chunksize
+            ):
+                component_list.append(component_from_bytes(data, metadata))
+                if progress:
+                    progress(len(component_list), total)
 
     component_list = tuple(component_list)
     settings_list = tuple(settings_list)
@@ -56,6 +100,8 @@ def pack_doe(
     settings: dict[str, tuple[Any, ...]] = _settings,
     do_permutations: bool = False,
     function: CellSpec | None = None,
+    max_workers: int | None = 1,
+    progress: Callable[[int, int], Any] | None = None,
     **kwargs,
 ) -> Component:
     """Packs a component DOE (Design of Experiment) using pack.
@@ -65,6 +111,8 @@ def pack_doe(
         settings: component settings.
         do_permutations: for each setting.
         function: to apply (add padding, grating couplers).
+        max_workers: number of processes to build the components.
+        progress: called with (number of built components, total) after each build.
         kwargs: for pack.
 
     Keyword Args:
@@ -85,7 +133,12 @@ def pack_doe(
         v_mirror: vertical mirror using x axis (1, y) (0, y).
     """
     component_list, settings_list = generate_doe(
-        doe, settings, do_permutations, function
+        doe,
+        settings,
+        do_permutations,
+        function,
+        max_workers=max_workers,
+        progress=progress,
     )
 
     c = pack(component_list, **kwargs)
@@ -106,6 +159,8 @@ def pack_doe_grid(
     do_permutations: bool = False,
     function: CellSpec | None = None,
     with_text: bool = False,
+    max_workers: int | None = 1,
+    progress: Callable[[int, int], Any] | None = None,
     **kwargs,
 ) -> Component:
     """Packs a component DOE (Design of Experiment) using grid.
@@ -116,6 +171,8 @@ def pack_doe_grid(
         do_permutations: for each setting.
         function: to apply to component (add padding, grating couplers).
         with_text: includes text label.
+        max_workers: number of processes to build the components.
+        progress: called with (number of built components, total) after each build.
         kwargs: for grid.
 
     Keyword Args:
@@ -133,25 +190,17 @@ def pack_doe_grid(
         h_mirror: horizontal mirror y axis (x, 1) (1, 0). most common mirror.
         v_mirror: vertical mirror using x axis (1, y) (0, y).
     """
-    if do_permutations:
-        settings_list = [dict(zip(settings, t)) for t in it.product(*settings.values())]
-    else:
-        settings_list = [dict(zip(settings, t)) for t in zip(*settings.values())]
-
-    if function:
-        function = gf.get_cell(function)
-        if not callable(function):
-            raise ValueError(f"Error {function!r} needs to be callable.")
-        component_list = [
-            function(gf.get_component(doe, **settings)) for settings in settings_list
-        ]
-    else:
-        component_list = [
-            gf.get_component(doe, **settings) for settings in settings_list
-        ]
+    component_list, settings_list = generate_doe(
+        doe,
+        settings,
+        do_permutations,
+        function,
+        max_workers=max_workers,
+        progress=progress,
+    )
 
-    component_list = tuple(component_list)
-    settings_list = tuple(settings_list)
+    # gdsfactory.grid imports gdsfactory.components
+    from gdsfactory.grid import grid, grid_with_text
 
     if with_text:
         c = grid_with_text(component_list, **kwargs)
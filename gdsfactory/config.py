@@ -101,6 +101,10 @@ CONF.layer_error_path = (1000, 0)
 CONF.connect_use_mirror = False
 CONF.max_cellname_length = 32
 CONF.pdk = "generic"
+CONF.cell_cache_maxsize = None  # max cells cached per @gf.cell factory (None: no limit)
+CONF.cell_disk_cache_dir = None  # persistent @gf.cell cache directory (None: disabled)
+CONF.extrude_cache_maxsize = 256  # max paths memoized by gf.path.extrude (0: off)
+CONF.technology_cache_dir = home_path / "technology"  # LayerViews snapshots (None: off)
 
 
 class Paths:
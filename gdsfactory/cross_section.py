@@ -221,6 +221,8 @@ class CrossSection(BaseModel):
 
     model_config = ConfigDict(extra="forbid", frozen=True)
     _name = PrivateAttr("")
+    _hash_name = PrivateAttr("")
+    _hash = PrivateAttr(None)
 
     def validate_radius(
         self, radius: float, error_type: ErrorType | None = None
@@ -242,11 +244,41 @@ class CrossSection(BaseModel):
 
     @property
     def name(self) -> str:
-        if not self._name:
+        # private attributes are read from the dict as pydantic's getattr is slow
+        private = self.__pydantic_private__
+        if private["_name"]:
+            return private["_name"]
+        if not private["_hash_name"]:
             h = hashlib.md5(str(self).encode()).hexdigest()[:8]
-            return f"xs_{h}"
-        else:
-            return self._name
+            private["_hash_name"] = f"xs_{h}"
+        return private["_hash_name"]
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the fields and the name, ignoring the cached name and hash."""
+        if not isinstance(other, CrossSection):
+            return NotImplemented
+        return (
+            self.__class__ is other.__class__
+            and self.__pydantic_private__["_name"]
+            == other.__pydantic_private__["_name"]
+            and self.__dict__ == other.__dict__
+        )
+
+    def __hash__(self) -> int:
+        """Returns the hash of the fields, computed once."""
+        private = self.__pydantic_private__
+        if private["_hash"] is None:
+            private["_hash"] = hash((self.__class__, *self.__dict__.values()))
+        return private["_hash"]
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> CrossSection:
+        """Returns a copy of the cross_section, without the cached name and hash."""
+        xs = super().model_copy(update=update, deep=deep)
+        if update:
+            xs.__pydantic_private__.update(_hash_name="", _hash=None)
+        return xs
 
     @property
     def width(self) -> float:
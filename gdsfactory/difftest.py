@@ -1,14 +1,20 @@
 """GDS regression test. Inspired by lytest."""
 
 import filecmp
+import hashlib
+import json
 import pathlib
 import shutil
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
 
 from kfactory import KCell, KCLayout, kdb, logger
 
 import gdsfactory as gf
 from gdsfactory.component import Component
-from gdsfactory.config import CONF, PATH
+from gdsfactory.config import CONF, PATH, get_number_of_cores
 from gdsfactory.name import clean_name, get_name_short
 
 
@@ -230,18 +236,12 @@ def difftest(
         ignore_sliver_differences: if True, ignores any sliver differences in the XOR result.
             If None (default), defers to the value set in CONF.difftest_ignore_sliver_differences
     """
-    test_name = test_name or (
-        f"{component.function_name}_{component.name}"
-        if hasattr(component, "function_name")
-        and component.name != component.function_name
-        else f"{component.name}"
-    )
-    filename = f"{test_name}.gds"
+    test_name = test_name or _get_test_name(component)
     dirpath_ref = dirpath
     dirpath_ref.mkdir(exist_ok=True, parents=True)
     dirpath_run.mkdir(exist_ok=True, parents=True)
 
-    filename = get_name_short(clean_name(test_name), max_cellname_length=32)
+    filename = _get_filename(test_name)
 
     ref_file = dirpath_ref / f"{filename}.gds"
     run_file = dirpath_run / f"{filename}.gds"
@@ -281,6 +281,212 @@ def difftest(
             ) from exc
 
 
+def _get_test_name(component: Component) -> str:
+    return (
+        f"{component.function_name}_{component.name}"
+        if hasattr(component, "function_name")
+        and component.name != component.function_name
+        else f"{component.name}"
+    )
+
+
+def _get_filename(test_name: str) -> str:
+    return get_name_short(clean_name(test_name), max_cellname_length=32)
+
+
+def get_file_hash(filepath: PathType) -> str:
+    """Returns the sha256 hash of a file content."""
+    return hashlib.sha256(pathlib.Path(filepath).read_bytes()).hexdigest()
+
+
+def _diff_worker(
+    ref_file: PathType,
+    run_file: PathType,
+    xor: bool,
+    test_name: str,
+    ignore_sliver_differences: bool | None,
+) -> bool:
+    return diff(
+        ref_file=ref_file,
+        run_file=run_file,
+        xor=xor,
+        test_name=test_name,
+        ignore_sliver_differences=ignore_sliver_differences,
+        show=False,
+    )
+
+
+def diff_batch(
+    run_files: Sequence[PathType],
+    dirpath_ref: PathType = PATH.gds_ref,
+    xor: bool = True,
+    ignore_sliver_differences: bool | None = None,
+    manifest: PathType | None = None,
+    report: PathType | None = None,
+    max_workers: int | None = None,
+    update_ref: bool = False,
+) -> dict[str, Any]:
+    """Compares many GDS files against their references, running XORs in parallel.
+
+    Each run file is compared with the file of the same name in dirpath_ref.
+    Files with the same content hash as their reference, or with the same
+    (reference, run) hashes stored in the manifest from a previous passing run,
+    are not XORed again.
+
+    Args:
+        run_files: GDS files to check.
+        dirpath_ref: directory where reference files are stored.
+        xor: runs XOR on every layer between ref and run files.
+        ignore_sliver_differences: if True, ignores any sliver differences in the XOR result.
+            If None (default), defers to the value set in CONF.difftest_ignore_sliver_differences
+        manifest: optional JSON file with the hashes of passing files. Read and updated.
+        report: optional JSON file to write the report to.
+        max_workers: number of worker processes. Defaults to the number of cores.
+            1 runs the XORs in the current process.
+        update_ref: if True, overwrites references of changed files and stores new ones.
+
+    Returns:
+        report dict with the status of each file (keyed by file stem) and a summary.
+            status is one of: new, identical, skipped, equivalent, changed, error.
+    """
+    dirpath_ref = pathlib.Path(dirpath_ref)
+    dirpath_ref.mkdir(exist_ok=True, parents=True)
+
+    manifest_path = pathlib.Path(manifest) if manifest else None
+    hashes: dict[str, dict[str, str]] = {}
+    if manifest_path and manifest_path.exists():
+        hashes = json.loads(manifest_path.read_text())
+
+    cells: dict[str, dict[str, Any]] = {}
+    to_diff: list[tuple[str, pathlib.Path, pathlib.Path]] = []
+
+    for run_file in run_files:
+        run_file = pathlib.Path(run_file)
+        name = run_file.stem
+        ref_file = dirpath_ref / run_file.name
+        run_hash = get_file_hash(run_file)
+        cells[name] = dict(ref_file=str(ref_file), run_file=str(run_file))
+
+        if not ref_file.exists():
+            cells[name]["status"] = "new"
+            if update_ref:
+                shutil.copy(run_file, ref_file)
+                hashes[name] = dict(ref=run_hash, run=run_hash)
+            continue
+
+        ref_hash = get_file_hash(ref_file)
+        if ref_hash == run_hash:
+            cells[name]["status"] = "identical"
+        elif hashes.get(name) == dict(ref=ref_hash, run=run_hash):
+            cells[name]["status"] = "skipped"
+        else:
+            to_diff.append((name, ref_file, run_file))
+            continue
+        hashes[name] = dict(ref=ref_hash, run=run_hash)
+
+    def _record(name: str, ref_file: pathlib.Path, run_file: pathlib.Path, func):
+        try:
+            is_different = func()
+        except Exception as exc:
+            cells[name].update(status="error", message=str(exc))
+            hashes.pop(name, None)
+            return
+
+        if not is_different:
+            cells[name]["status"] = "equivalent"
+            hashes[name] = dict(
+                ref=get_file_hash(ref_file), run=get_file_hash(run_file)
+            )
+            return
+
+        cells[name]["status"] = "changed"
+        hashes.pop(name, None)
+        if update_ref:
+            logger.info(f"overwriting {str(ref_file)!r}")
+            shutil.copy(run_file, ref_file)
+            run_hash = get_file_hash(run_file)
+            hashes[name] = dict(ref=run_hash, run=run_hash)
+
+    max_workers = max_workers or get_number_of_cores()
+
+    if max_workers == 1 or len(to_diff) <= 1:
+        for name, ref_file, run_file in to_diff:
+            _record(
+                name,
+                ref_file,
+                run_file,
+                partial(
+                    _diff_worker,
+                    ref_file,
+                    run_file,
+                    xor,
+                    name,
+                    ignore_sliver_differences,
+                ),
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    _diff_worker,
+                    ref_file,
+                    run_file,
+                    xor,
+                    name,
+                    ignore_sliver_differences,
+                )
+                for name, ref_file, run_file in to_diff
+            }
+            for name, ref_file, run_file in to_diff:
+                _record(name, ref_file, run_file, futures[name].result)
+
+    summary: dict[str, int] = {}
+    for cell in cells.values():
+        summary[cell["status"]] = summary.get(cell["status"], 0) + 1
+
+    diff_report = dict(cells=cells, summary=summary)
+
+    if manifest_path:
+        manifest_path.parent.mkdir(exist_ok=True, parents=True)
+        manifest_path.write_text(json.dumps(hashes, indent=2, sort_keys=True))
+    if report:
+        report = pathlib.Path(report)
+        report.parent.mkdir(exist_ok=True, parents=True)
+        report.write_text(json.dumps(diff_report, indent=2))
+    return diff_report
+
+
+def difftest_batch(
+    components: Sequence[gf.Component],
+    test_names: Sequence[str] | None = None,
+    dirpath: pathlib.Path = PATH.gds_ref,
+    dirpath_run: pathlib.Path = PATH.gds_run,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Writes components and checks them against their GDS references with diff_batch.
+
+    Unlike difftest it never prompts or raises on differences,
+    check the returned report instead.
+
+    Args:
+        components: to test if they have changed.
+        test_names: used to store the GDS files. Defaults to the component names.
+        dirpath: directory where reference files are stored.
+        dirpath_run: directory to store gds files generated by the test.
+        kwargs: keyword arguments passed to diff_batch.
+    """
+    dirpath_run.mkdir(exist_ok=True, parents=True)
+    test_names = test_names or [None] * len(components)
+
+    run_files = []
+    for component, test_name in zip(components, test_names):
+        component = gf.get_component(component)
+        filename = _get_filename(test_name or _get_test_name(component))
+        run_files.append(component.write_gds(gdspath=dirpath_run / f"{filename}.gds"))
+
+    return diff_batch(run_files=run_files, dirpath_ref=dirpath, **kwargs)
+
+
 def overwrite(ref_file, run_file):
     val = input("Save current GDS as the new reference (Y)? [Y/n]")
     if val.upper().startswith("N"):
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import shapely
-
 from gdsfactory.component import Component
 from gdsfactory.technology import DerivedLayer, LayerStack, LayerViews, LogicalLayer
 from gdsfactory.typings import LayerSpec
@@ -12,6 +10,7 @@ def to_3d(
     layer_views: LayerViews | None = None,
     layer_stack: LayerStack | None = None,
     exclude_layers: tuple[LayerSpec, ...] | None = None,
+    max_workers: int | None = 1,
 ):
     """Return Component 3D trimesh Scene.
 
@@ -22,8 +21,11 @@ def to_3d(
         layer_stack: contains thickness and zmin for each layer.
             Defaults to active PDK.layer_stack.
         exclude_layers: list of layer index to exclude.
+        max_workers: number of processes to mesh layers in parallel.
+            None defaults to the number of cores.
 
     """
+    from gdsfactory.export.to_stl import extrude_layers
     from gdsfactory.pdk import (
         get_active_pdk,
         get_layer,
@@ -32,7 +34,6 @@ def to_3d(
     )
 
     try:
-        from trimesh.creation import extrude_polygon
         from trimesh.scene import Scene
     except ImportError as e:
         print("you need to `pip install trimesh`")
@@ -46,10 +47,11 @@ def to_3d(
     exclude_layers = [get_layer(layer) for layer in exclude_layers]
 
     component_with_booleans = layer_stack.get_component_with_derived_layers(component)
-    polygons_per_layer = component_with_booleans.get_polygons_points(
+    polygons_per_layer = component_with_booleans.get_polygons_arrays(
         merge=True,
     )
-    has_polygons = False
+    layers = []
+    colors = []
 
     for level in layer_stack.layers.values():
         layer = level.layer
@@ -76,20 +78,19 @@ def to_3d(
         layer_view = layer_views.get_from_tuple(layer_tuple)
         color_rgb = [c / 255 for c in layer_view.fill_color.as_rgb_tuple(alpha=False)]
         if zmin is not None and layer_view.visible:
-            has_polygons = True
-            polygons = polygons_per_layer[layer_index]
-            height = level.thickness
-            for polygon in polygons:
-                p = shapely.geometry.Polygon(polygon)
-                mesh = extrude_polygon(p, height=height)
-                mesh.apply_translation((0, 0, zmin))
-                mesh.visual.face_colors = (*color_rgb, 0.5)
-                scene.add_geometry(mesh)
-    if not has_polygons:
+            points, offsets = polygons_per_layer[layer_index]
+            layers.append((points, offsets, level.thickness, zmin))
+            colors.append((*color_rgb, 0.5))
+
+    if not layers:
         raise ValueError(
             f"{component.name!r} does not have polygons defined in the "
             f"layer_stack or layer_views for the active Pdk {get_active_pdk().name!r}"
         )
+
+    for mesh, color in zip(extrude_layers(layers, max_workers=max_workers), colors):
+        mesh.visual.face_colors = color
+        scene.add_geometry(mesh)
     return scene
 
 
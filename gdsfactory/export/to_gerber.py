@@ -87,7 +87,9 @@ def to_gerber(
     #         radius = ref.parent_cell.settings["radius"]
     #         center = ref.center
     # Each layer and a list of the polygons (as lists of points) on that layer
-    layer_to_polygons = component.get_polygons_points()
+    from gdsfactory.pdk import get_layer
+
+    layer_to_polygons = component.get_polygons_arrays()
 
     for layer_tup, layer in layermap_to_gerber_layer.items():
         filename = (dirpath / layer.name.replace(" ", "_")).with_suffix(".gbr")
@@ -119,9 +121,11 @@ def to_gerber(
             f.write("%ADD10C,0.050000*%\n")
 
             # Only supports polygons for now
-            if layer_tup in layer_to_polygons.keys():
-                for poly in layer_to_polygons[layer_tup.layer]:
-                    f.write(polygon(poly))
+            layer_index = get_layer(layer_tup)
+            if layer_index in layer_to_polygons:
+                points, offsets = layer_to_polygons[layer_index]
+                for start, stop in zip(offsets[:-1], offsets[1:]):
+                    f.write(polygon(points[start:stop].tolist()))
 
             # File end
             f.write("M02*\n")
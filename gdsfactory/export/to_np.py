@@ -1,9 +1,126 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import kfactory as kf
 import numpy as np
+import numpy.typing as npt
 
 from gdsfactory.component import Component
-from gdsfactory.typings import Floats, Layers
+from gdsfactory.typings import Floats, Layers, PathType
+
+
+def rasterize_polygons(
+    points: np.ndarray,
+    offsets: np.ndarray,
+    shape: tuple[int, int],
+    origin: tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """Returns a boolean mask of the samples inside the polygons (nonzero winding).
+
+    Sample (i, j) is at coordinate (origin[0] + i, origin[1] + j) in the polygon
+    coordinates. Tiles of a larger image with the same points give the same samples.
+    All polygon edges are rasterized together with a vectorized scanline:
+    each edge adds its direction to the first sample right of every row crossing,
+    and a cumulative sum along the rows gives the winding number.
+
+    Args:
+        points: (N, 2) array with the (row, column) coordinates of all polygons.
+        offsets: polygon i is points[offsets[i]:offsets[i + 1]].
+        shape: (rows, columns) of the mask.
+        origin: integer coordinates of the first sample.
+    """
+    nrows, ncols = shape
+    row0, column0 = origin
+    if len(points) == 0:
+        return np.zeros(shape, dtype=bool)
+
+    # index of the next point of each point, closing each polygon
+    next_index = np.arange(1, len(points) + 1)
+    next_index[offsets[1:] - 1] = offsets[:-1]
+
+    r0, c0 = points[:, 0], points[:, 1]
+    r1, c1 = points[next_index, 0], points[next_index, 1]
+
+    # rows crossed by each edge, half-open [min, max) to count vertices once
+    row_start = np.clip(np.ceil(np.minimum(r0, r1)) - row0, 0, nrows).astype(np.int64)
+    row_stop = np.clip(np.ceil(np.maximum(r0, r1)) - row0, 0, nrows).astype(np.int64)
+    counts = np.maximum(row_stop - row_start, 0)
+    edges = np.flatnonzero(counts)
+    if len(edges) == 0:
+        return np.zeros(shape, dtype=bool)
+
+    counts = counts[edges]
+    edge = np.repeat(edges, counts)
+    first = np.cumsum(counts) - counts
+    rows = np.repeat(row_start[edges] - first, counts) + np.arange(counts.sum())
+
+    dr = r1[edge] - r0[edge]
+    columns = c0[edge] + (rows + row0 - r0[edge]) * (c1[edge] - c0[edge]) / dr
+    columns = np.clip(np.ceil(columns) - column0, 0, ncols).astype(np.int64)
+    direction = np.sign(dr)
+
+    winding = np.bincount(
+        rows * (ncols + 1) + columns, weights=direction, minlength=nrows * (ncols + 1)
+    ).reshape(nrows, ncols + 1)
+    return np.cumsum(winding[:, :ncols], axis=1) != 0
+
+
+def _rasterize_tile(
+    component: Component,
+    layer_indexes: list[int],
+    values: Floats,
+    out: np.ndarray,
+    origin: tuple[float, float],
+    pixels_per_um: float,
+    tile: tuple[int, int, int, int],
+    pad_width: int,
+    supersampling: int,
+) -> None:
+    from gdsfactory.functions import get_region_arrays
+
+    i0, i1, j0, j1 = tile
+    xmin, ymin = origin
+    s = supersampling
+    um_per_pixel = 1 / pixels_per_um
+    dbu = component.kcl.dbu
+
+    # one pixel margin contains all the samples of the tile.
+    # polygons are not clipped, as clipping would move their edges by rounding
+    box = kf.kdb.DBox(
+        xmin + (i0 - 1) * um_per_pixel,
+        ymin + (j0 - 1) * um_per_pixel,
+        xmin + (i1 + 1) * um_per_pixel,
+        ymin + (j1 + 1) * um_per_pixel,
+    ).to_itype(dbu)
+
+    shape = ((i1 - i0) * s, (j1 - j0) * s)
+    img = out[pad_width + i0 : pad_width + i1, pad_width + j0 : pad_width + j1]
+    tile_img = np.array(img, dtype=np.float64)
+
+    for layer_index, value in zip(layer_indexes, values):
+        region = kf.kdb.Region(
+            component._kdb_cell.begin_shapes_rec_touching(layer_index, box)
+        )
+        if region.is_empty():
+            continue
+
+        points, offsets = get_region_arrays(region, scale=dbu)
+        points -= origin
+        # pixel i covers [i, i + 1), sampled at the centers of its s x s subpixels
+        points = points * (pixels_per_um * s) - 0.5
+
+        mask = rasterize_polygons(points, offsets, shape, origin=(i0 * s, j0 * s))
+        if s == 1:
+            tile_img[mask] = value
+        else:
+            coverage = mask.reshape(shape[0] // s, s, shape[1] // s, s).mean(
+                axis=(1, 3)
+            )
+            tile_img *= 1 - coverage
+            tile_img += value * coverage
+
+    img[...] = tile_img
 
 
 def to_np(
@@ -12,43 +129,86 @@ def to_np(
     layers: Layers = ((1, 0),),
     values: Floats | None = None,
     pad_width: int = 1,
+    tile_size: int = 2048,
+    supersampling: int = 1,
+    filepath: PathType | None = None,
+    max_workers: int | None = 1,
+    dtype: npt.DTypeLike = np.float64,
 ) -> np.ndarray:
     """Returns a pixelated numpy array from Component polygons.
 
+    The image is rasterized in square tiles, so the memory used for
+    rasterization does not depend on the size of the component.
+    The image is indexed as img[x, y].
+
     Args:
         component: Component.
         nm_per_pixel: you can go from 20 (coarse) to 4 (fine).
         layers: to convert. Order matters (latter overwrite former).
         values: associated to each layer (defaults to 1).
         pad_width: padding pixels around the image.
+        tile_size: size of the square tiles in pixels.
+        supersampling: samples per pixel along each axis.
+            1 samples the pixel centers, >1 returns the area coverage (anti-aliased).
+        filepath: optional .npy file to stream the image into as a numpy.memmap.
+        max_workers: number of threads to rasterize tiles in parallel.
+            None defaults to the number of cores.
+        dtype: of the image.
 
     """
-    import skimage.draw as skdraw
+    from gdsfactory.config import get_number_of_cores
+    from gdsfactory.pdk import get_layer
 
     pixels_per_um = (1 / nm_per_pixel) * 1e3
-    xmin, ymin = component.bbox[0]
-    xmax, ymax = component.bbox[1]
+    bbox = component.dbbox()
+    xmin, ymin = bbox.left, bbox.bottom
+    xmax, ymax = bbox.right, bbox.top
     shape = (
-        int(np.ceil(xmax - xmin) * pixels_per_um),
-        int(np.ceil(ymax - ymin) * pixels_per_um),
+        max(int(np.ceil(xmax - xmin) * pixels_per_um), 0),
+        max(int(np.ceil(ymax - ymin) * pixels_per_um), 0),
     )
-    img = np.zeros(shape, dtype=float)
-    layer_to_polygons = component.get_polygons_points(by="tuple")
+    padded_shape = (shape[0] + 2 * pad_width, shape[1] + 2 * pad_width)
+
+    if filepath:
+        img = np.lib.format.open_memmap(
+            filepath, mode="w+", dtype=dtype, shape=padded_shape
+        )
+    else:
+        img = np.zeros(padded_shape, dtype=dtype)
 
     values = values or [1] * len(layers)
+    layer_indexes = [get_layer(layer) for layer in layers]
+
+    tiles = [
+        (i0, min(i0 + tile_size, shape[0]), j0, min(j0 + tile_size, shape[1]))
+        for i0 in range(0, shape[0], tile_size)
+        for j0 in range(0, shape[1], tile_size)
+    ]
+
+    def rasterize(tile: tuple[int, int, int, int]) -> None:
+        _rasterize_tile(
+            component,
+            layer_indexes=layer_indexes,
+            values=values,
+            out=img,
+            origin=(xmin, ymin),
+            pixels_per_um=pixels_per_um,
+            tile=tile,
+            pad_width=pad_width,
+            supersampling=supersampling,
+        )
+
+    max_workers = min(max_workers or get_number_of_cores(), max(len(tiles), 1))
+    if max_workers <= 1:
+        for tile in tiles:
+            rasterize(tile)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(rasterize, tiles))
 
-    for layer, value in zip(layers, values):
-        if layer in layer_to_polygons:
-            polygons = layer_to_polygons[layer]
-            for polygon in polygons:
-                r = polygon[:, 0] - xmin
-                c = polygon[:, 1] - ymin
-                rr, cc = skdraw.polygon(
-                    r * pixels_per_um, c * pixels_per_um, shape=shape
-                )
-                img[rr, cc] = value
-
-    return np.pad(img, pad_width=pad_width)
+    if isinstance(img, np.memmap):
+        img.flush()
+    return img
 
 
 if __name__ == "__main__":
@@ -1,12 +1,98 @@
 from __future__ import annotations
 
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from gdsfactory.component import Component
 from gdsfactory.technology import DerivedLayer, LayerStack, LogicalLayer
 from gdsfactory.typings import LayerSpec
 
 
+def extrude_polygons(
+    points: np.ndarray,
+    offsets: np.ndarray,
+    height: float,
+    zmin: float = 0,
+    hull_invalid_polygons: bool = False,
+):
+    """Returns a single trimesh with all polygons extruded.
+
+    Polygons that are identical up to a translation (for example the same
+    child cell placed many times) are only triangulated once.
+
+    Args:
+        points: (N, 2) array with the points of all polygons.
+        offsets: polygon i is points[offsets[i]:offsets[i + 1]].
+        height: extrusion height.
+        zmin: bottom z of the extrusion.
+        hull_invalid_polygons: If True, replaces invalid polygons (determined by shapely.Polygon.is_valid) with its convex hull.
+    """
+    import shapely
+    import trimesh
+    from trimesh.creation import extrude_polygon
+
+    cache: dict[bytes, tuple[np.ndarray, np.ndarray]] = {}
+    vertices = []
+    faces = []
+    num_vertices = 0
+
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        polygon = points[start:stop]
+        origin = polygon.min(axis=0)
+        # rounding makes the key independent of the float error of the shift
+        polygon = np.round(polygon - origin, 6)
+        key = polygon.tobytes()
+
+        if key not in cache:
+            p = shapely.geometry.Polygon(polygon)
+            if hull_invalid_polygons and not p.is_valid:
+                p = p.convex_hull
+            mesh = extrude_polygon(p, height=height)
+            cache[key] = (mesh.vertices.view(np.ndarray), mesh.faces.view(np.ndarray))
+
+        mesh_vertices, mesh_faces = cache[key]
+        vertices.append(mesh_vertices + (origin[0], origin[1], zmin))
+        faces.append(mesh_faces + num_vertices)
+        num_vertices += len(mesh_vertices)
+
+    if not vertices:
+        return trimesh.Trimesh()
+
+    return trimesh.Trimesh(
+        vertices=np.concatenate(vertices), faces=np.concatenate(faces), process=False
+    )
+
+
+def extrude_layers(
+    layers: list[tuple[np.ndarray, np.ndarray, float, float]],
+    hull_invalid_polygons: bool = False,
+    max_workers: int | None = 1,
+) -> list:
+    """Returns one trimesh per layer, optionally meshing the layers in parallel.
+
+    Args:
+        layers: list of (points, offsets, height, zmin) for each layer.
+        hull_invalid_polygons: If True, replaces invalid polygons with its convex hull.
+        max_workers: number of worker processes. None defaults to the number of cores.
+            1 meshes all layers in the current process.
+    """
+    from gdsfactory.config import get_number_of_cores
+
+    max_workers = min(max_workers or get_number_of_cores(), len(layers))
+    args = [
+        (points, offsets, height, zmin, hull_invalid_polygons)
+        for points, offsets, height, zmin in layers
+    ]
+
+    if max_workers <= 1:
+        return [extrude_polygons(*arg) for arg in args]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(extrude_polygons, *zip(*args)))
+
+
 def to_stl(
     component: Component,
     filepath: str,
@@ -14,6 +100,7 @@ def to_stl(
     exclude_layers: tuple[LayerSpec, ...] | None = None,
     hull_invalid_polygons: bool = False,
     scale: float | None = None,
+    max_workers: int | None = 1,
 ) -> None:
     """Exports a Component into STL.
 
@@ -25,22 +112,23 @@ def to_stl(
         exclude_layers: list of layer index to exclude.
         hull_invalid_polygons: If True, replaces invalid polygons (determined by shapely.Polygon.is_valid) with its convex hull.
         scale: Optional factor by which to scale meshes before writing.
+        max_workers: number of processes to mesh layers in parallel.
+            None defaults to the number of cores.
 
     """
-    import shapely
-    import trimesh.creation
-
     from gdsfactory.pdk import get_active_pdk, get_layer, get_layer_stack
 
     layer_stack = layer_stack or get_layer_stack()
-    has_polygons = False
 
     filepath = pathlib.Path(filepath)
     exclude_layers = exclude_layers or ()
     exclude_layers = [get_layer(layer) for layer in exclude_layers]
 
     component_with_booleans = layer_stack.get_component_with_derived_layers(component)
-    polygons_per_layer = component_with_booleans.get_polygons_points()
+    polygons_per_layer = component_with_booleans.get_polygons_arrays()
+
+    layers = []
+    filepaths = []
 
     for level in layer_stack.layers.values():
         layer = level.layer
@@ -54,6 +142,7 @@ def to_stl(
             raise ValueError(f"Layer {layer!r} is not a DerivedLayer or LogicalLayer")
 
         layer_tuple = tuple(layer_index)
+        layer_index = get_layer(layer_index)
 
         if layer_index in exclude_layers:
             continue
@@ -63,8 +152,7 @@ def to_stl(
 
         zmin = level.zmin
         if zmin is not None:
-            has_polygons = True
-            polygons = polygons_per_layer[layer_index]
+            points, offsets = polygons_per_layer[layer_index]
             height = level.thickness
             layer_name = level.name or f"{layer_tuple[0]}_{layer_tuple[1]}"
             filepath_layer = (
@@ -73,30 +161,25 @@ def to_stl(
             print(
                 f"Write {filepath_layer.absolute()!r} zmin = {zmin:.3f}, height = {height:.3f}"
             )
-            meshes = []
-            for polygon in polygons:
-                p = shapely.geometry.Polygon(polygon)
-
-                if hull_invalid_polygons and not p.is_valid:
-                    p = p.convex_hull
+            layers.append((points, offsets, height, zmin))
+            filepaths.append(filepath_layer)
 
-                mesh = trimesh.creation.extrude_polygon(p, height=height)
-                mesh.apply_translation((0, 0, zmin))
-                meshes.append(mesh)
+    if not layers:
+        raise ValueError(
+            f"{component.name!r} does not have polygons defined in the "
+            f"layer_stack or layer_views for the active Pdk {get_active_pdk().name!r}"
+        )
 
-        layer_mesh = trimesh.util.concatenate(meshes)
+    layer_meshes = extrude_layers(
+        layers, hull_invalid_polygons=hull_invalid_polygons, max_workers=max_workers
+    )
 
+    for layer_mesh, filepath_layer in zip(layer_meshes, filepaths):
         if scale:
             layer_mesh.apply_scale(scale)
 
         layer_mesh.export(filepath_layer)
 
-    if not has_polygons:
-        raise ValueError(
-            f"{component.name!r} does not have polygons defined in the "
-            f"layer_stack or layer_views for the active Pdk {get_active_pdk().name!r}"
-        )
-
 
 if __name__ == "__main__":
     import gdsfactory as gf
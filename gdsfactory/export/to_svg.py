@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+import math
+
+import kfactory as kf
+
 from gdsfactory.component import Component
-from gdsfactory.technology import LayerStack, LayerViews
+from gdsfactory.technology import DerivedLayer, LayerStack, LayerViews, LogicalLayer
 from gdsfactory.typings import Layer
 
+# "(x0,y0;x1,y1;...)" polygon strings to "Mx0 y0 x1 y1 ...Z" SVG path data
+_path_translation = str.maketrans({"(": "M", ")": "Z", ";": " ", ",": " "})
+
+
+def _write_paths(f, region: kf.kdb.Region, css_class: str, indent: str) -> None:
+    for polygon in region.each():
+        d = polygon.to_simple_polygon().to_s().translate(_path_translation)
+        f.write(f'{indent}<path class="{css_class}" d="{d}"/>\n')
+
+
+def _svg_matrix(trans: kf.kdb.ICplxTrans) -> str:
+    angle = math.radians(trans.angle)
+    # rounding avoids 6e-17 style values for manhattan rotations
+    cos = round(trans.mag * math.cos(angle), 12) + 0.0
+    sin = round(trans.mag * math.sin(angle), 12) + 0.0
+    sign = -1 if trans.is_mirror() else 1
+    disp = trans.disp
+    return (
+        f"matrix({cos:g} {sin:g} {-sin * sign + 0.0:g} {cos * sign + 0.0:g} "
+        f"{disp.x} {disp.y})"
+    )
+
 
 def to_svg(
     component: Component,
@@ -12,9 +38,16 @@ def to_svg(
     exclude_layers: tuple[Layer, ...] | None = None,
     filename: str = "component.svg",
     scale: int = 1,
+    flatten: bool = False,
+    buffer_size: int = 2**20,
 ) -> None:
     """Write a 3D svg file from a component.
 
+    By default each unique cell is written once as a group in ``<defs>``
+    and placed with ``<use transform=...>``, so the file size scales with the
+    number of unique cells instead of the number of instances.
+    Derived layers (booleans) can not be split by cell and are always written flat.
+
     Args:
         component: to extrude in 3D.
         layer_views: layer colors from Klayout Layer Properties file.
@@ -24,57 +57,120 @@ def to_svg(
         exclude_layers: layers to exclude.
         filename: svg filename.
         scale: scale for the svg.
+        flatten: if True, writes all polygons flat in the top level.
+        buffer_size: size of the file write buffer in bytes.
     """
-    from gdsfactory.pdk import get_layer_stack, get_layer_views
+    from gdsfactory.pdk import get_layer, get_layer_stack, get_layer_views
 
     layer_views = layer_views or get_layer_views()
     layer_stack = layer_stack or get_layer_stack()
 
-    exclude_layers = exclude_layers or ()
-    # layers = layer_views.layer_map.values()
+    exclude_layers = [get_layer(layer) for layer in exclude_layers or ()]
+
+    # (layer expression, css class) for each visible level
+    levels: list[tuple[LogicalLayer | DerivedLayer, str]] = []
+    levels_keys = set()
+    styles: dict[str, str] = {}
+
+    for level in layer_stack.layers.values():
+        if isinstance(level.layer, LogicalLayer):
+            layer_tuple = tuple(level.layer.layer)
+        elif isinstance(level.layer, DerivedLayer):
+            layer_tuple = tuple(level.derived_layer.layer)
+        else:
+            raise ValueError("layer must be one of LogicalLayer or DerivedLayer")
+
+        if get_layer(layer_tuple) in exclude_layers or level.zmin is None:
+            continue
+
+        layer_view = layer_views.get_from_tuple(layer_tuple)
+        if not layer_view.visible:
+            continue
 
-    component_with_booleans = layer_stack.get_component_with_derived_layers(component)
-    component_layers = component_with_booleans.layers
+        css_class = f"layer{layer_tuple[0]:03d}_datatype{layer_tuple[1]:03d}"
+        level_key = (level.layer.get_key(), css_class)
+        if level_key in levels_keys:
+            continue
+        levels_keys.add(level_key)
+        styles[css_class] = layer_view.fill_color.as_hex(format="short")
+        levels.append((level.layer, css_class))
+
+    dbu = component.kcl.dbu
+    bbox = component.bbox()
     xsize = component.dxsize
     ysize = component.dysize
-    dcx, dcy = component.dcenter.x, component.dcenter.y
-    dx, dy = dcx - xsize / 2, dcy - ysize / 2
-    group_num = 1
-    layer_to_polygons = component_with_booleans.get_polygons()
+    k = dbu * scale
+
+    kcl = component.kcl
+    cache: dict = {}
 
-    with open(filename, "w+") as f:
+    with open(filename, "w", buffering=buffer_size) as f:
         f.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
         f.write(
             f'<svg\n   width="{xsize * scale:0.6f}" \n   height="{ysize * scale:0.6f}"\n'
             '   version="1.1"\n'
             '   xmlns:svg="http://www.w3.org/2000/svg"\n'
+            '   xmlns:xlink="http://www.w3.org/1999/xlink"\n'
             '   xmlns="http://www.w3.org/2000/svg">\n'
         )
+        f.write("  <style>\n")
+        for css_class, color in styles.items():
+            f.write(f"    .{css_class} {{ fill: {color}; }}\n")
+        f.write("  </style>\n")
+
+        logical_levels = [
+            (get_layer(layer.layer), css_class)
+            for layer, css_class in levels
+            if isinstance(layer, LogicalLayer)
+        ]
+
+        if not flatten:
+            f.write("  <defs>\n")
+            for cell_index in component.called_cells():
+                cell = kcl[cell_index]
+                f.write(f'    <g id="cell{cell_index}">\n')
+                _write_cell(f, cell, logical_levels, indent="      ")
+                f.write("    </g>\n")
+            f.write("  </defs>\n")
+
+        # database units to svg units, with the y axis pointing down
+        f.write(
+            f'  <g transform="matrix({k:g} 0 0 {-k:g} '
+            f'{-bbox.left * k:g} {bbox.top * k:g})">\n'
+        )
+
+        for layer, css_class in levels:
+            if flatten or isinstance(layer, DerivedLayer):
+                region = layer.get_shapes(component, cache=cache)
+                _write_paths(f, region, css_class, indent="    ")
 
-        for level in layer_stack.layers.values():
-            layer = level.layer
-
-            if layer not in exclude_layers and layer in component_layers:
-                zmin = level.zmin
-                layer_view = layer_views.get_from_tuple(layer)
-                color = layer_view.fill_color.as_hex(format="short")
-                f.write('  <g id="layer%03i_datatype%03i">\n' % (layer[0], layer[1]))
-                group_num += 1
-                polygons = layer_to_polygons[layer]
-
-                if zmin is not None and layer_view.visible:
-                    for polygon in polygons:
-                        poly_str = f'    <path style="fill:{color}"\n          d="'
-                        for n, p in enumerate(polygon):
-                            poly_str += "M " if n == 0 else "L "
-                            poly_str += f"{(p[0] - dx) * scale:0.6f} {(-(p[1] - dy) + ysize) * scale:0.6f} "
-                        poly_str += 'Z"/>\n'
-                        f.write(poly_str)
-                    f.write("  </g>\n")
+        if not flatten:
+            _write_cell(f, component, logical_levels, indent="    ")
 
+        f.write("  </g>\n")
         f.write("</svg>\n")
 
 
+def _write_cell(
+    f, cell: kf.KCell, logical_levels: list[tuple[int, str]], indent: str
+) -> None:
+    """Writes the shapes of a single cell and uses of its instances."""
+    for layer_index, css_class in logical_levels:
+        region = kf.kdb.Region(cell.shapes(layer_index))
+        _write_paths(f, region, css_class, indent=indent)
+
+    for inst in cell._kdb_cell.each_inst():
+        href = f"#cell{inst.cell_index}"
+        for trans in inst.cell_inst.each_cplx_trans():
+            if trans.is_unity():
+                f.write(f'{indent}<use xlink:href="{href}"/>\n')
+            else:
+                f.write(
+                    f'{indent}<use xlink:href="{href}" '
+                    f'transform="{_svg_matrix(trans)}"/>\n'
+                )
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import chain
+from operator import attrgetter
 from typing import TYPE_CHECKING, Literal
 
 import kfactory as kf
@@ -8,11 +10,14 @@ from numpy import cos, float64, ndarray, sin
 
 import gdsfactory as gf
 
+_get_point_xy = attrgetter("x", "y")
+
 RAD2DEG = 180.0 / np.pi
 DEG2RAD = 1 / RAD2DEG
 
 if TYPE_CHECKING:
     from gdsfactory.component import Component, Instance
+    from gdsfactory.typings import LayerSpecs
 
 
 def get_polygons(
@@ -67,12 +72,115 @@ def get_polygons(
     return polygons
 
 
+def get_region_arrays(
+    region: kf.kdb.Region, scale: float = 1.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns (points, offsets) arrays with the points of all polygons of a Region.
+
+    Polygon i is ``points[offsets[i]:offsets[i + 1]]``.
+    Polygons with holes are converted to simple polygons.
+
+    Args:
+        region: to extract the polygons.
+        scale: factor to multiply the points (in dbu) with.
+    """
+    polygons = [polygon.to_simple_polygon() for polygon in region.each()]
+    num_points = np.fromiter(
+        (polygon.num_points() for polygon in polygons),
+        dtype=np.int64,
+        count=len(polygons),
+    )
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(num_points, out=offsets[1:])
+
+    # iterate points and coordinates at C level, without intermediate lists
+    coordinates = chain.from_iterable(
+        map(
+            _get_point_xy,
+            chain.from_iterable(polygon.each_point() for polygon in polygons),
+        )
+    )
+    points = np.fromiter(
+        coordinates, dtype=np.float64, count=2 * int(offsets[-1])
+    ).reshape(-1, 2)
+    if scale != 1:
+        points *= scale
+    return points, offsets
+
+
+def get_polygons_arrays(
+    component_or_instance: Component | Instance,
+    merge: bool = False,
+    scale: float | None = None,
+    by: Literal["index"] | Literal["name"] | Literal["tuple"] = "index",
+    layers: LayerSpecs | None = None,
+) -> dict[int | str | tuple[int, int], tuple[np.ndarray, np.ndarray]]:
+    """Returns a dict with the points of all polygons per layer as flat arrays.
+
+    For each layer returns (points, offsets) where points is a (N, 2) float64 array (um)
+    with the points of all polygons concatenated, and polygon i is
+    ``points[offsets[i]:offsets[i + 1]]``.
+
+    Args:
+        component_or_instance: to extract the polygons.
+        merge: if True, merges the polygons.
+        scale: if True, scales the points.
+        by: the format of the resulting keys in the dictionary ('index', 'name', 'tuple')
+        layers: optional layers to extract. Defaults to all layers with shapes.
+    """
+    from gdsfactory import get_layer, get_layer_name
+
+    kcl = component_or_instance.kcl
+    c = (
+        component_or_instance.parent_cell
+        if hasattr(component_or_instance, "parent_cell")
+        else component_or_instance
+    )
+
+    if layers is None:
+        layer_indexes = [
+            layer_index
+            for layer_index in kcl.layer_indexes()
+            if not component_or_instance.bbox(layer_index).empty()
+        ]
+    else:
+        layer_indexes = [get_layer(layer) for layer in layers]
+
+    factor = kcl.dbu * scale if scale else kcl.dbu
+    polygons_arrays = {}
+
+    for layer_index in layer_indexes:
+        info = kcl.get_info(layer_index)
+        layer = (info.layer, info.datatype)
+        if by == "index":
+            key = get_layer(layer)
+        elif by == "name":
+            key = get_layer_name(layer)
+        elif by == "tuple":
+            key = layer
+        else:
+            raise ValueError("argument 'by' should be 'index' | 'name' | 'tuple'")
+
+        r = gf.kdb.Region(c.begin_shapes_rec(layer_index))
+        if merge:
+            r.merge()
+
+        points, offsets = get_region_arrays(r, scale=factor)
+
+        if key in polygons_arrays:
+            points_prev, offsets_prev = polygons_arrays[key]
+            points = np.concatenate([points_prev, points])
+            offsets = np.concatenate([offsets_prev, offsets[1:] + offsets_prev[-1]])
+        polygons_arrays[key] = (points, offsets)
+    return polygons_arrays
+
+
 def get_polygons_points(
     component_or_instance: Component | Instance,
     merge: bool = False,
     scale: float | None = None,
     by: Literal["index"] | Literal["name"] | Literal["tuple"] = "index",
-) -> dict[int | str | tuple[int, int], list[tuple[float, float]]]:
+) -> dict[int | str | tuple[int, int], list[np.ndarray]]:
     """Returns a dict with list of points per layer.
 
     Args:
@@ -81,34 +189,13 @@ def get_polygons_points(
         scale: if True, scales the points.
         by: the format of the resulting keys in the dictionary ('index', 'name', 'tuple')
     """
-    polygons_dict = get_polygons(
-        component_or_instance=component_or_instance, merge=merge, by=by
+    polygons_arrays = get_polygons_arrays(
+        component_or_instance=component_or_instance, merge=merge, scale=scale, by=by
     )
-    polygons_points = {}
-    for layer, polygons in polygons_dict.items():
-        all_points = []
-        for polygon in polygons:
-            if scale:
-                points = np.array(
-                    [
-                        (point.x * scale, point.y * scale)
-                        for point in polygon.to_simple_polygon()
-                        .to_dtype(component_or_instance.kcl.dbu)
-                        .each_point()
-                    ]
-                )
-            else:
-                points = np.array(
-                    [
-                        (point.x, point.y)
-                        for point in polygon.to_simple_polygon()
-                        .to_dtype(component_or_instance.kcl.dbu)
-                        .each_point()
-                    ]
-                )
-            all_points.append(points)
-        polygons_points[layer] = all_points
-    return polygons_points
+    return {
+        layer: np.split(points, offsets[1:-1]) if len(offsets) > 1 else []
+        for layer, (points, offsets) in polygons_arrays.items()
+    }
 
 
 def get_point_inside(component_or_instance: Component | Instance, layer) -> np.ndarray:
@@ -10,6 +10,7 @@ from gdsfactory.technology import LayerViews
 
 if typing.TYPE_CHECKING:
     from gdsfactory.pdk import Pdk
+    from gdsfactory.typings import ComponentFactory
 
 
 PORT_MARKER_LAYER_TO_TYPE = {
@@ -46,23 +47,27 @@ LAYER_CONNECTIVITY = [
 ]
 
 
+def get_generic_cells() -> dict[str, ComponentFactory]:
+    """Returns the cell functions of the generic PDK."""
+    from gdsfactory.components import cells
+    from gdsfactory.generic_tech.containers import containers
+
+    cells = cells.copy()
+    cells.update(containers)
+    return cells
+
+
 @cache
 def get_generic_pdk() -> Pdk:
-    from gdsfactory.components import cells
     from gdsfactory.config import PATH
     from gdsfactory.cross_section import cross_sections
-    from gdsfactory.generic_tech.containers import containers
     from gdsfactory.generic_tech.simulation_settings import materials_index
-    from gdsfactory.pdk import Pdk, constants
+    from gdsfactory.pdk import LazyCells, Pdk, constants
 
     LAYER_VIEWS = LayerViews(filepath=PATH.klayout_yaml)
 
-    cells = cells.copy()
-    cells.update(containers)
-
-    return Pdk(
+    pdk = Pdk(
         name="generic",
-        cells=cells,
         cross_sections=cross_sections,
         layers=LAYER,
         layer_stack=LAYER_STACK,
@@ -72,6 +77,9 @@ def get_generic_pdk() -> Pdk:
         constants=constants,
         connectivity=LAYER_CONNECTIVITY,
     )
+    # the components are imported on the first cell lookup
+    pdk.cells = LazyCells(get_generic_cells)
+    return pdk
 
 
 if __name__ == "__main__":
@@ -127,6 +127,7 @@ def get_netlist(
     get_instance_name: Callable[..., str] = get_instance_name_from_alias,
     allow_multiple: bool = False,
     connection_error_types: dict[str, list[str]] | None = None,
+    tolerance: int = 0,
 ) -> dict[str, Any]:
     """From Component returns a dict with instances, connections and placements.
 
@@ -146,6 +147,7 @@ def get_netlist(
         allow_multiple: False to raise an error if more than two ports share the same connection. \
                 if True, will return key: [value] pairs with [value] a list of all connected instances.
         connection_error_types: optional dictionary of port types and error types to raise an error for.
+        tolerance: maximum distance (in dbu) between two port centers to consider them connected.
 
     Returns:
         instances: Dict of instance name and settings.
@@ -243,6 +245,7 @@ def get_netlist(
             port_type,
             allow_multiple=allow_multiple,
             connection_error_types=connection_error_types,
+            tolerance=tolerance,
         )
         if warnings_t:
             warnings[port_type] = warnings_t
@@ -282,6 +285,7 @@ def extract_connections(
     validators: dict[str, Callable] | None = None,
     allow_multiple: bool = False,
     connection_error_types: dict[str, list[str]] | None = None,
+    tolerance: int = 0,
 ):
     if validators is None:
         validators = DEFAULT_CONNECTION_VALIDATORS
@@ -294,9 +298,47 @@ def extract_connections(
         connection_validator=validator,
         allow_multiple=allow_multiple,
         connection_error_types=connection_error_types,
+        tolerance=tolerance,
     )
 
 
+def _group_ports_by_position(
+    centers: np.ndarray, tolerance: int = 0
+) -> list[np.ndarray]:
+    """Returns groups of indices of ports whose centers are within tolerance.
+
+    Groups are sorted by first appearance and so are the indices in each group.
+
+    Args:
+        centers: (N, 2) array of port centers in dbu.
+        tolerance: maximum distance (in dbu) between connected port centers.
+    """
+    n = len(centers)
+    if n == 0:
+        return []
+
+    if tolerance <= 0:
+        _, labels = np.unique(centers, axis=0, return_inverse=True)
+    else:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+        from scipy.spatial import cKDTree
+
+        pairs = cKDTree(centers).query_pairs(r=tolerance, output_type="ndarray")
+        graph = coo_matrix(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+            shape=(n, n),
+        )
+        _, labels = connected_components(graph, directed=False)
+
+    labels = np.ravel(labels)
+    order = np.argsort(labels, kind="stable")
+    splits = np.flatnonzero(np.diff(labels[order])) + 1
+    groups = np.split(order, splits)
+    groups.sort(key=lambda group: group[0])
+    return groups
+
+
 def _extract_connections(
     port_names: list[str],
     ports: dict[str, Port],
@@ -305,6 +347,7 @@ def _extract_connections(
     raise_error_for_warnings: list[str] | None = None,
     allow_multiple: bool = False,
     connection_error_types: dict[str, list[str]] | None = None,
+    tolerance: int = 0,
 ):
     """Extracts connections between ports.
 
@@ -316,6 +359,7 @@ def _extract_connections(
         raise_error_for_warnings: list of warning types to raise an error for.
         allow_multiple: False to raise an error if more than two ports share the same connection.
         connection_error_types: optional dictionary of port types and error types to raise an error for.
+        tolerance: maximum distance (in dbu) between two port centers to consider them connected.
 
     """
     if connection_error_types is None:
@@ -325,28 +369,29 @@ def _extract_connections(
     if raise_error_for_warnings is None:
         raise_error_for_warnings = connection_error_types.get(port_type, [])
 
-    unconnected_port_names = list(port_names)
+    port_names = list(port_names)
     connections = []
+    # (port1 name, port2 name, names of all ports at that position)
+    pairs = []
 
-    by_xy = defaultdict(list)
-
-    for port_name in unconnected_port_names:
-        port = ports[port_name]
-        by_xy[port.center].append(port_name)
+    centers = np.array(
+        [ports[port_name].center for port_name in port_names], dtype=np.int64
+    ).reshape(-1, 2)
 
     unconnected_port_names = []
 
-    for xy, ports_at_xy in by_xy.items():
+    for group in _group_ports_by_position(centers, tolerance=tolerance):
+        ports_at_xy = [port_names[i] for i in group]
+
         if len(ports_at_xy) == 1:
             unconnected_port_names.append(ports_at_xy[0])
 
         elif len(ports_at_xy) == 2:
-            port1 = ports[ports_at_xy[0]]
-            port2 = ports[ports_at_xy[1]]
-            connection_validator(port1, port2, ports_at_xy, warnings)
+            pairs.append((ports_at_xy[0], ports_at_xy[1], ports_at_xy))
             connections.append(ports_at_xy)
 
         elif not allow_multiple:
+            xy = ports[ports_at_xy[0]].center
             warnings["multiple_connections"].append(ports_at_xy)
             raise ValueError(f"Found multiple connections at {xy}:{ports_at_xy}")
 
@@ -356,11 +401,13 @@ def _extract_connections(
             for portindex1, portindex2 in zip(
                 range(-1, num_ports - 1), range(num_ports)
             ):
-                port1 = ports[ports_at_xy[portindex1]]
-                port2 = ports[ports_at_xy[portindex2]]
-                connection_validator(port1, port2, ports_at_xy, warnings)
+                pairs.append(
+                    (ports_at_xy[portindex1], ports_at_xy[portindex2], ports_at_xy)
+                )
                 connections.append([ports_at_xy[portindex1], ports_at_xy[portindex2]])
 
+    _validate_connections(pairs, ports, connection_validator, warnings)
+
     if unconnected_port_names:
         unconnected_non_top_level = [
             pname for pname in unconnected_port_names if ("," in pname)
@@ -387,6 +434,24 @@ def _extract_connections(
     return connections, dict(warnings)
 
 
+def _validate_connections(
+    pairs: list[tuple[str, str, list[str]]],
+    ports: dict[str, Port],
+    connection_validator: Callable,
+    warnings: dict[str, list],
+) -> None:
+    """Validates all connected port pairs, vectorized for the default validators."""
+    if not pairs or connection_validator is _null_validator:
+        return
+
+    if connection_validator is validate_optical_connection:
+        validate_optical_connections(pairs, ports, warnings)
+        return
+
+    for port_name1, port_name2, port_names in pairs:
+        connection_validator(ports[port_name1], ports[port_name2], port_names, warnings)
+
+
 def _make_warning(ports: list[str], values: Any, message: str) -> dict[str, Any]:
     w = {
         "ports": ports,
@@ -474,6 +539,111 @@ def difference_between_angles(angle2: float, angle1: float) -> float:
     return diff
 
 
+def difference_between_angles_array(
+    angle2: np.ndarray, angle1: np.ndarray
+) -> np.ndarray:
+    """Vectorized difference_between_angles, returns values in (-180, 180]."""
+    return 180 - np.mod(180 - (angle2 - angle1), 360)
+
+
+def validate_optical_connections(
+    pairs: list[tuple[str, str, list[str]]],
+    ports: dict[str, Port],
+    warnings,
+    angle_tolerance=0.01,
+    offset_tolerance=0.001,
+    width_tolerance=0.001,
+) -> None:
+    """Vectorized validate_optical_connection for many port pairs.
+
+    Args:
+        pairs: list of (port1 name, port2 name, names of all ports at that position).
+        ports: dict of port names to Port objects.
+        warnings: dict of warning type to list of warnings to append to.
+        angle_tolerance: in degrees.
+        offset_tolerance: in dbu.
+        width_tolerance: in dbu.
+    """
+    for _, _, port_names in pairs:
+        if len(port_names) != 2:
+            raise ValueError(f"More than two connected optical ports: {port_names}")
+
+    is_top_level = np.array(
+        [("," not in pname1, "," not in pname2) for pname1, pname2, _ in pairs]
+    )
+    both_top_level = is_top_level.all(axis=1)
+    if both_top_level.any():
+        port_names = pairs[int(np.argmax(both_top_level))][2]
+        raise ValueError(f"Two top-level ports appear to be connected: {port_names}")
+
+    ports1 = [ports[pname1] for pname1, _, _ in pairs]
+    ports2 = [ports[pname2] for _, pname2, _ in pairs]
+
+    widths = np.array([(p1.width, p2.width) for p1, p2 in zip(ports1, ports2)])
+    orientations = np.array(
+        [(p1.orientation, p2.orientation) for p1, p2 in zip(ports1, ports2)]
+    )
+    centers1 = np.array([p.center for p in ports1], dtype=float)
+    centers2 = np.array([p.center for p in ports2], dtype=float)
+
+    width_mismatch = np.abs(widths[:, 0] - widths[:, 1]) > width_tolerance
+
+    angle_difference = np.abs(
+        difference_between_angles_array(orientations[:, 0], orientations[:, 1])
+    )
+    any_top_level = is_top_level.any(axis=1)
+    orientation_mismatch = np.where(
+        any_top_level,
+        angle_difference > angle_tolerance,
+        np.abs(angle_difference - 180) > angle_tolerance,
+    )
+
+    offsets = np.hypot(*(centers2 - centers1).T)
+    offset_mismatch = offsets > offset_tolerance
+
+    for i in np.flatnonzero(width_mismatch):
+        port1, port2, port_names = ports1[i], ports2[i], pairs[i][2]
+        warnings["width_mismatch"].append(
+            _make_warning(
+                port_names,
+                values=[port1.width, port2.width],
+                message=f"Widths of ports {port_names[0]} and {port_names[1]} not equal. "
+                f"Difference of {abs(port1.width - port2.width)} um",
+            )
+        )
+
+    for i in np.flatnonzero(orientation_mismatch):
+        port1, port2, port_names = ports1[i], ports2[i], pairs[i][2]
+        if any_top_level[i]:
+            top_port, lower_port = (
+                port_names if is_top_level[i, 0] else port_names[::-1]
+            )
+            message = (
+                f"{lower_port} was promoted to {top_port} but orientations"
+                f"do not match! Difference of {(abs(port1.orientation - port2.orientation))} deg"
+            )
+        else:
+            angle_misalignment = abs(angle_difference[i] - 180)
+            message = f"{port_names[0]} and {port_names[1]} are misaligned by {angle_misalignment} deg"
+        warnings["orientation_mismatch"].append(
+            _make_warning(
+                port_names,
+                values=[port1.orientation, port2.orientation],
+                message=message,
+            )
+        )
+
+    for i in np.flatnonzero(offset_mismatch):
+        port1, port2, port_names = ports1[i], ports2[i], pairs[i][2]
+        warnings["offset_mismatch"].append(
+            _make_warning(
+                port_names,
+                values=[port1.center, port2.center],
+                message=f"{port_names[0]} and {port_names[1]} are offset by {offsets[i]} um",
+            )
+        )
+
+
 def _get_references_to_netlist(component: Component) -> list[ComponentReference]:
     return component.insts
 
@@ -483,16 +653,23 @@ def get_netlist_recursive(
     component_suffix: str = "",
     get_netlist_func: Callable = get_netlist,
     get_instance_name: Callable[..., str] = get_instance_name_from_alias,
+    cache: dict[str, dict[str, Any]] | None = None,
     **kwargs,
 ) -> dict[str, Any]:
     """Returns recursive netlist for a component and subcomponents.
 
+    Each unique cell is netlisted only once, even if it is referenced many times
+    across the hierarchy.
+
     Args:
         component: to extract netlist.
         component_suffix: suffix to append to each component name.
             useful if to save and reload a back-annotated netlist.
         get_netlist_func: function to extract individual netlists.
         get_instance_name: function to get instance name.
+        cache: optional dict of cell name to recursive netlists.
+            Defaults to a new dict for each call. Pass the same dict to several calls
+            to reuse netlists across calls (only valid for the same kwargs).
         kwargs: additional keyword arguments to pass to get_netlist_func.
 
     Keyword Args:
@@ -504,6 +681,13 @@ def get_netlist_recursive(
         Dictionary of netlists, keyed by the name of each component.
 
     """
+    if cache is None:
+        cache = {}
+
+    component_name = f"{component.name}{component_suffix}"
+    if component_name in cache:
+        return cache[component_name]
+
     all_netlists = {}
 
     # only components with references (subcomponents) warrant a netlist
@@ -511,32 +695,45 @@ def get_netlist_recursive(
 
     if references:
         netlist = get_netlist_func(component, **kwargs)
-        all_netlists[f"{component.name}{component_suffix}"] = netlist
+        all_netlists[component_name] = netlist
+
+        # child cell name -> instance dict (None if the child has no references)
+        child_instances: dict[str, dict[str, Any] | None] = {}
 
         # for each reference, expand the netlist
         for ref in references:
             rcell = ref.cell
-            grandchildren = get_netlist_recursive(
-                component=rcell,
-                component_suffix=component_suffix,
-                get_netlist_func=get_netlist_func,
-                **kwargs,
-            )
-            all_netlists |= grandchildren
-
-            child_references = _get_references_to_netlist(ref.cell)
-
-            if child_references:
+            rcell_name = f"{rcell.name}{component_suffix}"
+
+            if rcell_name not in child_instances:
+                grandchildren = get_netlist_recursive(
+                    component=rcell,
+                    component_suffix=component_suffix,
+                    get_netlist_func=get_netlist_func,
+                    cache=cache,
+                    **kwargs,
+                )
+                all_netlists |= grandchildren
+
+                netlist_dict = None
+                if rcell_name in grandchildren:
+                    netlist_dict = {"component": rcell_name}
+                    if hasattr(rcell, "settings"):
+                        netlist_dict.update(
+                            settings=rcell.settings.model_dump(exclude_none=True)
+                        )
+                    if hasattr(rcell, "info"):
+                        netlist_dict.update(
+                            info=rcell.info.model_dump(exclude_none=True)
+                        )
+                child_instances[rcell_name] = netlist_dict
+
+            netlist_dict = child_instances[rcell_name]
+            if netlist_dict is not None:
                 inst_name = get_instance_name(ref)
-                netlist_dict = {"component": f"{rcell.name}{component_suffix}"}
-                if hasattr(rcell, "settings"):
-                    netlist_dict.update(
-                        settings=rcell.settings.model_dump(exclude_none=True)
-                    )
-                if hasattr(rcell, "info"):
-                    netlist_dict.update(info=rcell.info.model_dump(exclude_none=True))
-                netlist["instances"][inst_name] = netlist_dict
+                netlist["instances"][inst_name] = dict(netlist_dict)
 
+    cache[component_name] = all_netlists
     return all_netlists
 
 
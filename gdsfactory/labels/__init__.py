@@ -13,6 +13,7 @@ from gdsfactory.labels.write_labels import (
     write_labels,
 )
 from gdsfactory.labels.write_test_manifest import (
+    iter_test_manifest,
     write_test_manifest,
 )
 
@@ -23,6 +24,7 @@ __all__ = [
     "find_labels",
     "get_test_manifest",
     "ignore",
+    "iter_test_manifest",
     "prefix_to_type_default",
     "write_labels",
     "write_test_manifest",
@@ -1,13 +1,215 @@
 """Converts CSV of test site labels into a CSV test manifest."""
 
+from __future__ import annotations
+
 import csv
 import json
+import multiprocessing
 import pathlib
+import shutil
+import tempfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import kfactory as kf
 
 import gdsfactory as gf
 from gdsfactory.samples.sample_reticle import sample_reticle
 from gdsfactory.typings import Iterable
 
+columns = ("cell", "x", "y", "info", "ports", "analysis", "analysis_parameters")
+
+# component shared with forked worker processes
+_component: gf.Component | None = None
+
+
+def _get_targets(component: gf.Component, search_strings: Sequence[str]) -> set[int]:
+    """Returns the indices of the cells matching search_strings below component."""
+    it = component._kdb_cell.begin_instances_rec()
+    it.targets = "{" + ",".join(search_strings) + "}"
+    return set(it.targets)
+
+
+def _get_shards(component: gf.Component) -> list[int]:
+    """Returns the cell indices of the top-level sub-cells of component."""
+    return list(component.each_child_cell())
+
+
+def _each_instance(
+    component: gf.Component, targets: set[int], shards: Iterable[int] | None = None
+) -> Iterator[tuple[int, kf.kdb.ICplxTrans]]:
+    """Yields cell index and transformation of the instances of targets, by shard."""
+    if not targets:
+        return
+    layout = component._kdb_cell.layout()
+    instances: dict[int, list[kf.kdb.Instance]] = {}
+    for inst in component._kdb_cell.each_inst():
+        instances.setdefault(inst.cell_index, []).append(inst)
+
+    for shard in _get_shards(component) if shards is None else shards:
+        # instances of targets below the shard, relative to the shard
+        it = layout.cell(shard).begin_instances_rec()
+        it.targets = sorted(targets)
+        subtree = [
+            (_it.inst_cell().cell_index(), _it.trans() * _it.inst_trans())
+            for _it in it.each()
+        ]
+        for inst in instances.get(shard, []):
+            for trans in inst.cell_inst.each_cplx_trans():
+                if shard in targets:
+                    yield shard, trans
+                for cell_index, sub_trans in subtree:
+                    yield cell_index, trans * sub_trans
+
+
+def iter_test_manifest(
+    component: gf.Component,
+    search_strings: Iterable[str] | None = None,
+    analysis: str = "[power_envelope]",
+    analysis_parameters: str = '[{"n": 10, "wvl_of_interest_nm": 1550}]',
+    batch_size: int = 10000,
+    shards: Iterable[int] | None = None,
+) -> Iterator[list[list[Any]]]:
+    """Yields the rows of the test manifest in batches of at most batch_size rows.
+
+    Rows are grouped by top-level sub-cell (shard).
+    The info and ports of each cell are serialized once per unique cell,
+    each instance only transforms the port positions.
+
+    Args:
+        component: the component to write the test manifest for.
+        search_strings: the search_strings of the cells to include in the test manifest.
+            If None, all cells one level below top cell are included.
+        analysis: list of analysis to run on the cells.
+        analysis_parameters: list of parameters to use for the analysis.
+        batch_size: maximum number of rows of each batch.
+        shards: cell indices of the top-level sub-cells to include. Defaults to all.
+    """
+    c = component
+    kcl = c.kcl
+    layout = c._kdb_cell.layout()
+    dbu = layout.dbu
+    search_strings = list(search_strings or [])
+    if not search_strings:
+        search_strings = [kcl[cell_index].name for cell_index in c.each_child_cell()]
+    targets = _get_targets(c, search_strings) if search_strings else set()
+
+    cells: dict[int, tuple[str, str, list[Any]]] = {}
+
+    def get_cell(cell_index: int) -> tuple[str, str, list[Any]]:
+        """Returns name, info JSON and port templates of a cell."""
+        if cell_index not in cells:
+            _c = kcl[cell_index]
+            ports = []
+            for p in _c.ports:
+                ports.append((p.name, gf.port.to_dict(p), p._trans, p))
+            cells[cell_index] = (_c.name, json.dumps(_c.info.model_dump()), ports)
+        return cells[cell_index]
+
+    def get_row(cell_index: int, trans: kf.kdb.ICplxTrans) -> list[Any]:
+        name, info, cell_ports = get_cell(cell_index)
+        ports = {}
+        for port_name, template, port_trans, p in cell_ports:
+            if port_trans is not None and not trans.is_complex():
+                dtrans = kf.kdb.DCplxTrans((trans.s_trans() * port_trans).to_dtype(dbu))
+                disp = dtrans.disp
+                ports[port_name] = template | {
+                    "center": (disp.x, disp.y),
+                    "orientation": dtrans.angle,
+                }
+            else:
+                ports[port_name] = gf.port.to_dict(
+                    p.copy(trans=kf.kdb.DCplxTrans(trans, dbu))
+                )
+        disp = trans.disp
+        return [
+            name,
+            disp.x,
+            disp.y,
+            info,
+            json.dumps(ports),
+            analysis,
+            analysis_parameters,
+        ]
+
+    batch: list[list[Any]] = []
+    for cell_index, trans in _each_instance(c, targets, shards):
+        batch.append(get_row(cell_index, trans))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _write_batches(
+    batches: Iterable[list[list[Any]]],
+    path: pathlib.Path,
+    header: bool = True,
+) -> None:
+    """Writes batches of rows to a CSV or Parquet (.parquet suffix) file."""
+    if path.suffix != ".parquet":
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            if header:
+                writer.writerow(columns)
+            for batch in batches:
+                writer.writerows(batch)
+        return
+
+    pa, pq = _import_pyarrow()
+    schema = pa.schema(
+        [(name, pa.int64() if name in ("x", "y") else pa.string()) for name in columns]
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            # columnar record batch
+            arrays = [
+                pa.array(column, type=field.type)
+                for column, field in zip(zip(*batch), schema)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except Exception as e:
+        raise ImportError(
+            "To write Parquet test manifests you need pyarrow, "
+            "please install it with `pip install pyarrow`"
+        ) from e
+    return pa, pq
+
+
+def _write_shards(
+    path: pathlib.Path, shards: list[int], header: bool, **kwargs: Any
+) -> pathlib.Path:
+    """Writes the manifest rows of shards of the forked component to path."""
+    assert _component is not None
+    _write_batches(
+        iter_test_manifest(_component, shards=shards, **kwargs), path, header
+    )
+    return path
+
+
+def _merge_parts(parts: list[pathlib.Path], path: pathlib.Path) -> None:
+    """Concatenates the part files written by the worker processes."""
+    if path.suffix != ".parquet":
+        with open(path, "wb") as f:
+            for part in parts:
+                with open(part, "rb") as fpart:
+                    shutil.copyfileobj(fpart, f)
+        return
+
+    _, pq = _import_pyarrow()
+    with pq.ParquetWriter(path, pq.read_schema(parts[0])) as writer:
+        for part in parts:
+            for record_batch in pq.ParquetFile(part).iter_batches():
+                writer.write_batch(record_batch)
+
 
 def write_test_manifest(
     component: gf.Component,
@@ -15,59 +217,70 @@ def write_test_manifest(
     search_strings: Iterable[str] | None = None,
     analysis: str = "[power_envelope]",
     analysis_parameters: str = '[{"n": 10, "wvl_of_interest_nm": 1550}]',
+    batch_size: int = 10000,
+    max_workers: int | None = 1,
 ) -> None:
     """Converts CSV of test site labels into a CSV test manifest.
 
+    Rows are written in batches, so memory does not grow with the number of instances.
+    With max_workers > 1 the top-level sub-cells are split into shards written
+    by forked worker processes, and the parts are concatenated in order.
+
     Args:
         component: the component to write the test manifest for.
-        csvpath: the path to the CSV file to write.
+        csvpath: the path to the CSV file to write. Writes Parquet for a .parquet suffix.
         search_strings: the search_strings of the cells to include in the test manifest.
             If None, all cells one level below top cell are included.
         analysis: list of analysis to run on the cells.
         analysis_parameters: list of parameters to use for the analysis.
+        batch_size: number of rows written at once.
+        max_workers: number of processes. None defaults to the number of cores.
+            Needs the fork start method, otherwise runs in the current process.
     """
-    search_strings = search_strings or []
-    search_strings = list(search_strings)
-    c = component
+    global _component
+    from gdsfactory.config import get_number_of_cores
 
-    if not search_strings:
-        for cell_index in c.each_child_cell():
-            ci = c.kcl[cell_index]
-            search_strings.append(ci.name)
-
-    with open(csvpath, "w") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "cell",
-                "x",
-                "y",
-                "info",
-                "ports",
-                "analysis",
-                "analysis_parameters",
+    csvpath = pathlib.Path(csvpath)
+    kwargs = dict(
+        search_strings=search_strings,
+        analysis=analysis,
+        analysis_parameters=analysis_parameters,
+        batch_size=batch_size,
+    )
+    shards = _get_shards(component)
+    max_workers = min(max_workers or get_number_of_cores(), len(shards))
+    if "fork" not in multiprocessing.get_all_start_methods():
+        max_workers = 1
+
+    if max_workers <= 1:
+        _write_batches(iter_test_manifest(component, **kwargs), csvpath)
+        return
+
+    n = min(4 * max_workers, len(shards))
+    chunks = [
+        shards[i * len(shards) // n : (i + 1) * len(shards) // n] for i in range(n)
+    ]
+    _component = component
+    try:
+        with (
+            tempfile.TemporaryDirectory() as dirpath,
+            ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+            ) as executor,
+        ):
+            futures = [
+                executor.submit(
+                    _write_shards,
+                    pathlib.Path(dirpath) / f"part{i}{csvpath.suffix}",
+                    chunk,
+                    header=i == 0,
+                    **kwargs,
+                )
+                for i, chunk in enumerate(chunks)
             ]
-        )
-
-        ci = c._kdb_cell.begin_instances_rec()
-        ci.targets = "{" + ",".join(search_strings) + "}"
-        for _ci in ci.each():
-            _c = c.kcl[_ci.inst_cell().cell_index()]
-            disp = (_ci.trans() * _ci.inst_trans()).disp
-            dtrans = _ci.dtrans() * _ci.inst_dtrans()
-            ports = {p.name: gf.port.to_dict(p.copy(trans=dtrans)) for p in _c.ports}
-
-            writer.writerow(
-                [
-                    _c.name,
-                    disp.x,
-                    disp.y,
-                    json.dumps(_c.info.model_dump()),
-                    json.dumps(ports),
-                    analysis,
-                    analysis_parameters,
-                ]
-            )
+            _merge_parts([future.result() for future in futures], csvpath)
+    finally:
+        _component = None
 
 
 if __name__ == "__main__":
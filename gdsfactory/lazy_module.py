@@ -0,0 +1,58 @@
+"""Module type that imports the attributes of a package on first access."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Package that imports its lazy submodules and attributes on first access.
+
+    The package defines `_lazy_modules`, mapping attribute names to modules, and
+    `_lazy_attributes`, mapping attribute names to the module that defines them.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        """Imports a lazy submodule or attribute."""
+        lazy_modules = self.__dict__.get("_lazy_modules", {})
+        lazy_attributes = self.__dict__.get("_lazy_attributes", {})
+        if name in lazy_modules:
+            value = importlib.import_module(lazy_modules[name])
+        elif name in lazy_attributes:
+            value = getattr(importlib.import_module(lazy_attributes[name]), name)
+        else:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute, except submodules named like a lazy attribute.
+
+        Importing a submodule binds it on the package, which must not shadow the
+        function of the same name (gf.pack, gf.read.from_yaml ...).
+        """
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get(
+            "_lazy_attributes", {}
+        ):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> list[str]:
+        """Returns the names of the attributes, including the lazy ones."""
+        return sorted(set(self.__dict__) | set(self.__dict__.get("__all__", ())))
+
+
+def make_lazy(name: str) -> None:
+    """Turns the imported module `name` into a LazyModule.
+
+    Args:
+        name: of the module, usually `__name__`.
+    """
+    module = sys.modules[name]
+    for attribute in module.__dict__.get("_lazy_attributes", {}):
+        if isinstance(module.__dict__.get(attribute), types.ModuleType):
+            del module.__dict__[attribute]
+    module.__class__ = LazyModule
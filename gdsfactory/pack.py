@@ -6,9 +6,11 @@ Adapted from PHIDL https://github.com/amccaugh/phidl/ by Adam McCaughan
 from __future__ import annotations
 
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 
 import gdsfactory as gf
 from gdsfactory.component import Component
@@ -16,18 +18,62 @@ from gdsfactory.snap import snap_to_grid
 from gdsfactory.typings import Anchor, ComponentSpec, Float2, Number
 
 
+def _pack_bins(
+    rects: list[tuple[int, int, int]],
+    bin_size: tuple[float, float],
+    sort_by_area: bool,
+    rotation: bool,
+    count: float = 1,
+) -> list[dict[int, tuple[int, int, int, int]]]:
+    """Packs rectangles [(id, w, h)] into bins of bin_size.
+
+    A single bin stops at the first rectangle that does not fit,
+    so bins that are too small are rejected quickly.
+
+    Returns:
+        list of packed rectangles dicts {id: (x, y, w, h)}, one per bin.
+    """
+    import rectpack
+
+    if count == 1:
+        if sort_by_area:
+            rects = sorted(rects, key=lambda r: r[1] * r[2], reverse=True)
+        packer_bin = rectpack.MaxRectsBlsf(*bin_size, rot=rotation)
+        for rid, w, h in rects:
+            if packer_bin.add_rect(w, h, rid) is None:
+                break
+        return [{r.rid: (r.x, r.y, r.width, r.height) for r in packer_bin}]
+
+    rect_packer = rectpack.newPacker(
+        mode=rectpack.PackingMode.Offline,
+        pack_algo=rectpack.MaxRectsBlsf,
+        sort_algo=rectpack.SORT_AREA if sort_by_area else rectpack.SORT_NONE,
+        bin_algo=rectpack.PackingBin.BBF,
+        rotation=rotation,
+    )
+    for rid, w, h in rects:
+        rect_packer.add_rect(width=w, height=h, rid=rid)
+    rect_packer.add_bin(width=bin_size[0], height=bin_size[1], count=count)
+    rect_packer.pack()
+    return [{r.rid: (r.x, r.y, r.width, r.height) for r in b} for b in rect_packer]
+
+
 def _pack_single_bin(
     rect_dict: dict[int, tuple[Number, Number]],
     aspect_ratio: tuple[Number, Number],
     max_size: tuple[float, float],
     sort_by_area: bool,
     density: float,
+    rotation: bool = False,
+    max_workers: int | None = 1,
 ) -> tuple[dict[int, tuple[Number, Number, Number, Number]], dict[Any, Any]]:
     """Packs a dict of rectangles {id:(w,h)} and tries to.
 
-    Pack it into a bin as small as possible with aspect ratio `aspect_ratio`
-    Will iteratively grow the bin size until everything fits or the bin size
-    reaches `max_size`.
+    Pack it into a bin as small as possible with aspect ratio `aspect_ratio`.
+    The candidate bin sizes grow by `density` from the total area of the rectangles
+    up to `max_size`. The smallest candidate that fits everything is found with an
+    exponential search followed by bisection, so only ~2 log2(candidates) packings
+    are computed, most of them on bins that are too small and fail quickly.
 
     Args:
         rect_dict: dict of rectangles {id: (w, h)} to pack.
@@ -35,56 +81,161 @@ def _pack_single_bin(
         max_size: tuple of max X, Y size.
         sort_by_area: sorts components by area.
         density: of packing, closer to 1 packs tighter (more compute heavy).
+        rotation: allows rotating rectangles by 90 degrees.
+        max_workers: number of processes that try candidate sizes in parallel.
+            None defaults to the number of cores.
 
     Returns:
         packed rectangles dict {id:(x,y,w,h)}. dict of remaining unpacked rectangles.
 
     """
-    import rectpack
+    from gdsfactory.config import get_number_of_cores
+
+    rects = [(rid, r[0], r[1]) for rid, r in rect_dict.items()]
+    sizes = np.array([r[1:] for r in rects], dtype=np.float64).reshape(-1, 2)
+    max_size = np.asarray(max_size, dtype=np.float64)
 
     # Compute total area and use it for an initial estimate of the bin size
-    total_area = sum(r[0] * r[1] for r in rect_dict.values())
+    total_area = np.prod(sizes, axis=1).sum()
     aspect_ratio = np.asarray(aspect_ratio) / np.linalg.norm(aspect_ratio)  # Normalize
+    box_size = aspect_ratio * np.sqrt(total_area)
+
+    # a single row (or column) of all rectangles always fits
+    scale_max = max(
+        min(
+            max(sizes[:, 0].sum() / box_size[0], sizes[:, 1].max() / box_size[1]),
+            max(sizes[:, 0].max() / box_size[0], sizes[:, 1].sum() / box_size[1]),
+        ),
+        1,
+    )
+    scale_max = min(scale_max, max(max_size / box_size))
+    n = max(int(np.ceil(np.log(scale_max) / np.log(density))), 0)
+    scales = [density**k for k in range(n)] + [scale_max]
+    # rounding up avoids float errors on bins that fit the rectangles exactly
+    candidates = [np.clip(np.ceil(box_size * s), None, max_size) for s in scales]
+
+    results: dict[int, dict[int, tuple[int, int, int, int]]] = {}
+
+    def try_sizes(indices: list[int]) -> None:
+        args = [(rects, candidates[k], sort_by_area, rotation) for k in indices]
+        if workers <= 1 or len(indices) == 1:
+            bins = [_pack_bins(*arg) for arg in args]
+        else:
+            bins = list(executor.map(_pack_bins, *zip(*args)))
+        for k, b in zip(indices, bins):
+            results[k] = b[0]
+
+    def fits(k: int) -> bool:
+        return len(results[k]) == len(rects)
+
+    workers = min(max_workers or get_number_of_cores(), n + 1)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # lo does not fit and hi fits (or is the largest candidate)
+        lo, hi = -1, n
+        gallop = sorted({min(2**i - 1, n) for i in range(n.bit_length() + 2)})
+        for i in range(0, len(gallop), workers):
+            probes = gallop[i : i + workers]
+            try_sizes(probes)
+            fitting = [k for k in probes if fits(k)]
+            if fitting:
+                hi = fitting[0]
+                break
+        lo = max([k for k in results if k < hi and not fits(k)], default=-1)
+        if not fits(hi):
+            lo = hi
+
+        while hi - lo > 1:
+            probes = np.linspace(lo, hi, min(workers, hi - lo - 1) + 2)[1:-1]
+            probes = sorted({int(k) for k in np.round(probes)} - {lo, hi})
+            try_sizes(probes)
+            for k in probes:
+                if fits(k):
+                    hi = k
+                    break
+                lo = k
+    finally:
+        if executor:
+            executor.shutdown()
+
+    # Separate packed from unpacked rectangles
+    packed_rect_dict = results[hi]
+    unpacked_rect_dict = {
+        k: v for k, v in rect_dict.items() if k not in packed_rect_dict
+    }
+    return packed_rect_dict, unpacked_rect_dict
 
-    # Setup variables
-    box_size = np.asarray(aspect_ratio * np.sqrt(total_area), dtype=np.float64)
-    box_size = np.clip(box_size, None, max_size)
-    rp_sort = rectpack.SORT_AREA if sort_by_area else rectpack.SORT_NONE
-    # Repeatedly run the rectangle-packing algorithm with increasingly larger
-    # areas until everything fits or we've reached the maximum size
-    while True:
-        # Create the pack object
-        rect_packer = rectpack.newPacker(
-            mode=rectpack.PackingMode.Offline,
-            pack_algo=rectpack.MaxRectsBlsf,
-            sort_algo=rp_sort,
-            bin_algo=rectpack.PackingBin.BBF,
-            rotation=False,
-        )
-
-        # Add each rectangle to the pack, create a single bin, and pack
-        for rid, r in rect_dict.items():
-            rect_packer.add_rect(width=r[0], height=r[1], rid=rid)
-        rect_packer.add_bin(width=box_size[0], height=box_size[1])
-        rect_packer.pack()
 
-        # Adjust the box size for next time
-        box_size *= density  # Increase area to try to fit
-        box_size = np.clip(box_size, None, max_size)
+def pack_rectangles(
+    sizes: npt.ArrayLike,
+    aspect_ratio: Float2 = (1.0, 1.0),
+    max_size: tuple[float | None, float | None] = (None, None),
+    sort_by_area: bool = True,
+    density: float = 1.1,
+    rotation: bool = False,
+    max_workers: int | None = 1,
+) -> list[dict[int, tuple[int, int, int, int]]]:
+    """Returns the placement of rectangles packed into as few bins as possible.
 
-        # Quit the loop if we've packed all the rectangles or reached the max size
-        if len(rect_packer.rect_list()) == len(rect_dict):
-            break
-        if all(box_size >= max_size):
-            break
+    Works on sizes only, so the rectangles can come from precomputed bounding boxes.
+    If the rectangles do not fit into a single bin of max_size, they are packed
+    into as many bins of max_size as needed in one pass,
+    and the last bin is shrunk to fit its rectangles when possible.
 
-    # Separate packed from unpacked rectangles, make dicts of form {id:(x,y,w,h)}
-    packed_rect_dict = {r[-1]: r[:-1] for r in rect_packer[0].rect_list()}
-    unpacked_rect_dict = {
-        k: v for k, v in rect_dict.items() if k not in packed_rect_dict
-    }
+    Args:
+        sizes: (N, 2) integer array with the width and height of each rectangle.
+        aspect_ratio: (width, height) ratio of the rectangular bin.
+        max_size: Limits the size of each bin.
+        sort_by_area: Pre-sorts the rectangles by area.
+        density: Values closer to 1 pack tighter but require more computation.
+        rotation: allows rotating rectangles by 90 degrees.
+        max_workers: number of processes that try bin sizes in parallel.
+            None defaults to the number of cores.
 
-    return packed_rect_dict, unpacked_rect_dict
+    Returns:
+        list of bins {index: (x, y, w, h)} with the index of the rectangle in sizes.
+            w and h are swapped for rotated rectangles.
+    """
+    if density < 1.01:
+        raise ValueError(
+            "pack() `density` argument is too small. "
+            "The density argument must be >= 1.01"
+        )
+    sizes = np.asarray(sizes, dtype=np.int64).reshape(-1, 2)
+    max_size = np.array([np.inf if v is None else v for v in max_size])
+    too_large = np.flatnonzero((sizes > max_size).any(axis=1))
+    if len(too_large):
+        raise ValueError(
+            f"pack() failed because rectangles {too_large.tolist()} have x or y "
+            f"dimension larger than {max_size=} and cannot be packed."
+        )
+    rect_dict = {n: (int(w), int(h)) for n, (w, h) in enumerate(sizes)}
+    if not rect_dict:
+        return []
+
+    kwargs = dict(
+        aspect_ratio=aspect_ratio,
+        max_size=max_size,
+        sort_by_area=sort_by_area,
+        density=density,
+        rotation=rotation,
+        max_workers=max_workers,
+    )
+    packed_rect_dict, rect_dict = _pack_single_bin(rect_dict, **kwargs)
+    if not rect_dict:
+        return [packed_rect_dict]
+
+    # fill bins of max_size in one pass, then shrink the last one
+    rects = [(rid, w, h) for rid, (w, h) in enumerate(sizes.tolist())]
+    bins = _pack_bins(
+        rects, max_size, sort_by_area, rotation=rotation, count=float("inf")
+    )
+    last = {rid: tuple(sizes[rid]) for rid in bins[-1]}
+    packed_rect_dict, rect_dict = _pack_single_bin(last, **kwargs)
+    if rect_dict:
+        # the shrunk bin with aspect_ratio does not fit them all, keep the full bin
+        return bins
+    return bins[:-1] + [packed_rect_dict]
 
 
 def pack(
@@ -107,6 +258,9 @@ def pack(
     v_mirror: bool = False,
     add_ports_prefix: bool = True,
     add_ports_suffix: bool = False,
+    allow_rotation: bool = False,
+    sizes: npt.ArrayLike | None = None,
+    max_workers: int | None = 1,
 ) -> list[Component]:
     """Pack a list of components into as few Components as possible.
 
@@ -131,6 +285,12 @@ def pack(
         v_mirror: vertical mirror using x axis (1, y) (0, y).
         add_ports_prefix: adds port names with prefix.
         add_ports_suffix: adds port names with suffix.
+        allow_rotation: allows rotating components by 90 degrees to pack tighter.
+        sizes: optional precomputed (N, 2) array with the (xsize, ysize) of each
+            component. Avoids building the components to compute their sizes,
+            so each component is only built when placed.
+        max_workers: number of processes that try bin sizes in parallel.
+            None defaults to the number of cores.
 
     .. plot::
         :include-source:
@@ -164,32 +324,35 @@ def pack(
     max_size = np.asarray(max_size, dtype=np.float64)  # In case it's integers
     max_size = max_size / precision
 
-    component_list = [gf.get_component(component) for component in component_list]
+    if sizes is None:
+        component_list = [gf.get_component(component) for component in component_list]
+        sizes = [(c.dxsize, c.dysize) for c in component_list]
+    else:
+        component_list = list(component_list)
+    sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 2)
+    if len(sizes) != len(component_list):
+        raise ValueError(f"{len(sizes)=} != {len(component_list)=}")
 
     # Convert Components to rectangles
-    rect_dict = {}
-    for n, D in enumerate(component_list):
-        size = np.array([D.dxsize, D.dysize])
-        w, h = (size + spacing) / precision
-        w, h = int(w), int(h)
+    rects = ((sizes + spacing) / precision).astype(np.int64)
+    for n, (w, h) in enumerate(rects):
         if (w > max_size[0]) or (h > max_size[1]):
+            name = getattr(component_list[n], "name", component_list[n])
             raise ValueError(
-                f"pack() failed because Component {D.name!r} has x or y "
+                f"pack() failed because Component {name!r} has x or y "
                 "dimension larger than `max_size` and cannot be packed.\n"
-                f"size = {w*precision, h*precision}, max_size = {max_size*precision}"
+                f"size = {w * precision, h * precision}, max_size = {max_size * precision}"
             )
-        rect_dict[n] = (w, h)
-
-    packed_list = []
-    while rect_dict:
-        (packed_rect_dict, rect_dict) = _pack_single_bin(
-            rect_dict,
-            aspect_ratio=aspect_ratio,
-            max_size=max_size,
-            sort_by_area=sort_by_area,
-            density=density,
-        )
-        packed_list.append(packed_rect_dict)
+
+    packed_list = pack_rectangles(
+        rects,
+        aspect_ratio=aspect_ratio,
+        max_size=tuple(max_size),
+        sort_by_area=sort_by_area,
+        density=density,
+        rotation=allow_rotation,
+        max_workers=max_workers,
+    )
 
     components_packed_list = []
     index = 0
@@ -199,10 +362,12 @@ def pack(
             x, y, w, h = rect
             xcenter = x + w / 2 + spacing / 2
             ycenter = y + h / 2 + spacing / 2
-            component = component_list[n]
+            component = gf.get_component(component_list[n])
             d = (
                 packed << component
             )  # ref(rotation=rotation, h_mirror=h_mirror, v_mirror=v_mirror)
+            if w != rects[n][0]:
+                d.drotate(90)
             if rotation:
                 d.drotate(rotation)
             if h_mirror:
@@ -8,12 +8,15 @@ Adapted from PHIDL https://github.com/amccaugh/phidl/ by Adam McCaughan
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import math
 import warnings
-from collections.abc import Callable
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
 
+import kfactory as kf
 import numpy as np
 from numpy import mod, pi
 
@@ -25,16 +28,20 @@ from gdsfactory.component_layout import (
     _reflect_points,
     _rotate_points,
 )
+from gdsfactory.config import CONF
 from gdsfactory.cross_section import CrossSection, Section, Transition
 from gdsfactory.typings import (
     ComponentSpec,
     Coordinates,
     CrossSectionSpec,
     Float2,
+    Floats,
     LayerSpec,
     WidthTypes,
 )
 
+T = TypeVar("T")
+
 
 def _simplify(points, tolerance):
     import shapely.geometry as sg
@@ -44,6 +51,59 @@ def _simplify(points, tolerance):
     return np.asarray(ls_simple.coords)
 
 
+def _offset_curves(
+    points: np.ndarray,
+    offsets,
+    start_angle: float | None,
+    end_angle: float | None,
+) -> np.ndarray:
+    """Returns the centerpoint offset curves of points for several offsets.
+
+    The tangents and miter factors of the path are computed once
+    and broadcast over all offsets.
+
+    Args:
+        points: array-like[N][2] The points to be offset.
+        offsets: array-like[S] or [S][N] The distances to offset the points.
+        start_angle: float or None The angle at the start of the path.
+        end_angle: float or None The angle at the end of the path.
+
+    Returns:
+        array[S][N][2] with one offset curve per offset.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    offsets = np.asarray(offsets)
+    if offsets.ndim == 1:
+        offsets = offsets[:, None]
+
+    dx = np.diff(points[:, 0])
+    dy = np.diff(points[:, 1])
+    theta = np.arctan2(dy, dx)
+    theta = np.concatenate([theta[:1], theta, theta[-1:]])
+    theta_mid = (np.pi + theta[1:] + theta[:-1]) / 2  # Mean angle between segments
+    dtheta_int = np.pi + theta[:-1] - theta[1:]  # Internal angle between segments
+    offset_distance = offsets / np.sin(dtheta_int / 2)
+    offset_distance = np.broadcast_to(
+        offset_distance, (offset_distance.shape[0], points.shape[0])
+    )
+
+    new_points = np.empty((*offset_distance.shape, 2))
+    new_points[..., 0] = points[:, 0] - offset_distance * np.cos(theta_mid)
+    new_points[..., 1] = points[:, 1] - offset_distance * np.sin(theta_mid)
+
+    if start_angle is not None:
+        start_angle_rad = start_angle * np.pi / 180
+        distance = offset_distance[:, 0]
+        new_points[:, 0, 0] = points[0, 0] + np.sin(start_angle_rad) * distance
+        new_points[:, 0, 1] = points[0, 1] + -np.cos(start_angle_rad) * distance
+    if end_angle is not None:
+        end_angle_rad = end_angle * np.pi / 180
+        distance = offset_distance[:, -1]
+        new_points[:, -1, 0] = points[-1, 0] + np.sin(end_angle_rad) * distance
+        new_points[:, -1, 1] = points[-1, 1] + -np.cos(end_angle_rad) * distance
+    return new_points
+
+
 class Path(_GeometryHelper):
     """You can extrude a Path with a CrossSection to create a Component.
 
@@ -304,37 +364,12 @@ class Path(_GeometryHelper):
             end_angle: float or None The angle at the end of the path.
 
         """
-        new_points = np.array(points, dtype=np.float64)
-        dx = np.diff(points[:, 0])
-        dy = np.diff(points[:, 1])
-        theta = np.arctan2(dy, dx)
-        theta = np.concatenate([theta[:1], theta, theta[-1:]])
-        theta_mid = (np.pi + theta[1:] + theta[:-1]) / 2  # Mean angle between segments
-        dtheta_int = np.pi + theta[:-1] - theta[1:]  # Internal angle between segments
-        offset_distance = np.array(offset_distance) / np.sin(dtheta_int / 2)
-
-        # Ensure offset_distance has the correct shape
-        if offset_distance.ndim == 0:
-            offset_distance = np.full(points.shape[0], offset_distance)
-        elif offset_distance.ndim == 1 and offset_distance.size == 1:
-            offset_distance = np.full(points.shape[0], offset_distance[0])
-
-        new_points[:, 0] -= offset_distance * np.cos(theta_mid)
-        new_points[:, 1] -= offset_distance * np.sin(theta_mid)
-
-        if start_angle is not None:
-            start_angle_rad = start_angle * np.pi / 180
-            new_points[0, :] = points[0, :] + (
-                np.sin(start_angle_rad) * offset_distance[0],
-                -np.cos(start_angle_rad) * offset_distance[0],
-            )
-        if end_angle is not None:
-            end_angle_rad = end_angle * np.pi / 180
-            new_points[-1, :] = points[-1, :] + (
-                np.sin(end_angle_rad) * offset_distance[-1],
-                -np.cos(end_angle_rad) * offset_distance[-1],
-            )
-        return new_points
+        return _offset_curves(
+            points,
+            np.reshape(offset_distance, (1, -1)),
+            start_angle=start_angle,
+            end_angle=end_angle,
+        )[0]
 
     def _parametric_offset_curve(
         self, points, offset_distance: float, start_angle: float, end_angle: float
@@ -702,6 +737,8 @@ def along_path(
     Places as many copies of `component` along each segment of `p` as possible
     under the given constraints. `spacing` is always followed precisely, but
     actual `padding` may exceed the provided value to place components evenly.
+    The copies along each straight segment of `p` are placed as a single array
+    instance when their pitch is on the grid.
 
     Args:
         p: Path to place components along.
@@ -715,40 +752,52 @@ def along_path(
     component = get_component(component)
 
     length = p.length()
-    number = (length - 2 * padding) // spacing + 1
+    number = int(max((length - 2 * padding) // spacing + 1, 0))
 
     c = Component()
 
-    cum_dist = 0
-    next_component = (length - (number - 1) * spacing) / 2
-    stop = length - next_component
-
-    # Prepare in advance the rotation angle for each segment
-    angle_list = [
-        np.rad2deg(
-            np.arctan2(
-                (p.points[i + 1] - p.points[i])[1], (p.points[i + 1] - p.points[i])[0]
+    points = np.asarray(p.points, dtype=np.float64)
+    segments = np.diff(points, axis=0)
+    lengths = np.linalg.norm(segments, axis=1)
+    nonzero = lengths > 0
+    starts = points[:-1][nonzero]
+    segments = segments[nonzero]
+    lengths = lengths[nonzero]
+    if number == 0 or len(lengths) == 0:
+        return c
+
+    # arc length of every placement and of the start of every segment
+    first = (length - (number - 1) * spacing) / 2
+    distances = first + spacing * np.arange(number)
+    cum_dist = np.concatenate([[0], np.cumsum(lengths)])
+
+    # a placement at a segment end belongs to the segment that ends there
+    index = np.searchsorted(cum_dist[1:], distances, side="left")
+    index = np.minimum(index, len(lengths) - 1)
+    unit_vectors = segments / lengths[:, None]
+    angles = np.rad2deg(np.arctan2(segments[:, 1], segments[:, 0]))
+    offsets = (distances - cum_dist[index])[:, None] * unit_vectors[index]
+    positions = starts[index] + offsets
+
+    # the placements along one segment are collinear with the same rotation,
+    # so they are one array instance if the array pitch is on the grid
+    dbu = c.kcl.dbu
+    segment_indexes, first_placements, counts = np.unique(
+        index, return_index=True, return_counts=True
+    )
+    for i, j, count in zip(segment_indexes, first_placements, counts):
+        pitch = spacing * unit_vectors[i] / dbu
+        on_grid = np.allclose(pitch, np.round(pitch), rtol=0, atol=1e-6)
+        for k in [j] if on_grid else range(j, j + count):
+            trans = kf.kdb.DCplxTrans(1, angles[i], False, *positions[k])
+            c.create_inst(
+                component,
+                trans.to_itrans(dbu),
+                a=kf.kdb.Vector(*(int(x) for x in np.round(pitch))),
+                b=kf.kdb.Vector(),
+                na=int(count) if on_grid else 1,
+                nb=1,
             )
-        )
-        for i in range(len(p.points) - 1)
-    ]
-
-    for i, start_pt in enumerate(p.points[:-1]):
-        end_pt = p.points[i + 1]
-        segment_vector = end_pt - start_pt
-        segment_length = np.linalg.norm(segment_vector)
-        unit_vector = segment_vector / segment_length
-
-        # Get the pre-calculated angle for this segment
-        angle = angle_list[i]
-
-        while next_component <= cum_dist + segment_length and next_component <= stop:
-            added_dist = next_component - cum_dist
-            offset = added_dist * unit_vector
-            component_ref = c << component
-            component_ref.drotate(angle).dmove(start_pt + offset)
-            next_component += spacing
-        cum_dist += segment_length
 
     return c
 
@@ -767,6 +816,74 @@ def _get_named_sections(sections: tuple[Section, ...]) -> dict[str, Section]:
     return named_sections
 
 
+class ExtrusionCache:
+    """Least recently used memo of the polygons and ports of extruded paths.
+
+    Extruding the same path with the same cross_section reuses the polygons
+    instead of computing them again. Entries are keyed on the geometry hash of
+    the path, the cross_section, simplify and the active PDK.
+
+    Args:
+        maxsize: maximum number of extrusions. Defaults to CONF.extrude_cache_maxsize.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        """Creates an empty cache."""
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return CONF.extrude_cache_maxsize or 0
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Returns the cached value of key, calling build on a miss."""
+        try:
+            hash(key)
+        except TypeError:  # for example cross_sections defined by dicts
+            self.misses += 1
+            return build()
+
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        self.misses += 1
+        value = build()
+        if self.maxsize > 0:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def __len__(self) -> int:
+        """Returns the number of cached extrusions."""
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Forgets all extrusions."""
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self),
+            maxsize=self.maxsize,
+        )
+
+
+extrusion_cache = ExtrusionCache()
+
+
 def extrude(
     p: Path,
     cross_section: CrossSectionSpec | None = None,
@@ -791,6 +908,7 @@ def extrude(
         all_angle: if True, the bend is drawn with a single euler curve.
     """
     from gdsfactory.pdk import (
+        get_active_pdk,
         get_cross_section,
         get_layer,
     )
@@ -812,7 +930,6 @@ def extrude(
         )
         cross_section = CrossSection(sections=(s,))
 
-    xsection_points = []
     c = ComponentAllAngle() if all_angle else Component()
     x = get_cross_section(cross_section)
 
@@ -824,8 +941,85 @@ def extrude(
     layer = layer or x.layer
     layer = get_layer(layer)
 
-    for section in x.sections:
-        p_sec = p.copy()
+    if isinstance(simplify, bool):
+        raise ValueError("simplify argument must be a number (e.g. 1e-3) or None")
+
+    polygons, ports, (points, start_angle, end_angle) = extrusion_cache.get(
+        (p.hash_geometry(precision=1e-6), x, simplify, get_active_pdk().name),
+        lambda: _extrude_sections(p, x, simplify),
+    )
+
+    for layer_index, layer_polygons in polygons.items():
+        shapes = c.shapes(layer_index)
+        for polygon in layer_polygons:
+            shapes.insert(polygon)
+    for port in ports:
+        c.add_port(**port)
+
+    c.info["length"] = float(np.round(p.length(), 3))
+
+    for via in x.components_along_path:
+        if via.offset:
+            points_offset = p._centerpoint_offset_curve(
+                points,
+                offset_distance=via.offset,
+                start_angle=start_angle,
+                end_angle=end_angle,
+            )
+            _p = Path(points_offset)
+        else:
+            _p = p
+        _ = c << along_path(
+            p=_p, component=via.component, spacing=via.spacing, padding=via.padding
+        )
+    return c
+
+
+def _extrude_sections(
+    p: Path, x: CrossSection, simplify: float | None
+) -> tuple[
+    dict[int, list[kf.kdb.DPolygon]],
+    list[dict[str, Any]],
+    tuple[np.ndarray, float, float],
+]:
+    """Returns the polygons by layer, the ports and the path of the last section.
+
+    Args:
+        p: path to extrude.
+        x: cross_section to extrude.
+        simplify: tolerance of the simplification of the polygons.
+    """
+    from gdsfactory.pdk import get_layer
+
+    # offset curves of the sections that follow the path, computed in one batch
+    batched = [
+        i
+        for i, section in enumerate(x.sections)
+        if (not section.insets or section.insets == (0, 0))
+        and not callable(section.offset_function)
+        and not callable(section.width_function)
+    ]
+    curves = {}
+    if batched:
+        offsets = []
+        for i in batched:
+            section = x.sections[i]
+            offsets += [
+                section.offset + section.width / 2,
+                section.offset - section.width / 2,
+            ]
+        batch = _offset_curves(
+            p.points, offsets, start_angle=p.start_angle, end_angle=p.end_angle
+        )
+        curves = {i: (batch[2 * j], batch[2 * j + 1]) for j, i in enumerate(batched)}
+
+    xsection_points = []
+    polygons: dict[int, list[kf.kdb.DPolygon]] = {}
+    ports: list[dict[str, Any]] = []
+    points, start_angle, end_angle = p.points, p.start_angle, p.end_angle
+
+    for i, section in enumerate(x.sections):
+        p_sec = p if i in curves else p.copy()
         port_names = section.port_names
         port_types = section.port_types
         hidden = section.hidden
@@ -966,24 +1160,25 @@ def extrude(
             lengths = np.cumsum(np.sqrt(dx**2 + dy**2))
             lengths = np.concatenate([[0], lengths])
             width = width_function(lengths / lengths[-1])
-        dy = offset + width / 2
+        if i in curves:
+            points1, points2 = curves[i]
+        else:
+            dy = offset + width / 2
 
-        points1 = p_sec._centerpoint_offset_curve(
-            points,
-            offset_distance=dy,
-            start_angle=start_angle,
-            end_angle=end_angle,
-        )
-        dy = offset - width / 2
+            points1 = p_sec._centerpoint_offset_curve(
+                points,
+                offset_distance=dy,
+                start_angle=start_angle,
+                end_angle=end_angle,
+            )
+            dy = offset - width / 2
 
-        points2 = p_sec._centerpoint_offset_curve(
-            points,
-            offset_distance=dy,
-            start_angle=start_angle,
-            end_angle=end_angle,
-        )
-        if isinstance(simplify, bool):
-            raise ValueError("simplify argument must be a number (e.g. 1e-3) or None")
+            points2 = p_sec._centerpoint_offset_curve(
+                points,
+                offset_distance=dy,
+                start_angle=start_angle,
+                end_angle=end_angle,
+            )
 
         with_simplify = section.simplify or simplify
 
@@ -995,7 +1190,9 @@ def extrude(
         points_poly = np.concatenate([points1, points2[::-1, :]])
 
         if not hidden and p_sec.length() > 1e-3:
-            c.add_polygon(points_poly, layer=layer)
+            polygon = kf.kdb.DPolygon()
+            polygon.assign_hull(points_poly.tolist())
+            polygons.setdefault(get_layer(layer), []).append(polygon)
 
         # Add port_names if they were specified
         if port_names[0] is not None:
@@ -1005,14 +1202,16 @@ def extrude(
             face = [points1[0], points2[0]]
             face = [_rotated_delta(point, center, port_orientation) for point in face]
 
-            c.add_port(
-                name=port_names[0],
-                layer=layer,
-                port_type=port_types[0],
-                width=port_width,
-                orientation=port_orientation,
-                center=center,
-                cross_section=x,
+            ports.append(
+                dict(
+                    name=port_names[0],
+                    layer=layer,
+                    port_type=port_types[0],
+                    width=port_width,
+                    orientation=port_orientation,
+                    center=center,
+                    cross_section=x,
+                )
             )
         if port_names[1] is not None:
             port_width = width if np.isscalar(width) else width[-1]
@@ -1021,32 +1220,46 @@ def extrude(
             face = [points1[-1], points2[-1]]
             face = [_rotated_delta(point, center, port_orientation) for point in face]
 
-            c.add_port(
-                name=port_names[1],
-                layer=layer,
-                port_type=port_types[1],
-                width=port_width,
-                center=center,
-                orientation=port_orientation,
-                cross_section=x,
+            ports.append(
+                dict(
+                    name=port_names[1],
+                    layer=layer,
+                    port_type=port_types[1],
+                    width=port_width,
+                    center=center,
+                    orientation=port_orientation,
+                    cross_section=x,
+                )
             )
 
-    c.info["length"] = float(np.round(p.length(), 3))
+    return polygons, ports, (points, start_angle, end_angle)
 
-    for via in x.components_along_path:
-        if via.offset:
-            points_offset = p._centerpoint_offset_curve(
-                points,
-                offset_distance=via.offset,
-                start_angle=start_angle,
-                end_angle=end_angle,
-            )
-            _p = Path(points_offset)
-        else:
-            _p = p
-        _ = c << along_path(
-            p=_p, component=via.component, spacing=via.spacing, padding=via.padding
+
+def _extrude_sections_loop(p: Path, cross_section: CrossSectionSpec) -> Component:
+    """Returns the sections of cross_section extruded one section at a time.
+
+    Reference for the batched offset curves of `extrude`.
+    """
+    from gdsfactory.pdk import get_cross_section
+
+    x = get_cross_section(cross_section)
+    c = Component()
+    for section in x.sections:
+        p_sec = p.copy()
+        points1 = p_sec._centerpoint_offset_curve(
+            p_sec.points,
+            offset_distance=section.offset + section.width / 2,
+            start_angle=p_sec.start_angle,
+            end_angle=p_sec.end_angle,
+        )
+        points2 = p_sec._centerpoint_offset_curve(
+            p_sec.points,
+            offset_distance=section.offset - section.width / 2,
+            start_angle=p_sec.start_angle,
+            end_angle=p_sec.end_angle,
         )
+        if not section.hidden:
+            c.add_polygon(np.concatenate([points1, points2[::-1]]), section.layer)
     return c
 
 
@@ -1060,9 +1273,35 @@ def extrude_transition(
         p: path to extrude.
         transition: transition to extrude along.
     """
-    from gdsfactory.pdk import get_cross_section, get_layer
+    from gdsfactory.pdk import get_active_pdk
 
     c = Component()
+    polygons, ports = extrusion_cache.get(
+        (p.hash_geometry(precision=1e-6), transition, None, get_active_pdk().name),
+        lambda: _extrude_transition_sections(p, transition),
+    )
+
+    for layer_index, layer_polygons in polygons.items():
+        shapes = c.shapes(layer_index)
+        for polygon in layer_polygons:
+            shapes.insert(polygon)
+    for port in ports:
+        c.add_port(**port)
+
+    c.info["length"] = float(np.round(p.length(), 3))
+    return c
+
+
+def _extrude_transition_sections(
+    p: Path, transition: Transition
+) -> tuple[dict[int, list[kf.kdb.DPolygon]], list[dict[str, Any]]]:
+    """Returns the polygons by layer and the ports of a path extruded along a transition.
+
+    Args:
+        p: path to extrude.
+        transition: transition to extrude along.
+    """
+    from gdsfactory.pdk import get_cross_section, get_layer
 
     x1 = get_cross_section(transition.cross_section1)
     x2 = get_cross_section(transition.cross_section2)
@@ -1081,6 +1320,9 @@ def extrude_transition(
             f"transition() found no common section names X1 {names1} and X2 {names2}"
         )
 
+    polygons: dict[int, list[kf.kdb.DPolygon]] = {}
+    ports: list[dict[str, Any]] = []
+
     for section_name in common_sections:
         section1 = named_sections1[section_name]
         section2 = named_sections2[section_name]
@@ -1167,7 +1409,9 @@ def extrude_transition(
 
         layers = layer if hidden else [layer, layer]
         if not hidden and p_sec.length() > 1e-3:
-            c.add_polygon(points_poly, layer=layer)
+            polygon = kf.kdb.DPolygon()
+            polygon.assign_hull(points_poly.tolist())
+            polygons.setdefault(layer, []).append(polygon)
 
         # Add port_names if they were specified
         if port_names[0] is not None:
@@ -1175,32 +1419,35 @@ def extrude_transition(
             port_orientation = (p_sec.start_angle + 180) % 360
             center = points[0]
 
-            c.add_port(
-                name=port_names[0],
-                layer=get_layer(layers[0]),
-                port_type=port_types[0],
-                width=port_width,
-                orientation=port_orientation,
-                center=center,
-                cross_section=x1,
+            ports.append(
+                dict(
+                    name=port_names[0],
+                    layer=get_layer(layers[0]),
+                    port_type=port_types[0],
+                    width=port_width,
+                    orientation=port_orientation,
+                    center=center,
+                    cross_section=x1,
+                )
             )
         if port_names[1] is not None:
             port_width = width2
             port_orientation = (p_sec.end_angle) % 360
             center = points[-1]
 
-            c.add_port(
-                name=port_names[1],
-                layer=get_layer(layers[1]),
-                port_type=port_types[1],
-                width=port_width,
-                center=center,
-                orientation=port_orientation,
-                cross_section=x2,
+            ports.append(
+                dict(
+                    name=port_names[1],
+                    layer=get_layer(layers[1]),
+                    port_type=port_types[1],
+                    width=port_width,
+                    center=center,
+                    orientation=port_orientation,
+                    cross_section=x2,
+                )
             )
 
-    c.info["length"] = float(np.round(p.length(), 3))
-    return c
+    return polygons, ports
 
 
 def _rotated_delta(
@@ -1346,6 +1593,79 @@ def _fresnel(R0, s, num_pts: int, n_iter: int = 8):
     return np.array([np.sqrt(2) * R0 * x, np.sqrt(2) * R0 * y])
 
 
+def _euler_npoints(
+    radius: float, angle: float, npoints: int | None, bend_points_distance: float
+) -> int:
+    """Returns the number of points of an euler bend with a positive angle."""
+    npoints = npoints or abs(int(angle / 360 * radius / bend_points_distance / 2))
+    return max(npoints, int(360 / angle) + 1)
+
+
+@functools.lru_cache(maxsize=256)
+def _euler_curve(
+    angle: float, p: float, npoints: int
+) -> tuple[np.ndarray, float, float]:
+    """Returns the read-only points, Reff and Rmin of an euler bend with Rmin = 1.
+
+    Bends only differ by a scale for the same angle, p and npoints,
+    so the normalized curve is computed once.
+
+    Args:
+        angle: positive total angle of the curve.
+        p: Proportion of the curve that is an Euler curve.
+        npoints: Number of points of the curve.
+    """
+    R0 = 1
+    alpha = np.radians(angle)
+    Rp = R0 / (np.sqrt(p * alpha))
+    sp = R0 * np.sqrt(p * alpha)
+    s0 = 2 * sp + Rp * alpha * (1 - p)
+
+    num_pts_euler = int(np.round(sp / (s0 / 2) * npoints))
+    num_pts_arc = npoints - num_pts_euler
+
+    # Ensure a minimum of 2 points for each euler/arc section
+    if npoints <= 2:
+        num_pts_euler = 0
+        num_pts_arc = 2
+
+    if num_pts_euler > 0:
+        xbend1, ybend1 = _fresnel(R0, sp, num_pts_euler)
+        xp, yp = xbend1[-1], ybend1[-1]
+        dx = xp - Rp * np.sin(p * alpha / 2)
+        dy = yp - Rp * (1 - np.cos(p * alpha / 2))
+    else:
+        xbend1 = ybend1 = np.asfarray([])
+        dx = 0
+        dy = 0
+
+    s = np.linspace(sp, s0 / 2, num_pts_arc)
+    xbend2 = Rp * np.sin((s - sp) / Rp + p * alpha / 2) + dx
+    ybend2 = Rp * (1 - np.cos((s - sp) / Rp + p * alpha / 2)) + dy
+
+    x = np.concatenate([xbend1, xbend2[1:]])
+    y = np.concatenate([ybend1, ybend2[1:]])
+    points1 = np.array([x, y]).T
+    points2 = np.flipud(np.array([x, -y]).T)
+
+    points2 = _rotate_points(points2, angle - 180)
+    points2 += -points2[0, :] + points1[-1, :]
+
+    points = np.concatenate([points1[:-1], points2])
+
+    # Find y-axis intersection point to compute Reff
+    dy = np.tan(np.radians(angle - 90)) * points[-1][0]
+    Reff = points[-1][1] - dy
+    Rmin = Rp
+
+    # Fix degenerate condition at angle == 180
+    if np.abs(180 - angle) < 1e-3:
+        Reff = points[-1][1] / 2
+
+    points.flags.writeable = False
+    return points, Reff, Rmin
+
+
 def euler(
     radius: float = 10,
     angle: float = 90,
@@ -1395,74 +1715,86 @@ def euler(
     else:
         mirror = False
 
-    R0 = 1
-    alpha = np.radians(angle)
-    Rp = R0 / (np.sqrt(p * alpha))
-    sp = R0 * np.sqrt(p * alpha)
-    s0 = 2 * sp + Rp * alpha * (1 - p)
-
     pdk = get_active_pdk()
-    npoints = npoints or abs(int(angle / 360 * radius / pdk.bend_points_distance / 2))
-    npoints = max(npoints, int(360 / angle) + 1)
+    npoints = _euler_npoints(radius, angle, npoints, pdk.bend_points_distance)
+    points, Reff, Rmin = _euler_curve(angle, p, npoints)
 
-    num_pts_euler = int(np.round(sp / (s0 / 2) * npoints))
-    num_pts_arc = npoints - num_pts_euler
+    # Scale curve to either match Reff or Rmin
+    scale = radius / Reff if use_eff else radius / Rmin
+    return _euler_path(points * scale, angle, Reff * scale, Rmin * scale, mirror)
 
-    # Ensure a minimum of 2 points for each euler/arc section
-    if npoints <= 2:
-        num_pts_euler = 0
-        num_pts_arc = 2
 
-    if num_pts_euler > 0:
-        xbend1, ybend1 = _fresnel(R0, sp, num_pts_euler)
-        xp, yp = xbend1[-1], ybend1[-1]
-        dx = xp - Rp * np.sin(p * alpha / 2)
-        dy = yp - Rp * (1 - np.cos(p * alpha / 2))
-    else:
-        xbend1 = ybend1 = np.asfarray([])
-        dx = 0
-        dy = 0
+def _euler_path(
+    points: np.ndarray, angle: float, Reff: float, Rmin: float, mirror: bool
+) -> Path:
+    P = Path()
 
-    s = np.linspace(sp, s0 / 2, num_pts_arc)
-    xbend2 = Rp * np.sin((s - sp) / Rp + p * alpha / 2) + dx
-    ybend2 = Rp * (1 - np.cos((s - sp) / Rp + p * alpha / 2)) + dy
+    # Manually add points & adjust start and end angles
+    P.points = points
+    P.start_angle = 0
+    P.end_angle = angle
+    P.info["Reff"] = Reff
+    P.info["Rmin"] = Rmin
+    if mirror:
+        P.dmirror((1, 0))
+    return P
 
-    x = np.concatenate([xbend1, xbend2[1:]])
-    y = np.concatenate([ybend1, ybend2[1:]])
-    points1 = np.array([x, y]).T
-    points2 = np.flipud(np.array([x, -y]).T)
 
-    points2 = _rotate_points(points2, angle - 180)
-    points2 += -points2[0, :] + points1[-1, :]
+def euler_batch(
+    radius: float | Floats = 10,
+    angle: float | Floats = 90,
+    p: float = 0.5,
+    use_eff: bool = False,
+    npoints: int | None = None,
+) -> list[Path]:
+    """Returns the euler bends of many radii and angles.
 
-    points = np.concatenate([points1[:-1], points2])
+    Bends with the same angle and number of points are scaled from one
+    normalized curve in a single vectorized product.
+    Each bend is equal to `euler` with the same arguments.
 
-    # Find y-axis intersection point to compute Reff
-    start_angle = 180 * (angle < 0)
-    end_angle = start_angle + angle
-    dy = np.tan(np.radians(end_angle - 90)) * points[-1][0]
-    Reff = points[-1][1] - dy
-    Rmin = Rp
+    Args:
+        radius: minimum radius of curvature of each bend.
+        angle: total angle of each bend.
+        p: Proportion of the curve that is an Euler curve.
+        use_eff: If False: `radius` is the minimum radius of curvature of the bend. \
+                If True: The curve will be scaled such that the endpoints match an \
+                arc with parameters `radius` and `angle`.
+        npoints: Number of points used per 360 degrees.
 
-    # Fix degenerate condition at angle == 180
-    if np.abs(180 - angle) < 1e-3:
-        Reff = points[-1][1] / 2
+    .. code::
 
-    # Scale curve to either match Reff or Rmin
-    scale = radius / Reff if use_eff else radius / Rmin
-    points *= scale
+        import gdsfactory as gf
 
-    P = Path()
+        paths = gf.path.euler_batch(radius=[5, 10, 20], angle=[90, -90, 45])
+    """
+    from gdsfactory.pdk import get_active_pdk
 
-    # Manually add points & adjust start and end angles
-    P.points = points
-    P.start_angle = start_angle
-    P.end_angle = end_angle
-    P.info["Reff"] = Reff * scale
-    P.info["Rmin"] = Rmin * scale
-    if mirror:
-        P.dmirror((1, 0))
-    return P
+    radii, angles = np.broadcast_arrays(np.atleast_1d(radius), np.atleast_1d(angle))
+    radii = radii.tolist()
+    angles = angles.tolist()
+    if (p < 0) or (p > 1):
+        raise ValueError("euler requires argument `p` be between 0 and 1")
+    if p == 0:
+        return [euler(r, a, p, use_eff, npoints) for r, a in zip(radii, angles)]
+
+    bend_points_distance = get_active_pdk().bend_points_distance
+    groups: dict[tuple[float, int], list[int]] = {}
+    for i, (r, a) in enumerate(zip(radii, angles)):
+        key = (abs(a), _euler_npoints(r, abs(a), npoints, bend_points_distance))
+        groups.setdefault(key, []).append(i)
+
+    paths: list[Path] = [None] * len(radii)  # type: ignore[list-item]
+    for (a, n), indices in groups.items():
+        points, Reff, Rmin = _euler_curve(a, p, n)
+        scales = np.array([radii[i] for i in indices]) / (Reff if use_eff else Rmin)
+        for i, scale, scaled_points in zip(
+            indices, scales, points * scales[:, None, None]
+        ):
+            paths[i] = _euler_path(
+                scaled_points, a, Reff * scale, Rmin * scale, angles[i] < 0
+            )
+    return paths
 
 
 def straight(length: float = 10.0, npoints: int = 2) -> Path:
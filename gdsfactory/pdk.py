@@ -5,7 +5,7 @@ from __future__ import annotations
 import importlib
 import pathlib
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
 from functools import cached_property, partial
 from typing import Any
 
@@ -14,9 +14,10 @@ import numpy as np
 import omegaconf
 from kfactory import LayerEnum
 from omegaconf import DictConfig
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from gdsfactory import logger
+from gdsfactory.cell import LazyComponent
 from gdsfactory.config import CONF
 from gdsfactory.generic_tech import get_generic_pdk
 from gdsfactory.read.from_yaml_template import cell_from_yaml_template
@@ -64,6 +65,74 @@ def evanescent_coupler_sample() -> None:
     pass
 
 
+class LazyCells(MutableMapping[str, ComponentFactory]):
+    """Mapping of cell functions that loads them on first use.
+
+    Not a dict subclass, so copies (like the validation of `Pdk(cells=...)`)
+    go through the mapping methods and see the loaded cells.
+    """
+
+    def __init__(self, load: Callable[[], dict[str, ComponentFactory]]) -> None:
+        """Initialize an unloaded mapping.
+
+        Args:
+            load: returns the cell functions.
+        """
+        self._load: Callable[[], dict[str, ComponentFactory]] | None = load
+        self._cells: dict[str, ComponentFactory] = {}
+
+    @property
+    def data(self) -> dict[str, ComponentFactory]:
+        """Returns the loaded cell functions."""
+        if self._load is not None:
+            load, self._load = self._load, None
+            self._cells = load()
+        return self._cells
+
+    def __getitem__(self, name: str) -> ComponentFactory:
+        """Returns a cell function."""
+        return self.data[name]
+
+    def __setitem__(self, name: str, cell: ComponentFactory) -> None:
+        """Adds a cell function."""
+        self.data[name] = cell
+
+    def __delitem__(self, name: str) -> None:
+        """Removes a cell function."""
+        del self.data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the cell names."""
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        """Returns the number of cell functions."""
+        return len(self.data)
+
+    def __contains__(self, name: object) -> bool:
+        """Returns True if there is a cell function with that name."""
+        return name in self.data
+
+    def __or__(
+        self, other: Mapping[str, ComponentFactory]
+    ) -> dict[str, ComponentFactory]:
+        """Returns a dict with the cell functions of both mappings."""
+        return self.data | dict(other)
+
+    def __ior__(self, other: Mapping[str, ComponentFactory]) -> LazyCells:
+        """Adds the cell functions of other."""
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        """Returns the repr of the loaded cell functions."""
+        return repr(self.data)
+
+    def copy(self) -> dict[str, ComponentFactory]:
+        """Returns a dict copy of the cell functions."""
+        return self.data.copy()
+
+
 def extract_args_from_docstring(docstring: str) -> dict[str, Any] | None:
     """This function extracts settings from a function's docstring for uPDK format.
 
@@ -116,6 +185,7 @@ class Pdk(BaseModel):
 
     Parameters:
         name: PDK name.
+        version: PDK version. Changing it invalidates the persistent cell cache.
         cross_sections: dict of cross_sections factories.
         cells: dict of parametric cells that return Components.
         models: dict of models names to functions.
@@ -143,6 +213,7 @@ class Pdk(BaseModel):
     """
 
     name: str
+    version: str | None = None
     cross_sections: dict[str, CrossSectionOrFactory] = Field(
         default_factory=dict, exclude=True
     )
@@ -173,6 +244,10 @@ class Pdk(BaseModel):
         arbitrary_types_allowed=True,
         extra="forbid",
     )
+    # (name, factory, settings): resolved cross_section
+    _cross_section_cache: dict[Any, CrossSection | Transition] = PrivateAttr(
+        default_factory=dict
+    )
 
     def activate(self) -> None:
         """Set current pdk to the active pdk (if not already active)."""
@@ -186,6 +261,7 @@ class Pdk(BaseModel):
             cells.update(self.cells)
             self.cells.update(cells)
 
+        self._cross_section_cache.clear()
         _set_active_pdk(self)
 
     def register_cells(self, **kwargs) -> None:
@@ -212,6 +288,7 @@ class Pdk(BaseModel):
             if name in self.cross_sections:
                 warnings.warn(f"Overwriting cross_section {name!r}")
             self.cross_sections[name] = cross_section
+        self._cross_section_cache.clear()
 
     def register_cells_yaml(
         self,
@@ -335,7 +412,7 @@ class Pdk(BaseModel):
         kwargs = kwargs or {}
         kwargs.update(settings)
 
-        if isinstance(component, ComponentBase):
+        if isinstance(component, ComponentBase | LazyComponent):
             if kwargs:
                 raise ValueError(f"Cannot apply kwargs {kwargs} to {component.name!r}")
             return component
@@ -378,6 +455,9 @@ class Pdk(BaseModel):
     ) -> CrossSection | Transition:
         """Returns cross_section from a cross_section spec.
 
+        Cross_sections registered by name are resolved once per settings and
+        shared, which is safe as CrossSection is frozen.
+
         Args:
             cross_section: CrossSection, CrossSectionFactory, Transition, string or dict.
             kwargs: settings to override.
@@ -389,7 +469,16 @@ class Pdk(BaseModel):
                 cross_sections = list(self.cross_sections.keys())
                 raise ValueError(f"{cross_section!r} not in {cross_sections}")
             xs = self.cross_sections[cross_section]
-            return xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+            key = (cross_section, xs, tuple(sorted(kwargs.items())))
+            try:
+                return self._cross_section_cache[key]
+            except KeyError:
+                pass
+            except TypeError:  # unhashable settings
+                return xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+            xs = xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+            self._cross_section_cache[key] = xs
+            return xs
         elif isinstance(cross_section, dict | DictConfig):
             xs_name = cross_section.get("cross_section", None)
             settings = cross_section.get("settings", {})
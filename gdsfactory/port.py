@@ -33,7 +33,7 @@ import csv
 import functools
 import typing
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import partial
 
 import kfactory as kf
@@ -231,6 +231,159 @@ def csv2port(csvpath) -> dict[str, Port]:
     return ports
 
 
+class PortTable:
+    """Columns of a list of ports, for vectorized selection and sorting.
+
+    Attributes:
+        ports: the ports, in the order of the rows.
+        name: port names.
+        x: x coordinates (um).
+        y: y coordinates (um).
+        angle: orientations in degrees, in [0, 360).
+        width: port widths, as in `port.width`.
+        layer: layer indices.
+        port_type: index of the port type of each port in `port_types`.
+        port_types: port types.
+    """
+
+    def __init__(self, ports: Iterable[kf.Port]) -> None:
+        """Reads the columns of the ports.
+
+        Args:
+            ports: to tabulate.
+        """
+        self.ports = list(ports)
+        xya = []
+        kcl, dbu = None, 1.0
+        for p in self.ports:
+            t = p._trans
+            if t is not None:
+                if p.kcl is not kcl:
+                    kcl, dbu = p.kcl, p.kcl.dbu
+                d = t.disp
+                xya.append((d.x * dbu, d.y * dbu, t.angle * 90.0))
+            else:
+                t = p.dcplx_trans
+                d = t.disp
+                xya.append((d.x, d.y, t.angle))
+        xya_array = np.array(xya, dtype=float).reshape(-1, 3)
+        self.x, self.y = xya_array[:, 0], xya_array[:, 1]
+        self.angle = xya_array[:, 2] % 360
+
+        layers = [p.layer for p in self.ports]
+        types: dict[str, int] = {}
+        self.name = np.array([p.name for p in self.ports], dtype=object)
+        self.width = np.array([p.width for p in self.ports], dtype=float)
+        self.layer = np.array(layers, dtype=int)
+        self.port_type = np.array(
+            [types.setdefault(p.port_type, len(types)) for p in self.ports],
+            dtype=int,
+        )
+        self.port_types = list(types)
+        self._layers: dict[int, LayerSpec] = dict(zip(self.layer.tolist(), layers))
+
+    def __len__(self) -> int:
+        """Returns the number of ports."""
+        return len(self.ports)
+
+    def __getitem__(self, indices: Iterable[int]) -> list[kf.Port]:
+        """Returns the ports at indices."""
+        return [self.ports[i] for i in indices]
+
+    def select(
+        self,
+        layer: LayerSpec | None = None,
+        prefix: str | None = None,
+        suffix: str | None = None,
+        orientation: float | None = None,
+        width: float | None = None,
+        layers_excluded: tuple[tuple[int, int], ...] | None = None,
+        port_type: str | None = None,
+        names: list[str] | None = None,
+    ) -> np.ndarray:
+        """Returns the indices of the ports that match all the conditions.
+
+        Args:
+            layer: select ports with port GDS layer.
+            prefix: select ports with port name prefix.
+            suffix: select ports with port name suffix.
+            orientation: select ports with orientation in degrees.
+            width: select ports with port width.
+            layers_excluded: List of layers to exclude.
+            port_type: select ports with port type (optical, electrical, vertical_te).
+            names: select ports with port names.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if layer:
+            from gdsfactory.pdk import get_layer
+
+            mask &= self.layer == get_layer(layer)
+        if prefix:
+            mask &= [name.startswith(prefix) for name in self.name]
+        if suffix:
+            mask &= [name.endswith(suffix) for name in self.name]
+        if orientation is not None:
+            mask &= np.isclose(self.angle, orientation)
+        if layers_excluded:
+            excluded = [i for i, lay in self._layers.items() if lay in layers_excluded]
+            mask &= ~np.isin(self.layer, excluded)
+        if width:
+            mask &= self.width == width
+        if port_type:
+            code = (
+                self.port_types.index(port_type) if port_type in self.port_types else -1
+            )
+            mask &= self.port_type == code
+        if names:
+            names = set(names)
+            mask &= [name in names for name in self.name]
+        return np.flatnonzero(mask)
+
+    def directions(self) -> np.ndarray:
+        """Returns the direction each port faces: 0 east, 1 north, 2 west, 3 south."""
+        a = self.angle
+        return np.select(
+            [(a <= 45) | (a >= 315), a <= 135, a <= 225], [0, 1, 2], default=3
+        )
+
+    def sort(
+        self,
+        keys: dict[int, tuple[int, np.ndarray]],
+        indices: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Returns indices sorted by direction and then by a key per direction.
+
+        Ties keep their order, as in a stable sort.
+
+        Args:
+            keys: direction: (rank of the direction, sort key of each port).
+            indices: of the ports to sort. Defaults to all.
+        """
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices)
+        directions = self.directions()[indices]
+        rank = np.zeros(len(indices), dtype=int)
+        key = np.zeros(len(indices))
+        for direction, (direction_rank, direction_key) in keys.items():
+            is_direction = directions == direction
+            rank[is_direction] = direction_rank
+            key[is_direction] = direction_key[indices][is_direction]
+        return indices[np.lexsort((key, rank))]
+
+    def sort_clockwise(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """Returns indices sorted clockwise from the bottom left corner."""
+        return self.sort(
+            {2: (0, self.y), 1: (1, self.x), 0: (2, -self.y), 3: (3, -self.x)},
+            indices,
+        )
+
+    def sort_counter_clockwise(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """Returns indices sorted counter-clockwise from the bottom right corner."""
+        return self.sort(
+            {0: (0, self.y), 1: (1, -self.x), 2: (2, -self.y), 3: (3, self.x)},
+            indices,
+        )
+
+
 def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
     """Sort and return ports in the clockwise direction.
 
@@ -245,34 +398,8 @@ def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
             8   7
 
     """
-    port_list = ports
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.dy)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.dx)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.dy)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.dx)  # sort east to west
-
-    ports = west_ports + north_ports + east_ports + south_ports
-    return list(ports)
+    table = PortTable(ports)
+    return table[table.sort_clockwise()]
 
 
 def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
@@ -289,34 +416,8 @@ def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
             7   8
 
     """
-    port_list = list(ports)
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.dy)  # sort south to north
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.dx)  # sort east to west
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.dy)  # sort north to south
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.dx)  # sort west to east
-
-    ports = east_ports + north_ports + west_ports + south_ports
-    return list(ports)
+    table = PortTable(ports)
+    return table[table.sort_counter_clockwise()]
 
 
 def select_ports(
@@ -354,34 +455,30 @@ def select_ports(
     if isinstance(ports, kf.Instance):
         ports = ports.ports
 
-    if layer:
-        from gdsfactory.pdk import get_layer
-
-        layer = get_layer(layer)
-        ports = [p for p in ports if get_layer(p.layer) == layer]
-
-    if prefix:
-        ports = [p for p in ports if p.name.startswith(prefix)]
-    if suffix:
-        ports = [p for p in ports if p.name.endswith(suffix)]
-    if orientation is not None:
-        ports = [p for p in ports if np.isclose(p.dangle, orientation)]
-
-    if layers_excluded:
-        ports = [p for p in ports if p.layer not in layers_excluded]
-    if width:
-        ports = [p for p in ports if p.width == width]
-    if port_type:
-        ports = [p for p in ports if p.port_type == port_type]
-    if names:
-        ports = [p for p in ports if p.name in names]
-
+    filters = dict(
+        layer=layer,
+        prefix=prefix,
+        suffix=suffix,
+        orientation=orientation,
+        width=width,
+        layers_excluded=layers_excluded,
+        port_type=port_type,
+        names=names,
+    )
+    if not sort_ports and not any(
+        value is not None and (value or key == "orientation")
+        for key, value in filters.items()
+    ):
+        return ports
+
+    table = PortTable(ports)
+    indices = table.select(**filters)
     if sort_ports:
         if clockwise:
-            ports = sort_ports_clockwise(ports)
+            indices = table.sort_clockwise(indices)
         else:
-            ports = sort_ports_counter_clockwise(ports)
-    return ports
+            indices = table.sort_counter_clockwise(indices)
+    return table[indices]
 
 
 select_ports_optical = partial(select_ports, port_type="optical")
@@ -452,22 +549,35 @@ def deco_rename_ports(component_factory: Callable) -> Callable:
     return auto_named_component_factory
 
 
+def _sort_direction_ports(
+    direction_ports: PortsMap, keys: dict[str, Callable[[PortTable], np.ndarray]]
+) -> list[Port]:
+    """Sorts each list of direction_ports in place and returns them concatenated.
+
+    Args:
+        direction_ports: direction: ports.
+        keys: direction: returns the lexsort keys of a PortTable, in the order of keys.
+    """
+    ports = []
+    for direction, key in keys.items():
+        table = PortTable(direction_ports[direction])
+        direction_ports[direction][:] = table[np.lexsort(key(table))]
+        ports += direction_ports[direction]
+    return ports
+
+
 def _rename_ports_facing_side(
     direction_ports: dict[str, list[Port]], prefix: str = ""
 ) -> None:
     """Renames ports clockwise."""
-    for direction, list_ports in list(direction_ports.items()):
-        if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: p.dx)
-            list_ports.sort(key=lambda p: p.dy)
-
-        if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: p.dy)
-            list_ports.sort(key=lambda p: p.dx)
-
-        for i, p in enumerate(list_ports):
+    for direction in list(direction_ports):
+        # E and W ports are sorted along y then x, S and N along x then y
+        key = (
+            (lambda t: (t.x, t.y))
+            if direction in ["E", "W"]
+            else (lambda t: (t.y, t.x))
+        )
+        for i, p in enumerate(_sort_direction_ports(direction_ports, {direction: key})):
             p.name = prefix + direction + str(i)
 
 
@@ -475,81 +585,64 @@ def _rename_ports_facing_side_ccw(
     direction_ports: dict[str, list[Port]], prefix: str = ""
 ) -> None:
     """Renames ports counter-clockwise."""
-    for direction, list_ports in list(direction_ports.items()):
-        if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: -p.dx)
-            list_ports.sort(key=lambda p: -p.dy)
-
-        if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: -p.dy)
-            list_ports.sort(key=lambda p: -p.dx)
-
-        for i, p in enumerate(list_ports):
+    for direction in list(direction_ports):
+        # E and W ports are sorted along -y then -x, S and N along -x then -y
+        key = (
+            (lambda t: (-t.x, -t.y))
+            if direction in ["E", "W"]
+            else (lambda t: (-t.y, -t.x))
+        )
+        for i, p in enumerate(_sort_direction_ports(direction_ports, {direction: key})):
             p.name = prefix + direction + str(i)
 
 
 def _rename_ports_counter_clockwise(direction_ports, prefix="") -> None:
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.dy)  # sort south to north
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.dx)  # sort east to west
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.dy)  # sort north to south
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.dx)  # sort west to east
-
-    ports = east_ports + north_ports + west_ports + south_ports
+    ports = _sort_direction_ports(
+        direction_ports,
+        {
+            "E": lambda t: (+t.y,),  # sort south to north
+            "N": lambda t: (-t.x,),  # sort east to west
+            "W": lambda t: (-t.y,),  # sort north to south
+            "S": lambda t: (+t.x,),  # sort west to east
+        },
+    )
 
     for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+        p.name = f"{prefix}{i + 1}" if prefix else i + 1
 
 
 def _rename_ports_clockwise(direction_ports: PortsMap, prefix: str = "") -> None:
     """Rename ports in the clockwise directionjstarting from the bottom left corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.dy)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.dx)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.dy)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.dx)  # sort east to west
-    # south_ports.sort(key=lambda p: p.dy)  #  south first
-
-    ports = west_ports + north_ports + east_ports + south_ports
+    ports = _sort_direction_ports(
+        direction_ports,
+        {
+            "W": lambda t: (+t.y,),  # sort south to north
+            "N": lambda t: (+t.x,),  # sort west to east
+            "E": lambda t: (-t.y,),  # sort north to south
+            "S": lambda t: (-t.x,),  # sort east to west
+        },
+    )
 
     for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+        p.name = f"{prefix}{i + 1}" if prefix else i + 1
 
 
 def _rename_ports_clockwise_top_right(
     direction_ports: PortsMap, prefix: str = ""
 ) -> None:
     """Rename ports in clockwise direction starting from the top right corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.dy)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.dx)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.dy)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.dx)  # sort east to west
-
-    ports = east_ports + south_ports + west_ports + north_ports
+    ports = _sort_direction_ports(
+        direction_ports,
+        {
+            "E": lambda t: (-t.y,),  # sort north to south
+            "S": lambda t: (-t.x,),  # sort east to west
+            "W": lambda t: (+t.y,),  # sort south to north
+            "N": lambda t: (+t.x,),  # sort west to east
+        },
+    )
 
     for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+        p.name = f"{prefix}{i + 1}" if prefix else i + 1
 
 
 def rename_ports_by_orientation(
@@ -593,18 +686,10 @@ def rename_ports_by_orientation(
         # Make sure we can backtrack the parent component from the port
         p.parent = component
 
-        if p.orientation is not None:
-            angle = p.orientation % 360
-            if angle <= 45 or angle >= 315:
-                direction_ports["E"].append(p)
-            elif angle <= 135 and angle >= 45:
-                direction_ports["N"].append(p)
-            elif angle <= 225 and angle >= 135:
-                direction_ports["W"].append(p)
-            else:
-                direction_ports["S"].append(p)
-        else:
-            direction_ports["S"].append(p)
+    table = PortTable(ports_on_layer)
+    directions = table.directions()
+    for i, direction in enumerate(["E", "N", "W", "S"]):
+        direction_ports[direction] = table[np.flatnonzero(directions == i)]
 
     function(direction_ports, prefix=prefix)
     return component
@@ -1,29 +1,53 @@
-from gdsfactory.read.from_gdspaths import (
-    from_gdsdir,
-    from_gdspaths,
-)
-from gdsfactory.read.from_np import (
-    from_image,
-    from_np,
-)
-from gdsfactory.read.from_updk import (
-    from_updk,
-)
-from gdsfactory.read.from_yaml import (
-    from_yaml,
-)
-from gdsfactory.read.from_yaml_template import (
-    cell_from_yaml_template,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gdsfactory.lazy_module import make_lazy
 from gdsfactory.read.import_gds import (
     import_gds,
 )
-from gdsfactory.read.labels import (
-    add_port_markers,
-    read_labels_yaml,
-)
+
+if TYPE_CHECKING:
+    from gdsfactory.read.from_gdspaths import (
+        from_gdsdir,
+        from_gdspaths,
+    )
+    from gdsfactory.read.from_np import (
+        from_image,
+        from_np,
+    )
+    from gdsfactory.read.from_updk import (
+        from_updk,
+    )
+    from gdsfactory.read.from_yaml import (
+        IncrementalYamlBuilder,
+        from_yaml,
+    )
+    from gdsfactory.read.from_yaml_template import (
+        cell_from_yaml_template,
+    )
+    from gdsfactory.read.labels import (
+        add_port_markers,
+        read_labels_yaml,
+    )
+
+# imported on first access, as from_yaml needs the routing functions
+_lazy_attributes = {
+    "IncrementalYamlBuilder": "gdsfactory.read.from_yaml",
+    "add_port_markers": "gdsfactory.read.labels",
+    "cell_from_yaml_template": "gdsfactory.read.from_yaml_template",
+    "from_gdsdir": "gdsfactory.read.from_gdspaths",
+    "from_gdspaths": "gdsfactory.read.from_gdspaths",
+    "from_image": "gdsfactory.read.from_np",
+    "from_np": "gdsfactory.read.from_np",
+    "from_updk": "gdsfactory.read.from_updk",
+    "from_yaml": "gdsfactory.read.from_yaml",
+    "read_labels_yaml": "gdsfactory.read.labels",
+}
+make_lazy(__name__)
 
 __all__ = [
+    "IncrementalYamlBuilder",
     "add_port_markers",
     "cell_from_yaml_template",
     "from_gdsdir",
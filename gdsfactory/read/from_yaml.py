@@ -760,6 +760,263 @@ def from_yaml(
     return c
 
 
+class IncrementalYamlBuilder:
+    """Builds a Component from YAML and rebuilds it incrementally on changes.
+
+    The first build places, connects and routes every instance like `from_yaml`.
+    Later builds diff the netlist against the previous one. Only the instances
+    that changed, and the instances placed or connected relative to them in
+    the dependency graph, are placed and connected again. The other instances
+    keep their component and transformation.
+    A bundle is only routed again if it changed or if one of its instances moved.
+    The other bundles copy their route instances from the previous component.
+
+    Args:
+        routing_strategy: for each route.
+        label_instance_function: to label each instance.
+        name: Optional name.
+        delete_previous: deletes the previous component from the layout
+            after each rebuild, unless it is instantiated by another cell.
+
+    .. code::
+
+        builder = IncrementalYamlBuilder()
+        c = builder.build("circuit.pic.yml")
+        # edit circuit.pic.yml
+        c = builder.build("circuit.pic.yml")
+        print(builder.stats())
+    """
+
+    def __init__(
+        self,
+        routing_strategy: dict[str, Callable] | None = None,
+        label_instance_function: Callable = add_instance_label,
+        name: str | None = None,
+        delete_previous: bool = True,
+    ) -> None:
+        """Creates a builder without a previous build."""
+        self.routing_strategy = routing_strategy
+        self.label_instance_function = label_instance_function
+        self.name = name
+        self.delete_previous = delete_previous
+        self.component: Component | None = None
+        self._pdk_name: str | None = None
+        self._components: dict[str, Any] = {}
+        self._component_keys: dict[str, Any] = {}
+        self._placement_keys: dict[str, Any] = {}
+        self._transforms: dict[str, tuple[int, kf.kdb.DCplxTrans]] = {}
+        self._bundles: dict[str, tuple[Any, list[Instance], dict[str, Any]]] = {}
+        self._stats: dict[str, int] = {}
+
+    def build(
+        self,
+        yaml_str: str | pathlib.Path | IO[Any] | dict[str, Any] | DictConfig,
+    ) -> Component:
+        """Returns the Component of a YAML netlist, reusing the previous build.
+
+        Args:
+            yaml_str: YAML string or file.
+        """
+        from gdsfactory.pdk import get_routing_strategies
+
+        dct = _load_yaml_str(yaml_str)
+        pdk = _activate_pdk_by_name(dct.get("pdk", ""))
+        net = Netlist.model_validate(dct)
+        g = _get_dependency_graph(net)
+
+        previous = self.component
+        if previous is None or previous._destroyed() or self._pdk_name != pdk.name:
+            self._reset()
+        self._pdk_name = pdk.name
+
+        directed_connections = _get_directed_connections(net.connections)
+        component_keys = {
+            name: (inst.component, inst.settings)
+            for name, inst in net.instances.items()
+        }
+        placement_keys = {
+            name: (
+                inst.model_dump(exclude={"component", "settings"}),
+                net.placements[name].model_dump() if name in net.placements else None,
+                directed_connections.get(name),
+                sorted(g.predecessors(name)),
+            )
+            for name, inst in net.instances.items()
+        }
+
+        dirty = {
+            name
+            for name in net.instances
+            if component_keys[name] != self._component_keys.get(name)
+            or placement_keys[name] != self._placement_keys.get(name)
+        }
+        for name in list(dirty):
+            dirty.update(
+                _parse_maybe_arrayed_instance(node)[0]
+                for node in nx.descendants(g, name)
+            )
+
+        c = Component()
+        refs = {}
+        for name, inst in net.instances.items():
+            if component_keys[name] == self._component_keys.get(name):
+                comp = self._components[name]
+            else:
+                comp = pdk.get_component(
+                    component=inst.component, settings=inst.settings
+                )
+            refs[name] = _add_reference(c, comp, name, inst)
+            if name not in dirty:
+                refs[name].dcplx_trans = self._transforms[name][1]
+            self._components[name] = comp
+
+        _place_and_connect(g, refs, net.connections, net.placements, dirty=dirty)
+
+        transforms = {
+            name: (ref.cell_index, ref.dcplx_trans) for name, ref in refs.items()
+        }
+        moved = {
+            name
+            for name in net.instances
+            if transforms[name] != self._transforms.get(name)
+        }
+
+        routing_strategies = self.routing_strategy or get_routing_strategies()
+        routes_dict = {}
+        bundles = {}
+        routed = 0
+        for bundle_name, bundle in net.routes.items():
+            key = (bundle.model_dump(), routing_strategies.get(bundle.routing_strategy))
+            instance_names = {
+                _parse_maybe_arrayed_instance(_split_route_link(link)[0])[0]
+                for link in (*bundle.links.keys(), *bundle.links.values())
+            }
+            previous_bundle = self._bundles.get(bundle_name)
+            if (
+                previous_bundle is not None
+                and previous_bundle[0] == key
+                and not instance_names & moved
+            ):
+                bundles[bundle_name] = _copy_bundle(c, *previous_bundle)
+            else:
+                bundles[bundle_name] = _record_bundle(
+                    c, refs, bundle_name, bundle, routing_strategies, key
+                )
+                routed += 1
+            routes_dict.update(bundles[bundle_name][2])
+        c.routes = routes_dict  # type: ignore
+
+        c = _add_ports(c, refs, net.ports)
+        c = _add_labels(c, refs, self.label_instance_function)
+        c.name = self.name or net.name or c.name
+
+        self._stats = dict(
+            instances_placed=len(dirty),
+            instances_reused=len(net.instances) - len(dirty),
+            bundles_routed=routed,
+            bundles_reused=len(net.routes) - routed,
+        )
+        self._component_keys = component_keys
+        self._placement_keys = placement_keys
+        self._transforms = transforms
+        self._components = {name: self._components[name] for name in net.instances}
+        self._bundles = {
+            name: bundle for name, bundle in bundles.items() if bundle[0] is not None
+        }
+        self.component = c
+
+        if (
+            self.delete_previous
+            and previous is not None
+            and not previous._destroyed()
+            and previous._kdb_cell.parent_cells() == 0
+        ):
+            previous.delete()
+        return c
+
+    def _reset(self) -> None:
+        self._components.clear()
+        self._component_keys.clear()
+        self._placement_keys.clear()
+        self._transforms.clear()
+        self._bundles.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of placed and reused instances and bundles of the last build."""
+        return dict(self._stats)
+
+
+def _record_bundle(
+    c: Component,
+    refs: dict[str, ComponentReference],
+    bundle_name: str,
+    bundle: Bundle,
+    routing_strategies: dict[str, Callable],
+    key: Any,
+) -> tuple[Any, list[Instance], dict[str, Any]]:
+    """Routes a bundle and returns its key, instances and routes.
+
+    The key is None if the bundle can not be copied, for example if it added shapes.
+    """
+    layer_indexes = c.kcl.layer_indexes()
+    num_shapes = sum(c.shapes(layer).size() for layer in layer_indexes)
+    num_insts = len(c.insts)
+    routes = _add_bundle(c, refs, bundle_name, bundle, routing_strategies)
+    instances = list(c.insts)[num_insts:]
+    recorded = {inst._instance for inst in instances}
+    if sum(c.shapes(layer).size() for layer in c.kcl.layer_indexes()) != num_shapes:
+        key = None
+    elif any(
+        inst._instance not in recorded
+        for route in routes.values()
+        for inst in getattr(route, "instances", ())
+    ):
+        key = None
+    return key, instances, routes
+
+
+def _copy_bundle(
+    c: Component, key: Any, instances: list[Instance], routes: dict[str, Any]
+) -> tuple[Any, list[Instance], dict[str, Any]]:
+    """Copies the route instances of a bundle of a previous component into c."""
+    copies = {}
+    for inst in instances:
+        kinst = inst._instance
+        if kinst.is_regular_array():
+            copy = c.create_inst(
+                inst.cell_index,
+                kinst.cplx_trans,
+                a=kinst.a,
+                b=kinst.b,
+                na=kinst.na,
+                nb=kinst.nb,
+            )
+        else:
+            copy = c.create_inst(inst.cell_index, kinst.cplx_trans)
+        copies[kinst] = copy
+
+    new_routes = {}
+    for name, route in routes.items():
+        route_instances = getattr(route, "instances", None)
+        if route_instances is not None and hasattr(route, "model_copy"):
+            route = route.model_copy(
+                update={
+                    "instances": [
+                        _copy_reference(inst, copies) for inst in route_instances
+                    ]
+                }
+            )
+        new_routes[name] = route
+    return key, list(copies.values()), new_routes
+
+
+def _copy_reference(
+    inst: Instance, copies: dict[kf.kdb.Instance, Instance]
+) -> Instance:
+    copy = copies[inst._instance]
+    return ComponentReference(copy) if isinstance(inst, ComponentReference) else copy
+
+
 # Define a custom constructor that converts YAML sequences to tuples
 def tuple_constructor(loader, node):
     return tuple(loader.construct_sequence(node))
@@ -845,47 +1102,60 @@ def _get_dependency_graph(net: Netlist) -> nx.DiGraph:
 def _get_references(c: Component, pdk, instances: dict[str, NetlistInstance]):
     refs = {}
     for name, inst in instances.items():
-        na, nb = inst.na, inst.nb
-        dax, day, dbx, dby = inst.dax, inst.day, inst.dbx, inst.dby
         comp = pdk.get_component(component=inst.component, settings=inst.settings)
-        if na < 2 and nb < 2:
-            ref = c.add_ref(comp, name=name)
-        else:
-            if abs(dax) > 0.0:
-                if abs(day) > 0.0 or abs(dbx) > 0.0:
-                    raise ValueError(
-                        "If 'dax' given. Only 'dby' should be given as well. "
-                        f"Got: {name=} {dax=}, {day=}, {dbx=}, {dby=}"
-                    )
-                ref = c.add_ref(
-                    comp, rows=nb, columns=na, spacing=(dax, dby), name=name
-                )
-            else:
-                if abs(dax) > 0.0 or abs(dby) > 0.0:
-                    raise ValueError(
-                        "If 'day' given. Only 'dbx' should be given as well. "
-                        f"Got: {name=} {dax=}, {day=}, {dbx=}, {dby=}"
-                    )
-                ref = c.add_ref(
-                    comp, rows=na, columns=nb, spacing=(dbx, day), name=name
-                )
-        refs[name] = ref
+        refs[name] = _add_reference(c, comp, name, inst)
     return refs
 
 
+def _add_reference(
+    c: Component, comp: Component, name: str, inst: NetlistInstance
+) -> ComponentReference:
+    na, nb = inst.na, inst.nb
+    dax, day, dbx, dby = inst.dax, inst.day, inst.dbx, inst.dby
+    if na < 2 and nb < 2:
+        return c.add_ref(comp, name=name)
+
+    if abs(dax) > 0.0:
+        if abs(day) > 0.0 or abs(dbx) > 0.0:
+            raise ValueError(
+                "If 'dax' given. Only 'dby' should be given as well. "
+                f"Got: {name=} {dax=}, {day=}, {dbx=}, {dby=}"
+            )
+        return c.add_ref(comp, rows=nb, columns=na, spacing=(dax, dby), name=name)
+
+    if abs(dax) > 0.0 or abs(dby) > 0.0:
+        raise ValueError(
+            "If 'day' given. Only 'dbx' should be given as well. "
+            f"Got: {name=} {dax=}, {day=}, {dbx=}, {dby=}"
+        )
+    return c.add_ref(comp, rows=na, columns=nb, spacing=(dbx, day), name=name)
+
+
 def _place_and_connect(
     g: nx.DiGraph,
     refs: dict[str, ComponentReference],
     connections: dict[str, str],
     placements: dict[str, Placement],
+    dirty: set[str] | None = None,
 ):
+    """Places and connects the references following the dependency graph.
+
+    Args:
+        g: dependency graph.
+        refs: references by instance name.
+        connections: between instance ports.
+        placements: by instance name.
+        dirty: only places and connects these instances. Defaults to all.
+    """
     directed_connections = _get_directed_connections(connections)
 
     for root in _graph_roots(g):
         pl = placements.get(root)
-        if pl is not None:
+        if pl is not None and (dirty is None or root in dirty):
             _update_reference_by_placement(refs, root, pl)
         for i2, i1 in nx.dfs_edges(g, root):
+            if dirty is not None and _parse_maybe_arrayed_instance(i1)[0] not in dirty:
+                continue
             ports = directed_connections.get(i1, {}).get(i2, None)
             pl = placements.get(i1)
             if pl is not None:
@@ -910,43 +1180,55 @@ def _add_routes(
     routes_dict = {}
     routing_strategies = routing_strategies or get_routing_strategies()
     for bundle_name, bundle in routes.items():
-        try:
-            routing_strategy = routing_strategies[bundle.routing_strategy]  # type: ignore
-        except KeyError as e:
-            raise ValueError(
-                f"Unknown routing strategy.\nvalid strategies: {list(routing_strategies)}\n"
-                f"Got:{bundle.routing_strategy}"
-            ) from e
-
-        ports1 = []
-        ports2 = []
-        route_names = []
-
-        for ip1, ip2 in bundle.links.items():
-            i1, p1s = _split_route_link(ip1)
-            i2, p2s = _split_route_link(ip2)
-            if len(p1s) != len(p2s):
-                raise ValueError(
-                    f"length of array bundles don't match. Got {ip1} <-> {ip2}"
-                )
-            ports1 += _get_ports_from_portnames(refs, i1, p1s)
-            ports2 += _get_ports_from_portnames(refs, i2, p2s)
-            route_names += [
-                f"{bundle_name}-{i1},{p1}-{i2},{p2}" for p1, p2 in zip(p1s, p2s)
-            ]
-
-        routes_list = routing_strategy(  # type: ignore
-            c,
-            ports1=ports1,
-            ports2=ports2,
-            **bundle.settings,
+        routes_dict.update(
+            _add_bundle(c, refs, bundle_name, bundle, routing_strategies)
         )
-        for route_name, route in zip(route_names, routes_list):
-            routes_dict[route_name] = route
         c.routes = routes_dict  # type: ignore
     return c
 
 
+def _add_bundle(
+    c: Component,
+    refs: dict[str, ComponentReference],
+    bundle_name: str,
+    bundle: Bundle,
+    routing_strategies: dict[str, Callable],
+) -> dict[str, Any]:
+    """Routes a bundle and returns its routes by route name."""
+    try:
+        routing_strategy = routing_strategies[bundle.routing_strategy]  # type: ignore
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown routing strategy.\nvalid strategies: {list(routing_strategies)}\n"
+            f"Got:{bundle.routing_strategy}"
+        ) from e
+
+    ports1 = []
+    ports2 = []
+    route_names = []
+
+    for ip1, ip2 in bundle.links.items():
+        i1, p1s = _split_route_link(ip1)
+        i2, p2s = _split_route_link(ip2)
+        if len(p1s) != len(p2s):
+            raise ValueError(
+                f"length of array bundles don't match. Got {ip1} <-> {ip2}"
+            )
+        ports1 += _get_ports_from_portnames(refs, i1, p1s)
+        ports2 += _get_ports_from_portnames(refs, i2, p2s)
+        route_names += [
+            f"{bundle_name}-{i1},{p1}-{i2},{p2}" for p1, p2 in zip(p1s, p2s)
+        ]
+
+    routes_list = routing_strategy(  # type: ignore
+        c,
+        ports1=ports1,
+        ports2=ports2,
+        **bundle.settings,
+    )
+    return dict(zip(route_names, routes_list))
+
+
 def _add_ports(
     c: Component, refs: dict[str, ComponentReference], ports: dict[str, str]
 ):
@@ -958,7 +1240,7 @@ def _add_ports(
         ref = refs[i]
         ps = [p.name for p in ref.ports]
         if p not in ps:
-            raise ValueError(f"{p!r} not in {ps} for" f" {i!r}.")
+            raise ValueError(f"{p!r} not in {ps} for {i!r}.")
         inst_port = ref.ports[p] if ia is None else ref.ports[p, ia, ib]
         c.add_port(name, port=inst_port)
     return c
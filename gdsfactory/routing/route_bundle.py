@@ -22,6 +22,7 @@ from gdsfactory.components.straight import straight as straight_function
 from gdsfactory.components.wire import wire_corner
 from gdsfactory.port import Port
 from gdsfactory.routing.sort_ports import get_port_x, get_port_y
+from gdsfactory.routing.straight_cells import StraightFactory, StraightMode
 from gdsfactory.typings import (
     Component,
     ComponentSpec,
@@ -99,6 +100,7 @@ def route_bundle(
     radius: float | None = None,
     route_width: float | list[float] | None = None,
     straight: ComponentSpec = straight_function,
+    straight_mode: StraightMode = "cell",
 ) -> list[OpticalManhattanRoute]:
     """Places a bundle of routes to connect two groups of ports.
 
@@ -125,6 +127,9 @@ def route_bundle(
         radius: bend radius. If None, defaults to cross_section.radius.
         route_width: width of the route. If None, defaults to cross_section.width.
         straight: function for the straight. Defaults to straight.
+        straight_mode: "cell" creates one straight cell per length.
+            "binary" composes straights from power of two length cells.
+            "polygon" flattens straights into polygons of the component.
 
 
     .. plot::
@@ -189,15 +194,14 @@ def route_bundle(
         else gf.get_component(bend, cross_section=cross_section, radius=radius)
     )
 
-    def straight_dbu(
-        length: int, width: int = width_dbu, cross_section=cross_section
-    ) -> Component:
-        return gf.get_component(
-            straight,
-            length=length * component.kcl.dbu,
-            width=width * component.kcl.dbu,
-            cross_section=cross_section,
-        )
+    straight_dbu = StraightFactory(
+        component,
+        straight,
+        port_type=port_type,
+        straight_mode=straight_mode,
+        width=width_dbu,
+        cross_section=cross_section,
+    )
 
     dbu = component.kcl.dbu
     end_straight = round(end_straight_length / dbu)
@@ -208,7 +212,7 @@ def route_bundle(
             gf.get_layer(layer) for layer in collision_check_layers
         ]
 
-    return kf.routing.optical.route_bundle(
+    routes = kf.routing.optical.route_bundle(
         component,
         ports1,
         ports2,
@@ -227,6 +231,8 @@ def route_bundle(
         route_width=width_dbu,
         sort_ports=sort_ports,
     )
+    straight_dbu.replace_composites(routes)
+    return routes
 
 
 route_bundle_electrical = partial(
@@ -29,13 +29,15 @@ from __future__ import annotations
 
 import kfactory as kf
 from kfactory.routing.electrical import route_elec
-from kfactory.routing.optical import OpticalManhattanRoute, place90, route
+from kfactory.routing.optical import OpticalManhattanRoute, place90
+from kfactory.routing.optical import route as route_optical
 
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.bend_euler import bend_euler
 from gdsfactory.components.straight import straight as straight_function
 from gdsfactory.port import Port
+from gdsfactory.routing.straight_cells import StraightFactory, StraightMode
 from gdsfactory.typings import (
     ComponentSpec,
     Coordinates,
@@ -60,6 +62,7 @@ def route_single(
     allow_width_mismatch: bool = False,
     radius: float | None = None,
     route_width: float | None = None,
+    straight_mode: StraightMode = "cell",
 ) -> OpticalManhattanRoute:
     """Returns a Manhattan Route between 2 ports.
 
@@ -81,6 +84,9 @@ def route_single(
         allow_width_mismatch: allow different port widths.
         radius: bend radius. If None, defaults to cross_section.radius.
         route_width: width of the route. If None, defaults to cross_section.width.
+        straight_mode: "cell" creates one straight cell per length.
+            "binary" composes straights from power of two length cells.
+            "polygon" flattens straights into polygons of the component.
 
 
     .. plot::
@@ -111,17 +117,14 @@ def route_single(
         else gf.get_component(bend, cross_section=cross_section, radius=radius)
     )
 
-    def straight_dbu(
-        length: int,
-        width: int = width_dbu,
+    straight_dbu = StraightFactory(
+        component,
+        straight,
+        port_type=port_type,
+        straight_mode=straight_mode,
+        width=width_dbu,
         cross_section=cross_section,
-    ) -> Component:
-        return gf.get_component(
-            straight,
-            length=length * component.kcl.dbu,
-            width=width * component.kcl.dbu,
-            cross_section=cross_section,
-        )
+    )
 
     dbu = component.kcl.dbu
     end_straight = round(end_straight_length / dbu)
@@ -136,7 +139,7 @@ def route_single(
             w += [kf.kdb.Point(*p2.center)]
             waypoints = w
 
-        return place90(
+        route = place90(
             component,
             p1=p1,
             p2=p2,
@@ -150,7 +153,7 @@ def route_single(
         )
 
     else:
-        return route(
+        route = route_optical(
             component,
             p1=p1,
             p2=p2,
@@ -164,6 +167,9 @@ def route_single(
             route_width=route_width,
         )
 
+    straight_dbu.replace_composites([route])
+    return route
+
 
 # FIXME
 # route_single_electrical = partial(
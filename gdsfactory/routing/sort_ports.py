@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import kfactory as kf
+import numpy as np
 
-from gdsfactory.port import Port
+from gdsfactory.port import Port, PortTable
 
 
 def get_port_x(port: Port) -> float:
@@ -14,17 +15,13 @@ def get_port_y(port: Port) -> float:
 
 
 def sort_ports_x(ports: list[Port]) -> list[Port]:
-    ports = list(ports)
-    f_key = get_port_x
-    ports.sort(key=f_key)
-    return ports
+    table = PortTable(ports)
+    return table[np.argsort(table.x, kind="stable")]
 
 
 def sort_ports_y(ports: list[Port]) -> list[Port]:
-    ports = list(ports)
-    f_key = get_port_y
-    ports.sort(key=f_key)
-    return ports
+    table = PortTable(ports)
+    return table[np.argsort(table.y, kind="stable")]
 
 
 def sort_ports(
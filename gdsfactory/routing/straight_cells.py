@@ -0,0 +1,199 @@
+"""Straights for routes that reuse a small set of cells.
+
+By default routers create one straight cell for every distinct straight length,
+so a large fanout creates thousands of one-off `straight_L...` cells.
+
+straight_mode:
+
+ - cell: one straight cell per length.
+ - binary: each straight is composed of straights with lengths that are powers of two
+   (in dbu), so all routes with one cross_section use at most ~30 straight cells.
+ - polygon: straights are flattened into polygons in the parent cell, and the
+   straight cells created only for them are deleted.
+
+"""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+from kfactory.routing.optical import OpticalManhattanRoute
+
+import gdsfactory as gf
+from gdsfactory.component import Component
+from gdsfactory.typings import ComponentSpec
+
+StraightMode = Literal["cell", "binary", "polygon"]
+
+
+def get_binary_lengths(length: int) -> list[int]:
+    """Returns the powers of two (in dbu) that add up to length, longest first."""
+    return [
+        1 << bit for bit in reversed(range(length.bit_length())) if length >> bit & 1
+    ]
+
+
+class StraightFactory:
+    """Returns straights by length in dbu for the kfactory routers.
+
+    Args:
+        component: component that the routes are placed into.
+        straight: spec of the straight.
+        port_type: of the straight ports connected by the router.
+        straight_mode: cell, binary or polygon.
+        width: default width of the straights in dbu.
+        kwargs: passed to the straight spec.
+    """
+
+    def __init__(
+        self,
+        component: Component,
+        straight: ComponentSpec,
+        port_type: str = "optical",
+        straight_mode: StraightMode = "cell",
+        width: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Creates a straight factory for the routes of a component."""
+        if straight_mode not in {"cell", "binary", "polygon"}:
+            raise ValueError(
+                f"{straight_mode=} must be one of 'cell', 'binary' or 'polygon'"
+            )
+        self.component = component
+        self.straight = straight
+        self.port_type = port_type
+        self.straight_mode = straight_mode
+        self.width = width
+        self.kwargs = kwargs
+        self.composites: set[int] = set()
+        # straight cells created by this factory
+        self.units: set[int] = set()
+
+    def get_straight(self, length: int, **kwargs: Any) -> Component:
+        kcl = self.component.kcl
+        n = kcl.layout.cells()
+        c = gf.get_component(
+            self.straight, length=length * kcl.dbu, **(self.kwargs | kwargs)
+        )
+        if kcl.layout.cells() > n:
+            self.units.add(c.cell_index())
+        return c
+
+    def __call__(
+        self, length: int, width: float | None = None, **kwargs: Any
+    ) -> Component:
+        dbu = self.component.kcl.dbu
+        width = self.width if width is None else width
+        if width is not None:
+            kwargs["width"] = width * dbu
+
+        lengths = get_binary_lengths(length)
+        if self.straight_mode == "cell" or (
+            self.straight_mode == "binary" and len(lengths) <= 1
+        ):
+            return self.get_straight(length, **kwargs)
+
+        c = Component()
+        refs = [
+            c << self.get_straight(unit_length, **kwargs) for unit_length in lengths
+        ]
+        for ref1, ref2 in zip(refs[:-1], refs[1:]):
+            ref2.connect(
+                self._get_ports(ref2)[0].name, ref1, self._get_ports(ref1)[1].name
+            )
+
+        c.add_port(port=self._get_ports(refs[0])[0], name="o1")
+        c.add_port(port=self._get_ports(refs[-1])[1], name="o2")
+        self.composites.add(c.cell_index())
+        return c
+
+    def _get_ports(self, ref) -> list:
+        return [port for port in ref.ports if port.port_type == self.port_type]
+
+    def replace_composites(self, routes: Iterable[OpticalManhattanRoute]) -> None:
+        """Replaces the composite straights of the routes and deletes their cells.
+
+        binary: places the power of two straights directly in the parent cell.
+        polygon: flattens the straights into polygons of the parent cell
+            and deletes the straight cells created for them.
+        """
+        if not self.composites:
+            return
+
+        kcl = self.component.kcl
+        for route in routes:
+            instances = []
+            for inst in route.instances:
+                if inst.cell_index not in self.composites:
+                    instances.append(inst)
+                    continue
+
+                if self.straight_mode == "polygon":
+                    inst.flatten()
+                    continue
+
+                composite = kcl[inst.cell_index]
+                instances.extend(
+                    self.component.create_inst(child.cell, inst.trans * child.trans)
+                    for child in composite.insts
+                )
+                inst._instance.delete()
+            route.instances = instances
+
+        # drop the deleted instances from the instances of the component
+        for inst in list(self.component.insts):
+            if not inst._instance.is_valid():
+                del self.component.insts[inst]
+
+        for cell_index in self.composites:
+            kcl[cell_index].delete()
+        self.composites.clear()
+
+        if self.straight_mode == "polygon":
+            for cell_index in self.units:
+                unit = kcl[cell_index]
+                if not unit._destroyed() and not unit._kdb_cell.parent_cells():
+                    unit.delete()
+            self.units.clear()
+
+
+def get_layout_size(
+    component: Component, layout_format: Literal["GDS2", "OASIS"] = "GDS2"
+) -> dict[str, int]:
+    """Returns the number of cells and file size in bytes of a component.
+
+    Useful to compare straight_mode of routes.
+
+    Args:
+        component: to measure.
+        layout_format: GDS2 or OASIS.
+    """
+    from kfactory.kcell import save_layout_options
+
+    save_options = save_layout_options()
+    save_options.format = layout_format
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = Path(dirpath) / "layout"
+        component.write(filepath, save_options)
+        size = filepath.stat().st_size
+    return dict(cells=len(component.called_cells()) + 1, bytes=size)
+
+
+def get_layout_savings(
+    build: Callable[[StraightMode], Component],
+    straight_mode: StraightMode = "binary",
+    layout_format: Literal["GDS2", "OASIS"] = "GDS2",
+) -> dict[str, int]:
+    """Returns the cells and bytes saved by straight_mode compared to one cell per length.
+
+    Args:
+        build: returns a component routed with a straight_mode.
+        straight_mode: to compare against "cell".
+        layout_format: GDS2 or OASIS.
+    """
+    reference = get_layout_size(build("cell"), layout_format=layout_format)
+    size = get_layout_size(build(straight_mode), layout_format=layout_format)
+    return {key: reference[key] - size[key] for key in reference}
@@ -0,0 +1,44 @@
+"""Benchmark of the batched path extrusion against a loop over the sections.
+
+`gf.path.extrude` computes the offset curves of all sections of a cross_section
+in one broadcast. `gf.path._extrude_sections_loop` computes them section by section.
+"""
+
+from __future__ import annotations
+
+import time
+
+import gdsfactory as gf
+from gdsfactory.path import _extrude_sections_loop
+from gdsfactory.typings import CrossSectionSpec
+
+
+def benchmark(
+    p: gf.Path, cross_section: CrossSectionSpec, repeat: int = 10
+) -> dict[str, float]:
+    """Returns the average time in seconds of the loop and the batched extrusion."""
+    times = {}
+    for name, function in [
+        ("loop", _extrude_sections_loop),
+        ("batched", gf.path.extrude),
+    ]:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            function(p, cross_section)
+        times[name] = (time.perf_counter() - t0) / repeat
+    return times
+
+
+if __name__ == "__main__":
+    p = gf.path.euler(radius=10, angle=90, npoints=720)
+    for _ in range(3):
+        p += gf.path.straight(10)
+        p += gf.path.arc(10, npoints=720)
+
+    xs = gf.cross_section.pn_with_trenches(layer="WG")
+    times = benchmark(p, xs)
+    print(
+        f"{len(xs.sections)} sections, {len(p.points)} points: "
+        f"loop {times['loop'] * 1e3:.1f} ms, "
+        f"batched {times['batched'] * 1e3:.1f} ms"
+    )
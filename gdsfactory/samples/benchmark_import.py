@@ -0,0 +1,37 @@
+"""Benchmark of the import time of gdsfactory.
+
+`import gdsfactory` imports the submodules and the generic PDK cells on first
+access. Each statement below runs in a fresh interpreter.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+statements = {
+    "kfactory": "import kfactory",
+    "gdsfactory": "import gdsfactory",
+    "import_gds": "import gdsfactory as gf; gf.import_gds",
+    "components": "import gdsfactory as gf; gf.components",
+    "get_component": "import gdsfactory as gf; gf.get_component('straight')",
+}
+
+
+def benchmark(repeat: int = 3) -> dict[str, float]:
+    """Returns the best time in seconds to run each statement in a new interpreter."""
+    times = {}
+    for name, statement in statements.items():
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, "-c", statement], check=True)
+            best = min(best, time.perf_counter() - t0)
+        times[name] = best
+    return times
+
+
+if __name__ == "__main__":
+    for name, t in benchmark().items():
+        print(f"{name}: {t * 1e3:.0f} ms")
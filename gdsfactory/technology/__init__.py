@@ -1,3 +1,4 @@
+from gdsfactory.technology.compiled import load_compiled
 from gdsfactory.technology.layer_map import LayerMap, lyp_to_dataclass
 from gdsfactory.technology.layer_stack import (
     AbstractLayer,
@@ -14,6 +15,7 @@ __all__ = [
     "LayerLevel",
     "LayerStack",
     "LayerMap",
+    "load_compiled",
     "lyp_to_dataclass",
     "LogicalLayer",
     "DerivedLayer",
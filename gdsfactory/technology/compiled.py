@@ -0,0 +1,85 @@
+"""Compiled technology snapshots.
+
+Parsing technology sources (YAML or KLayout .lyp layer views) takes much longer
+than unpickling the objects they describe. `load_compiled` keeps a pickled
+snapshot of the parsed object in CONF.technology_cache_dir, keyed by the hash of
+the source file and of the schema of the object, and rebuilds it when either changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import pickle
+from collections.abc import Callable
+from typing import TypeVar
+
+from kfactory import logger
+
+from gdsfactory.config import CONF, __version__
+
+T = TypeVar("T")
+PathLike = pathlib.Path | str
+
+
+def get_compiled_path(
+    filepath: PathLike, build: Callable[[pathlib.Path], T], schema: str = ""
+) -> pathlib.Path | None:
+    """Returns the snapshot path of a source file, None if the cache is disabled.
+
+    Args:
+        filepath: source file.
+        build: parses the source file into the object to snapshot.
+        schema: fingerprint of the schema of the object.
+    """
+    if not CONF.technology_cache_dir:
+        return None
+    filepath = pathlib.Path(filepath).resolve()
+    source = hashlib.sha256(str(filepath).encode()).hexdigest()[:16]
+    content = hashlib.sha256(
+        b"\0".join(
+            [
+                __version__.encode(),
+                build.__qualname__.encode(),
+                schema.encode(),
+                filepath.read_bytes(),
+            ]
+        )
+    ).hexdigest()[:16]
+    return pathlib.Path(CONF.technology_cache_dir) / f"{source}-{content}.pkl"
+
+
+def load_compiled(
+    filepath: PathLike, build: Callable[[pathlib.Path], T], schema: str = ""
+) -> T:
+    """Returns build(filepath), loaded from its snapshot if the source did not change.
+
+    Args:
+        filepath: source file.
+        build: parses the source file into the object to snapshot.
+        schema: fingerprint of the schema of the object, for example a hash of
+            its pydantic JSON schema. Snapshots of other schemas are rebuilt.
+    """
+    filepath = pathlib.Path(filepath)
+    path = get_compiled_path(filepath, build, schema=schema)
+    if path is None:
+        return build(filepath)
+
+    if path.exists():
+        try:
+            return pickle.loads(path.read_bytes())
+        except Exception as e:
+            logger.debug(f"Rebuilding {str(filepath)!r} snapshot: {e}")
+
+    obj = build(filepath)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # snapshots of the previous versions of this source
+        for stale in path.parent.glob(f"{path.name.split('-')[0]}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp = path.with_suffix(f".{id(obj)}.tmp")
+        tmp.write_bytes(pickle.dumps(obj))
+        tmp.replace(path)
+    except Exception as e:
+        logger.debug(f"Not caching {str(filepath)!r} snapshot: {e}")
+    return obj
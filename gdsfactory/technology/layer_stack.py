@@ -111,23 +111,44 @@ class LogicalLayer(AbstractLayer):
         """
         return hash(self.layer)
 
-    def get_shapes(self, component: Component) -> kf.kdb.Region:
+    def get_key(self) -> tuple[Any, ...]:
+        """Returns a key identifying the shapes of this layer, used for caching."""
+        from gdsfactory.pdk import get_layer
+
+        return ("layer", get_layer(self.layer))
+
+    def get_shapes(
+        self,
+        component: Component,
+        cache: dict[tuple[Any, ...], kf.kdb.Region] | None = None,
+        deep_shape_store: kf.kdb.DeepShapeStore | None = None,
+    ) -> kf.kdb.Region:
         """Return the shapes of the component argument corresponding to this layer.
 
         Arguments:
             component: Component from which to extract shapes on this layer.
+            cache: optional dict of already evaluated layers (by key). Updated in place.
+            deep_shape_store: optional store to keep the shapes hierarchical.
 
         Returns:
             kf.kdb.Region: A region of polygons on this layer.
         """
         from gdsfactory.pdk import get_layer
 
-        polygons_per_layer = component.get_polygons()
         layer_index = get_layer(self.layer)
-        polygons = (
-            polygons_per_layer[layer_index] if layer_index in polygons_per_layer else []
-        )
-        return kf.kdb.Region(polygons)
+        key = ("layer", layer_index)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        iterator = component.begin_shapes_rec(layer_index)
+        if deep_shape_store is not None:
+            region = kf.kdb.Region(iterator, deep_shape_store)
+        else:
+            region = kf.kdb.Region(iterator)
+
+        if cache is not None:
+            cache[key] = region
+        return region
 
 
 class DerivedLayer(AbstractLayer):
@@ -179,18 +200,49 @@ class DerivedLayer(AbstractLayer):
         else:
             return self.operation
 
-    def get_shapes(self, component: Component) -> kf.kdb.Region:
+    def get_key(self) -> tuple[Any, ...]:
+        """Returns a key identifying the shapes of this layer, used for caching.
+
+        Commutative operations get the same key regardless of the operand order.
+        """
+        operation = self.symbol_to_keyword.get(self.operation, self.operation)
+        keys = (self.layer1.get_key(), self.layer2.get_key())
+        if operation in {"and", "or", "xor"}:
+            keys = tuple(sorted(keys, key=repr))
+        return (operation, *keys)
+
+    def get_shapes(
+        self,
+        component: Component,
+        cache: dict[tuple[Any, ...], kf.kdb.Region] | None = None,
+        deep_shape_store: kf.kdb.DeepShapeStore | None = None,
+    ) -> kf.kdb.Region:
         """Return the shapes of the component argument corresponding to this layer.
 
         Arguments:
             component: Component from which to extract shapes on this layer.
+            cache: optional dict of already evaluated layers (by key). Updated in place.
+                Shared subexpressions are only evaluated once.
+            deep_shape_store: optional store to keep the shapes hierarchical.
 
         Returns:
             kf.kdb.Region: A region of polygons on this layer.
         """
-        r1 = self.layer1.get_shapes(component)
-        r2 = self.layer2.get_shapes(component)
-        return gf.component.boolean_operations[self.operation](r1, r2)
+        key = self.get_key() if cache is not None else None
+        if key is not None and key in cache:
+            return cache[key]
+
+        r1 = self.layer1.get_shapes(
+            component, cache=cache, deep_shape_store=deep_shape_store
+        )
+        r2 = self.layer2.get_shapes(
+            component, cache=cache, deep_shape_store=deep_shape_store
+        )
+        region = gf.component.boolean_operations[self.operation](r1, r2)
+
+        if key is not None:
+            cache[key] = region
+        return region
 
 
 class LayerLevel(BaseModel):
@@ -543,16 +595,27 @@ class LayerStack(BaseModel):
         return self
 
 
-def get_component_with_derived_layers(component, layer_stack: LayerStack) -> Component:
+def get_component_with_derived_layers(
+    component, layer_stack: LayerStack, threads: int | None = None
+) -> Component:
     """Returns a component with derived layers.
 
+    Each GDS layer and each shared boolean subexpression is only evaluated once.
+
     Args:
         component: Component to get derived layers for.
         layer_stack: Layer stack to get derived layers from.
+        threads: if set, evaluates the booleans hierarchically with this many KLayout threads.
     """
     from gdsfactory.pdk import get_layer
 
     component_derived = Component()
+    cache: dict[tuple[Any, ...], kf.kdb.Region] = {}
+
+    deep_shape_store = None
+    if threads:
+        deep_shape_store = kf.kdb.DeepShapeStore()
+        deep_shape_store.threads = threads
 
     for layer_name, level in layer_stack.layers.items():
         if isinstance(level.layer, LogicalLayer):
@@ -567,7 +630,9 @@ def get_component_with_derived_layers(component, layer_stack: LayerStack) -> Com
         else:
             raise ValueError("layer must be one of LogicalLayer or DerivedLayer")
 
-        shapes = level.layer.get_shapes(component=component)
+        shapes = level.layer.get_shapes(
+            component=component, cache=cache, deep_shape_store=deep_shape_store
+        )
         component_derived.shapes(derived_layer_index).insert(shapes)
 
     component_derived.add_ports(component.ports)
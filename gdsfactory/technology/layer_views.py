@@ -6,6 +6,9 @@ You can maintain LayerViews in YAML (.yaml) or Klayout XML file (.lyp)
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
 import pathlib
 import re
@@ -23,6 +26,7 @@ from pydantic_extra_types.color import Color
 
 from gdsfactory.name import clean_name
 from gdsfactory.technology.color_utils import ensure_six_digit_hex_color
+from gdsfactory.technology.compiled import load_compiled
 from gdsfactory.technology.xml_utils import make_pretty_xml
 from gdsfactory.technology.yaml_utils import (
     add_color_yaml_presenter,
@@ -785,12 +789,16 @@ class LayerViews(BaseModel):
         if filepath is not None:
             filepath = pathlib.Path(filepath)
             if filepath.suffix == ".lyp":
-                lvs = LayerViews.from_lyp(filepath=filepath)
+                lvs = load_compiled(
+                    filepath, LayerViews.from_lyp, schema=_get_schema_fingerprint()
+                )
                 logger.debug(
                     f"Importing LayerViews from KLayout layer properties file: {str(filepath)!r}."
                 )
             elif filepath.suffix in {".yaml", ".yml"}:
-                lvs = LayerViews.from_yaml(layer_file=filepath)
+                lvs = load_compiled(
+                    filepath, LayerViews.from_yaml, schema=_get_schema_fingerprint()
+                )
                 logger.debug(f"Importing LayerViews from YAML file: {str(filepath)!r}.")
             else:
                 raise ValueError(f"Unable to load LayerViews from {str(filepath)!r}.")
@@ -1191,6 +1199,13 @@ class LayerViews(BaseModel):
         )
 
 
+@functools.cache
+def _get_schema_fingerprint() -> str:
+    """Returns a hash of the JSON schema of LayerViews, to key its snapshots."""
+    schema = json.dumps(LayerViews.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+
 def test_load_lyp() -> None:
     from gdsfactory.config import PATH
 
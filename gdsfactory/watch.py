@@ -2,35 +2,330 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 import sys
 import threading
 import time
 import traceback
+import zlib
 from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
 
 from IPython.terminal.embed import embed
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from gdsfactory.component import Component
 from gdsfactory.config import cwd
-from gdsfactory.pdk import get_active_pdk
-from gdsfactory.read.from_yaml_template import cell_from_yaml_template
+from gdsfactory.pdk import get_active_pdk, get_routing_strategies
+from gdsfactory.read.from_yaml import IncrementalYamlBuilder
+from gdsfactory.read.from_yaml_template import (
+    _evaluate_yaml_template,
+    _split_yaml_definition,
+    cell_from_yaml_template,
+    get_default_settings_dict,
+)
 from gdsfactory.typings import ComponentSpec, PathType
 
+_builders: dict[str, IncrementalYamlBuilder] = {}
+
+
+def update_cell(src_path: PathType, update: bool = False) -> Callable:
+    """Parses a YAML file to a cell function and registers into active pdk.
+
+    Args:
+        src_path: the path to the file
+        update: if True, will update an existing cell function of the same name without raising an error
+    Returns:
+        The cell function parsed from the yaml file.
+
+    """
+    pdk = get_active_pdk()
+    print(f"Active PDK: {pdk.name!r}")
+    filepath = pathlib.Path(src_path)
+    cell_name = filepath.stem.split(".")[0]
+    # FIXME: This is a temporary fix to avoid caching issues
+    # if cell_name in CACHE:
+    #     CACHE.pop(cell_name)
+    function = cell_from_yaml_template(filepath, name=cell_name)
+    try:
+        pdk.register_cells_yaml(**{cell_name: function}, update=update)
+    except ValueError as e:
+        print(e)
+    return function
+
+
+def build_incremental(filepath: pathlib.Path) -> Component:
+    """Rebuilds a *.pic.yml file with its default settings, reusing its last build.
+
+    Args:
+        filepath: the path to the file.
+    """
+    cell_name = filepath.stem.split(".")[0]
+    builder = _builders.get(str(filepath))
+    if builder is None:
+        builder = IncrementalYamlBuilder(
+            routing_strategy=get_routing_strategies(), name=cell_name
+        )
+        _builders[str(filepath)] = builder
+
+    yaml_body, default_settings_def = _split_yaml_definition(filepath)
+    default_settings = get_default_settings_dict(default_settings_def)
+    c = builder.build(_evaluate_yaml_template(yaml_body, default_settings, {}))
+    logging.info("Rebuilt %s: %s", cell_name, builder.stats())
+    return c
+
+
+def build_file(filepath: PathType, incremental: bool = True) -> Component | None:
+    """Builds and shows the cell of a *.pic.yml file or runs a *.py script.
+
+    Args:
+        filepath: the path to the file.
+        incremental: rebuilds only the changed instances and routes of *.pic.yml files.
+    """
+    filepath = pathlib.Path(filepath)
+    if not filepath.exists():
+        return None
+    if str(filepath).endswith(".pic.yml"):
+        cell_func = update_cell(filepath, update=True)
+        c = build_incremental(filepath) if incremental else cell_func()
+        c.show()
+        return c
+    elif str(filepath).endswith(".py"):
+        d = dict(locals(), **globals())
+        d.update(__name__="__main__")
+        exec(filepath.read_text(), d, d)
+    else:
+        print(f"Changed file {filepath} ignored (not .pic.yml or .py)")
+    return None
+
+
+def _init_worker(pdk: str | None = None, path: str | None = None) -> None:
+    """Activates the PDK and registers the *.pic.yml cells of path in a worker."""
+    get_active_pdk(name=pdk).register_cells_yaml(dirpath=path, update=True)
+
+
+def _build_file_in_worker(filepath: str, incremental: bool = True) -> str | None:
+    """Builds a file in a worker process and returns the traceback of any error."""
+    try:
+        build_file(filepath, incremental=incremental)
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
+def _forget_file_in_worker(filepath: str) -> None:
+    """Drops the cell and the incremental state of a deleted file in a worker."""
+    filepath_ = pathlib.Path(filepath)
+    _builders.pop(str(filepath_), None)
+    get_active_pdk().cells.pop(filepath_.stem.split(".")[0], None)
+
+
+class RebuildScheduler:
+    """Debounces file events and rebuilds the files in a bounded worker pool.
+
+    Events for the same file within `debounce` seconds of each other are
+    coalesced into one build. A queued build that is superseded by a newer
+    event is cancelled. Each file always goes to the same worker, so its
+    builds run in order and its worker keeps the incremental state of the
+    previous build.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[str], str | None],
+        debounce: float = 0.3,
+        max_workers: int = 1,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple[Any, ...] = (),
+        on_start: Callable[[str], Any] | None = None,
+        forget: Callable[[str], Any] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            build: builds a file path in a worker. Returns an error message or None.
+            debounce: seconds without events for a file before it is rebuilt.
+            max_workers: number of worker processes. 0 builds in a thread instead.
+            initializer: called in each worker process when it starts.
+            initargs: arguments of the initializer.
+            on_start: called in this process with the file path when its build is submitted.
+            forget: drops the state of a removed file path in its worker.
+            logger: to log the build latencies and errors.
+        """
+        self.build = build
+        self.debounce = debounce
+        self.on_start = on_start
+        self.forget = forget
+        self.logger = logger or logging.root
+        self.latencies: dict[str, float] = {}
+        self._executors: list[Executor] = (
+            [
+                ProcessPoolExecutor(
+                    max_workers=1, initializer=initializer, initargs=initargs
+                )
+                for _ in range(max_workers)
+            ]
+            if max_workers > 0
+            else [ThreadPoolExecutor(max_workers=1)]
+        )
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+        # path: (first event, last event) of the events not yet submitted
+        self._events: dict[str, tuple[float, float]] = {}
+        # path: (future, first event) of the last submitted build
+        self._builds: dict[str, tuple[Future, float]] = {}
+
+    def submit(self, path: PathType) -> None:
+        """Schedules a rebuild of path after the debounce time."""
+        path = str(path)
+        now = time.monotonic()
+        with self._condition:
+            first = self._events.get(path, (now, now))[0]
+            build = self._builds.get(path)
+            if build is not None and build[0].cancel():
+                first = min(first, build[1])
+                del self._builds[path]
+                self.logger.info("Cancelled superseded build of %s", path)
+            self._events[path] = (first, now)
+            self._condition.notify()
+
+    def remove(self, path: PathType) -> None:
+        """Cancels the pending build of path and drops its state in its worker."""
+        path = str(path)
+        with self._condition:
+            self._events.pop(path, None)
+            build = self._builds.get(path)
+            if build is not None and build[0].cancel():
+                del self._builds[path]
+        if self.forget:
+            try:
+                self._get_executor(path).submit(self.forget, path)
+            except RuntimeError:
+                if not self._stopping.is_set():
+                    raise
+
+    def run(self) -> None:
+        """Submits the builds as they become due until shutdown."""
+        while True:
+            with self._condition:
+                if self._stopping.is_set():
+                    return
+                due, timeout = self._pop_due()
+                if not due:
+                    self._condition.wait(timeout)
+                    continue
+            # on_start can be slow (YAML parsing), so it runs without the lock
+            for path, first in due:
+                if self.on_start:
+                    self.on_start(path)
+                self._submit(path, first)
+
+    def shutdown(self) -> None:
+        """Stops the run loop and cancels the queued builds."""
+        with self._condition:
+            self._stopping.set()
+            self._condition.notify()
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _pop_due(self) -> tuple[list[tuple[str, float]], float | None]:
+        """Returns the due (path, first event) and the seconds until the next one."""
+        now = time.monotonic()
+        timeout = None
+        due = []
+        for path, (first, last) in list(self._events.items()):
+            due_time = last + self.debounce
+            if due_time > now:
+                delay = due_time - now
+                timeout = delay if timeout is None else min(timeout, delay)
+                continue
+            del self._events[path]
+            due.append((path, first))
+        return due, timeout
+
+    def _get_executor(self, path: str) -> Executor:
+        """Returns the executor that owns path."""
+        return self._executors[zlib.crc32(path.encode()) % len(self._executors)]
+
+    def _submit(self, path: str, first: float) -> None:
+        try:
+            future = self._get_executor(path).submit(self.build, path)
+        except RuntimeError:
+            if self._stopping.is_set():  # shut down while on_start was running
+                return
+            raise
+        with self._condition:
+            self._builds[path] = (future, first)
+        future.add_done_callback(functools.partial(self._done, path, first))
+
+    def _done(self, path: str, first: float, future: Future) -> None:
+        if future.cancelled():
+            return
+        with self._condition:
+            superseded = (
+                path in self._events or self._builds.get(path, (None,))[0] is not future
+            )
+            if not superseded:
+                del self._builds[path]
+        latency = time.monotonic() - first
+        try:
+            error = future.result()
+        except Exception as e:
+            error = repr(e)
+        if error:
+            self.logger.error("Build of %s failed:\n%s", path, error)
+        elif superseded:
+            self.logger.info("Built superseded %s in %.2f s", path, latency)
+        else:
+            self.latencies[path] = latency
+            self.logger.info("Built %s in %.2f s", path, latency)
+
 
 class FileWatcher(FileSystemEventHandler):
     """Captures *.py or *.pic.yml file change events."""
 
-    def __init__(self, logger=None, path: str | None = None) -> None:
-        """Initialize the YAML event handler."""
+    def __init__(
+        self,
+        logger=None,
+        path: str | None = None,
+        incremental: bool = True,
+        debounce: float = 0.3,
+        max_workers: int = 1,
+        pdk: str | None = None,
+    ) -> None:
+        """Initialize the YAML event handler.
+
+        Args:
+            logger: to log file events.
+            path: directory to watch.
+            incremental: rebuilds only the changed instances and routes of
+                modified *.pic.yml files.
+            debounce: seconds without events for a file before it is rebuilt.
+            max_workers: number of processes building cells. 0 builds in a thread.
+            pdk: name of the PDK to activate in the worker processes.
+        """
         super().__init__()
 
         self.logger = logger or logging.root
-        pdk = get_active_pdk()
-        pdk.register_cells_yaml(dirpath=path, update=True)
-
+        self.incremental = incremental
+        pdk_ = get_active_pdk()
+        pdk_.register_cells_yaml(dirpath=path, update=True)
+
+        self.scheduler = RebuildScheduler(
+            build=functools.partial(_build_file_in_worker, incremental=incremental),
+            debounce=debounce,
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(pdk, path),
+            on_start=self._on_build_start,
+            forget=_forget_file_in_worker,
+            logger=self.logger,
+        )
         self.observer = Observer()
         self.path = path
         self.stopping = threading.Event()
@@ -41,15 +336,14 @@ class FileWatcher(FileSystemEventHandler):
         self.thread.start()
 
     def run(self) -> None:
-        while not self.stopping.is_set():
-            if not self.observer.is_alive():
-                self.observer.start()
-            time.sleep(1)
+        self.observer.start()
+        self.scheduler.run()
         self.observer.stop()
         self.observer.join()
 
     def stop(self) -> None:
         self.stopping.set()
+        self.scheduler.shutdown()
         self.thread.join()
 
     def update_cell(self, src_path, update: bool = False) -> Callable:
@@ -62,19 +356,14 @@ class FileWatcher(FileSystemEventHandler):
             The cell function parsed from the yaml file.
 
         """
-        pdk = get_active_pdk()
-        print(f"Active PDK: {pdk.name!r}")
-        filepath = pathlib.Path(src_path)
-        cell_name = filepath.stem.split(".")[0]
-        # FIXME: This is a temporary fix to avoid caching issues
-        # if cell_name in CACHE:
-        #     CACHE.pop(cell_name)
-        function = cell_from_yaml_template(filepath, name=cell_name)
-        try:
-            pdk.register_cells_yaml(**{cell_name: function}, update=update)
-        except ValueError as e:
-            print(e)
-        return function
+        return update_cell(src_path, update=update)
+
+    def _on_build_start(self, src_path: str) -> None:
+        if src_path.endswith(".pic.yml") and pathlib.Path(src_path).exists():
+            try:
+                self.update_cell(src_path, update=True)
+            except Exception:
+                traceback.print_exc(file=sys.stdout)
 
     def on_moved(self, event) -> None:
         super().on_moved(event)
@@ -82,8 +371,7 @@ class FileWatcher(FileSystemEventHandler):
         what = "directory" if event.is_directory else "file"
         if what == "file" and event.dest_path.endswith(".pic.yml"):
             self.logger.info("Moved %s: %s", what, event.src_path)
-            self.update_cell(event.dest_path)
-            self.get_component(event.src_path)
+            self.scheduler.submit(event.dest_path)
 
     def on_created(self, event) -> None:
         super().on_created(event)
@@ -95,7 +383,7 @@ class FileWatcher(FileSystemEventHandler):
             or event.src_path.endswith(".py")
         ):
             self.logger.info("Created %s: %s", what, event.src_path)
-            self.get_component(event.src_path)
+            self.scheduler.submit(event.src_path)
 
     def on_deleted(self, event) -> None:
         super().on_deleted(event)
@@ -108,6 +396,7 @@ class FileWatcher(FileSystemEventHandler):
             filepath = pathlib.Path(event.src_path)
             cell_name = filepath.stem.split(".")[0]
             pdk.remove_cell(cell_name)
+            self.scheduler.remove(event.src_path)
 
     def on_modified(self, event) -> None:
         super().on_modified(event)
@@ -119,35 +408,28 @@ class FileWatcher(FileSystemEventHandler):
             or event.src_path.endswith(".py")
         ):
             self.logger.info("Modified %s: %s", what, event.src_path)
-            self.get_component(event.src_path)
+            self.scheduler.submit(event.src_path)
 
     def update(self):
         pass
 
     def get_component(self, filepath):
+        """Builds filepath in this process, printing any error."""
         self.update()
         try:
-            filepath = pathlib.Path(filepath)
-            if filepath.exists():
-                if str(filepath).endswith(".pic.yml"):
-                    cell_func = self.update_cell(filepath, update=True)
-                    c = cell_func()
-                    c.show()
-                    # on_yaml_cell_modified.fire(c)
-                    return c
-                elif str(filepath).endswith(".py"):
-                    d = dict(locals(), **globals())
-                    d.update(__name__="__main__")
-                    exec(filepath.read_text(), d, d)
-                else:
-                    print("Changed file {filepath} ignored (not .pic.yml or .py)")
-
+            return build_file(filepath, incremental=self.incremental)
         except Exception as e:
             traceback.print_exc(file=sys.stdout)
             print(e)
 
 
-def watch(path: PathType | None = cwd, pdk: str | None = None) -> None:
+def watch(
+    path: PathType | None = cwd,
+    pdk: str | None = None,
+    incremental: bool = True,
+    debounce: float = 0.3,
+    max_workers: int = 1,
+) -> None:
     path = str(path)
     logging.basicConfig(
         level=logging.INFO,
@@ -156,7 +438,13 @@ def watch(path: PathType | None = cwd, pdk: str | None = None) -> None:
     )
     if pdk:
         get_active_pdk(name=pdk)
-    watcher = FileWatcher(path=path)
+    watcher = FileWatcher(
+        path=path,
+        incremental=incremental,
+        debounce=debounce,
+        max_workers=max_workers,
+        pdk=pdk,
+    )
     watcher.start()
     logging.info(
         f"File watcher looking for changes in *.py and *.pic.yml files in {path!r}. Stop with Ctrl+C"
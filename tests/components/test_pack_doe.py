@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+from gdsfactory.components.pack_doe import generate_doe
+
+
+def test_generate_doe_max_workers() -> None:
+    settings = dict(length_mmi=[2.5, 3.5, 4.5], width_mmi=[4.0, 4.1, 4.2])
+    calls = []
+    components, _ = generate_doe(
+        "mmi1x2",
+        settings,
+        max_workers=2,
+        progress=lambda done, total: calls.append((done, total)),
+    )
+    assert calls == [(1, 3), (2, 3), (3, 3)]
+    names = [c.name for c in components]
+    sizes = [(c.dxsize, c.dysize) for c in components]
+    ports = [len(c.ports) for c in components]
+
+    gf.clear_cache()
+    components, _ = generate_doe("mmi1x2", settings)
+    assert names == [c.name for c in components]
+    assert sizes == [(c.dxsize, c.dysize) for c in components]
+    assert ports == [len(c.ports) for c in components]
+
+
+def test_pack_doe_max_workers_cached(tmp_path) -> None:
+    c = gf.components.pack_doe(
+        "mmi1x2",
+        settings=dict(length_mmi=(5.5, 6.5), width_mmi=(4.3, 4.4)),
+        function="add_fiber_array",
+        max_workers=2,
+    )
+    mmi = gf.components.mmi1x2(length_mmi=5.5, width_mmi=4.3)
+    assert len(list(gf.kcl.layout.cells(mmi.name))) == 1
+
+    top = gf.Component()
+    top << c
+    top << mmi
+    top.write_gds(tmp_path / "doe.gds")
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import numpy as np
+
+import gdsfactory as gf
+from gdsfactory.export.to_np import to_np
+
+
+def test_to_np_tiles() -> None:
+    c = gf.components.bend_circular()
+    img = to_np(c, nm_per_pixel=20, tile_size=10_000)
+    img_tiled = to_np(c, nm_per_pixel=20, tile_size=64, max_workers=4)
+    assert img.shape == (552, 552)
+    np.testing.assert_array_equal(img, img_tiled)
+
+
+def test_to_np_rectangle(tmp_path) -> None:
+    c = gf.components.rectangle(size=(2, 1), layer=(1, 0))
+    img = to_np(c, nm_per_pixel=100, pad_width=0)
+    assert img.shape == (20, 10)
+    assert img.sum() == 200
+
+    filepath = tmp_path / "rectangle.npy"
+    img = to_np(c, nm_per_pixel=100, supersampling=4, filepath=filepath)
+    assert isinstance(img, np.memmap)
+    np.testing.assert_allclose(np.load(filepath).sum(), 200)
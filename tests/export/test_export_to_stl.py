@@ -1,9 +1,10 @@
 import pathlib
 
+import numpy as np
 import pytest
 
 import gdsfactory as gf
-from gdsfactory.export.to_stl import to_stl
+from gdsfactory.export.to_stl import extrude_polygons, to_stl
 from gdsfactory.generic_tech import LAYER
 
 
@@ -36,3 +37,12 @@ def test_export_exclude_layers() -> None:
         to_stl(component, filepath, exclude_layers=exclude_layers)
         filepath = "test_49_0.stl"
         assert not pathlib.Path(filepath).exists()
+
+
+def test_extrude_polygons_translated_copies() -> None:
+    square = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=float)
+    points = np.concatenate([square, square + (0.3, 5)])
+    offsets = np.array([0, 4, 8])
+    mesh = extrude_polygons(points, offsets, height=2, zmin=1)
+    assert np.isclose(mesh.volume, 4)
+    assert np.allclose(mesh.bounds, [(0, 0, 1), (1.3, 6, 3)])
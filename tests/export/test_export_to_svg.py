@@ -0,0 +1,40 @@
+import gdsfactory as gf
+from gdsfactory.export.to_svg import to_svg
+from gdsfactory.technology import LayerLevel, LayerStack, LogicalLayer
+
+
+def get_layer_stack() -> LayerStack:
+    """Returns a LayerStack with a single logical layer."""
+    return LayerStack(
+        layers=dict(
+            core=LayerLevel(layer=LogicalLayer(layer=(1, 0)), thickness=0.22, zmin=0)
+        )
+    )
+
+
+def test_to_svg_hierarchy(tmp_path) -> None:
+    c = gf.Component()
+    straight = gf.components.straight()
+    for i in range(3):
+        ref = c << straight
+        ref.dmovey(10 * i)
+
+    filename = tmp_path / "hierarchy.svg"
+    to_svg(c, layer_stack=get_layer_stack(), filename=filename)
+    svg = filename.read_text()
+    assert svg.count("<path") == 1
+    assert svg.count("<use") == 3
+
+
+def test_to_svg_flatten(tmp_path) -> None:
+    c = gf.Component()
+    straight = gf.components.straight()
+    for i in range(3):
+        ref = c << straight
+        ref.dmovey(10 * i)
+
+    filename = tmp_path / "flat.svg"
+    to_svg(c, layer_stack=get_layer_stack(), filename=filename, flatten=True)
+    svg = filename.read_text()
+    assert svg.count("<path") == 3
+    assert "<use" not in svg
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import csv
+import json
+
+import gdsfactory as gf
+
+
+def test_write_test_manifest(tmp_path) -> None:
+    c = gf.Component()
+    for i, length in enumerate([10, 20]):
+        ref = c << gf.components.straight(length=length)
+        ref.dmove((0, 10 * i))
+    c.add_ref(gf.components.straight(length=30), columns=3, rows=1, spacing=(50, 0))
+
+    csvpath = tmp_path / "manifest.csv"
+    gf.labels.write_test_manifest(c, csvpath, batch_size=2)
+    rows = list(csv.DictReader(open(csvpath)))
+    assert len(rows) == 5
+    assert [int(row["x"]) for row in rows[-3:]] == [0, 50000, 100000]
+    assert json.loads(rows[-1]["ports"])["o2"]["center"] == [130.0, 0.0]
+
+    csvpath_sharded = tmp_path / "manifest_sharded.csv"
+    gf.labels.write_test_manifest(c, csvpath_sharded, batch_size=2, max_workers=2)
+    assert csvpath_sharded.read_text() == csvpath.read_text()
@@ -5,7 +5,12 @@ import pytest
 from pytest_regressions.data_regression import DataRegressionFixture
 
 from gdsfactory.difftest import difftest
-from gdsfactory.read.from_yaml import from_yaml, sample_doe_function, sample_mmis
+from gdsfactory.read.from_yaml import (
+    IncrementalYamlBuilder,
+    from_yaml,
+    sample_doe_function,
+    sample_mmis,
+)
 
 sample_connections = """
 name: sample_connections
@@ -638,6 +643,40 @@ def test_gds_and_settings(
         data_regression.check(c.to_dict())
 
 
+def _xor_is_empty(c1, c2) -> bool:
+    import gdsfactory as gf
+
+    return all(
+        (
+            gf.kdb.Region(c1.begin_shapes_rec(layer))
+            ^ gf.kdb.Region(c2.begin_shapes_rec(layer))
+        ).is_empty()
+        for layer in c1.kcl.layer_indexes()
+    )
+
+
+@pytest.mark.parametrize("yaml_key", yaml_strings.keys())
+def test_incremental_yaml_builder(yaml_key: str) -> None:
+    yaml_string = yaml_strings[yaml_key]
+    builder = IncrementalYamlBuilder()
+    builder.build(yaml_string)
+    c = builder.build(yaml_string)
+    assert builder.stats()["instances_placed"] == 0
+    assert _xor_is_empty(c, from_yaml(yaml_string))
+
+
+def test_incremental_yaml_builder_placement() -> None:
+    builder = IncrementalYamlBuilder()
+    builder.build(sample_mmis)
+    moved = sample_mmis.replace("x: 100", "x: 120")
+    c = builder.build(moved)
+    assert builder.stats() == dict(
+        instances_placed=1, instances_reused=1, bundles_routed=1, bundles_reused=0
+    )
+    assert _xor_is_empty(c, from_yaml(moved))
+    assert c.routes
+
+
 # @pytest.mark.parametrize("yaml_key", yaml_strings.keys())
 # def test_netlists(
 #     yaml_key: str,
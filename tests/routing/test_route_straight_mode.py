@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+import gdsfactory as gf
+from gdsfactory.routing.straight_cells import get_binary_lengths, get_layout_size
+
+
+def test_get_binary_lengths() -> None:
+    assert get_binary_lengths(11) == [8, 2, 1]
+    assert sum(get_binary_lengths(123_457)) == 123_457
+
+
+def route_fanout(straight_mode: str) -> tuple[gf.Component, list]:
+    c = gf.Component()
+    xs1 = [-500, -300, -100, -90, -80, -55, -35, 200, 210, 240, 500, 650]
+    xs2 = [-20 + i * 10 for i in range(6)] + [400 + i * 10 for i in range(6)]
+    ports1 = [
+        gf.Port(f"top_{i}", center=(x, 0), width=0.5, orientation=90, layer=(1, 0))
+        for i, x in enumerate(xs1)
+    ]
+    ports2 = [
+        gf.Port(f"bot_{i}", center=(x, 200), width=0.5, orientation=270, layer=(1, 0))
+        for i, x in enumerate(xs2)
+    ]
+    routes = gf.routing.route_bundle(c, ports1, ports2, straight_mode=straight_mode)
+    return c, routes
+
+
+@pytest.mark.parametrize("straight_mode", ["binary", "polygon"])
+def test_route_bundle_straight_mode(straight_mode: str) -> None:
+    c_cell, routes_cell = route_fanout("cell")
+    c, routes = route_fanout(straight_mode)
+
+    assert [r.length_straights for r in routes] == [
+        r.length_straights for r in routes_cell
+    ]
+    assert c.area(layer=(1, 0)) == pytest.approx(c_cell.area(layer=(1, 0)))
+    size = get_layout_size(c, layout_format="OASIS")
+    size_cell = get_layout_size(c_cell, layout_format="OASIS")
+    assert size["cells"] < size_cell["cells"]
+
+
+def test_route_single_straight_mode() -> None:
+    c = gf.Component()
+    mmi1 = c << gf.components.mmi1x2()
+    mmi2 = c << gf.components.mmi1x2()
+    mmi2.dmove((140.123, 70.311))
+    route = gf.routing.route_single(
+        c, mmi1.ports["o2"], mmi2.ports["o1"], straight_mode="binary"
+    )
+    cell_names = {inst.cell.name for inst in c.insts}
+    assert all(inst.cell.name in cell_names for inst in route.instances)
+    assert route.length_straights == 144309
+
+
+def test_route_single_straight_mode_polygon() -> None:
+    kcl = gf.kcl
+    top_cells = set(kcl.layout.each_top_cell())
+    c = gf.Component()
+    xs = gf.cross_section.strip(width=0.45)
+    p1 = gf.Port("p1", center=(0, 0), width=0.45, orientation=0, layer=(1, 0))
+    p2 = gf.Port("p2", center=(16.384, 0), width=0.45, orientation=180, layer=(1, 0))
+    p3 = gf.Port("p3", center=(0, 50), width=0.45, orientation=0, layer=(1, 0))
+    p4 = gf.Port("p4", center=(30, 50), width=0.45, orientation=180, layer=(1, 0))
+    # a single power of two straight and a composite one
+    for port1, port2 in [(p1, p2), (p3, p4)]:
+        gf.routing.route_single(
+            c, port1, port2, cross_section=xs, straight_mode="polygon"
+        )
+
+    assert not c.insts
+    assert c.area(layer=(1, 0)) == pytest.approx((16.384 + 30) * 0.45)
+    orphans = [
+        kcl[ci].name
+        for ci in set(kcl.layout.each_top_cell()) - top_cells
+        if kcl[ci].name.startswith("straight")
+    ]
+    assert not orphans
@@ -1,7 +1,7 @@
 from functools import partial
 
 import gdsfactory as gf
-from gdsfactory.technology import LayerStack, LayerView, LayerViews
+from gdsfactory.technology import LayerStack, LayerView, LayerViews, load_compiled
 from gdsfactory.typings import Layer, LayerLevel, LayerMap
 
 nm = 1e-3
@@ -50,6 +50,30 @@ def get_layer_stack_faba(
     )
 
 
+def test_layer_views_compiled(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(gf.CONF, "technology_cache_dir", tmp_path / "cache")
+    filepath = tmp_path / "layer_views.yaml"
+    filepath.write_text(gf.config.PATH.klayout_yaml.read_text())
+
+    lvs = LayerViews(filepath=filepath)
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+    assert LayerViews(filepath=filepath) == lvs
+
+    filepath.write_text(
+        filepath.read_text().replace(
+            "LayerViews:", "LayerViews:\n  NEW:\n    layer: [1000, 0]", 1
+        )
+    )
+    assert "NEW" in LayerViews(filepath=filepath).layer_views
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    # snapshots of another schema are rebuilt
+    builds = []
+    for schema in ["old", "old", "new"]:
+        load_compiled(filepath, builds.append, schema=schema)
+    assert len(builds) == 2
+
+
 if __name__ == "__main__":
     LAYER_STACK = get_layer_stack_faba()
     WIDTH = 2
@@ -1,6 +1,8 @@
 import pytest
 
-from gdsfactory.generic_tech import LAYER_STACK
+import gdsfactory as gf
+from gdsfactory.generic_tech import LAYER, LAYER_STACK
+from gdsfactory.technology.layer_stack import LogicalLayer
 
 
 @pytest.mark.skip(
@@ -26,5 +28,18 @@ def test_component_with_derived_layers() -> None:
     assert True
 
 
+def test_derived_layer_cache() -> None:
+    c = gf.components.straight_heater_metal()
+    wg = LogicalLayer(layer=LAYER.WG)
+    heater = LogicalLayer(layer=LAYER.HEATER)
+    cache = {}
+    r1 = (wg - heater).get_shapes(c, cache=cache)
+    r2 = ((wg - heater) | (heater & wg)).get_shapes(c, cache=cache)
+    assert (wg & heater).get_key() == (heater & wg).get_key()
+    assert len(cache) == 5
+    assert (r1 ^ (wg - heater).get_shapes(c)).is_empty()
+    assert (r2 ^ wg.get_shapes(c)).is_empty()
+
+
 if __name__ == "__main__":
     test_component_with_derived_layers()
@@ -1,4 +1,7 @@
+import pytest
+
 import gdsfactory as gf
+from gdsfactory.cell import LazyComponent, evict, get_cache_stats
 
 
 @gf.cell
@@ -19,6 +22,106 @@ def test_double_decorated_cell():
     assert d == dict(b=10), d
 
 
+@gf.cell(maxsize=2)
+def cached_triangle(a: float = 1) -> gf.Component:
+    c = gf.Component()
+    c.add_polygon([(0, 0), (a, 0), (a, a)], layer=(1, 0))
+    return c
+
+
+def test_cell_cache_eviction() -> None:
+    evict(cached_triangle)
+    t1 = cached_triangle(a=1)
+    assert cached_triangle(a=1) is t1
+    t2 = cached_triangle(a=2)
+    c = gf.Component()
+    c.add_ref(t1)
+
+    cached_triangle(a=3)
+    # t2 is the least recently used cell not instantiated by another cell
+    assert t2._destroyed()
+    assert not t1._destroyed()
+    assert cached_triangle(a=1) is t1
+
+    stats = get_cache_stats(cached_triangle)["cached_triangle"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+    assert evict("cached_triangle") == 2
+    assert get_cache_stats("cached_triangle")["cached_triangle"]["size"] == 0
+    assert not t1._destroyed()
+
+
+def test_cell_cache_delete_and_recall() -> None:
+    evict(cached_triangle)
+    t1 = cached_triangle(a=1)
+    cached_triangle(a=2)
+    hits = get_cache_stats(cached_triangle)["cached_triangle"]["hits"]
+    t1.delete()
+    # the destroyed cell is dropped from the cache and built again
+    t1 = cached_triangle(a=1)
+    assert not t1._destroyed()
+    stats = get_cache_stats(cached_triangle)["cached_triangle"]
+    # only the lookup returning the destroyed cell counts, not the cleanup
+    assert stats["hits"] == hits + 1
+    assert stats["size"] == 2
+
+
+calls = []
+
+
+@gf.cell
+def cached_on_disk(length: float = 10) -> gf.Component:
+    calls.append(length)
+    return gf.components.straight(length=length).dup()
+
+
+def test_cell_disk_cache(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gf.CONF, "cell_disk_cache_dir", tmp_path)
+    c = cached_on_disk(length=5)
+    name = c.name
+    ports = [str(port) for port in c.ports]
+    assert calls == [5]
+
+    evict(cached_on_disk)
+    c = cached_on_disk(length=5)
+    assert calls == [5]
+    assert c.name == name
+    assert [str(port) for port in c.ports] == ports
+    assert c.dbbox() == gf.components.straight(length=5).dbbox()
+
+
+@gf.cell(lazy=True)
+def lazy_on_disk(length: float = 10) -> gf.Component:
+    calls.append(length)
+    return gf.components.straight(length=length).dup()
+
+
+def test_cell_lazy(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gf.CONF, "cell_disk_cache_dir", tmp_path)
+    calls.clear()
+    c = lazy_on_disk(length=7)
+    name, bbox = c.name, c.dbbox()
+    ports = [str(port) for port in c.ports]
+
+    evict(lazy_on_disk)
+    lazy = lazy_on_disk(length=7)
+    assert isinstance(lazy, LazyComponent)
+    assert gf.get_component(lazy) is lazy
+    assert lazy.name == name
+    assert lazy.dbbox() == bbox
+    assert [str(port) for port in lazy.ports] == ports
+    assert lazy.settings.model_dump() == dict(length=7)
+    assert not lazy.is_built
+
+    packed = gf.pack([lazy])[0]
+    assert lazy.is_built
+    assert packed.insts[0].cell.name == name
+    assert calls == [7]
+
+
 if __name__ == "__main__":
     test_double_decorated_cell()
     # c = outer(b=10)
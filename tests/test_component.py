@@ -43,3 +43,15 @@ def test_get_polygons():
 
     polygons = c.get_polygons(by="tuple")
     assert (1, 0) in polygons
+
+
+def test_get_polygons_arrays():
+    c = gf.components.straight(length=10)
+    points, offsets = c.get_polygons_arrays(by="tuple")[(1, 0)]
+    assert offsets.tolist() == [0, 4]
+    assert points.shape == (4, 2)
+    assert points[:, 0].max() == 10
+
+    polygons = c.get_polygons_points(by="tuple")[(1, 0)]
+    assert len(polygons) == 1
+    assert (polygons[0] == points).all()
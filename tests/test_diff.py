@@ -1,6 +1,7 @@
+import shutil
 from pathlib import Path
 
-from gdsfactory.difftest import diff
+from gdsfactory.difftest import diff, diff_batch
 
 _gds_dir = Path(__file__).parent / "gds"
 
@@ -36,3 +37,26 @@ def test_xor2(capsys):
         capsys=capsys,
         layers_with_xor=["2/0"],
     )
+
+
+def test_diff_batch(tmp_path):
+    dirpath_ref = tmp_path / "ref"
+    dirpath_run = tmp_path / "run"
+    dirpath_ref.mkdir()
+    dirpath_run.mkdir()
+    shutil.copy(_gds_dir / "big_rect.gds", dirpath_ref / "rect.gds")
+    shutil.copy(_gds_dir / "small_rect.gds", dirpath_run / "rect.gds")
+    shutil.copy(_gds_dir / "straight.gds", dirpath_ref / "straight.gds")
+    shutil.copy(_gds_dir / "straight.gds", dirpath_run / "straight.gds")
+    shutil.copy(_gds_dir / "mmi1x2.gds", dirpath_run / "mmi1x2.gds")
+
+    manifest = tmp_path / "manifest.json"
+    report = diff_batch(
+        run_files=sorted(dirpath_run.glob("*.gds")),
+        dirpath_ref=dirpath_ref,
+        manifest=manifest,
+        max_workers=1,
+    )
+    statuses = {name: cell["status"] for name, cell in report["cells"].items()}
+    assert statuses == {"rect": "changed", "straight": "identical", "mmi1x2": "new"}
+    assert manifest.exists()
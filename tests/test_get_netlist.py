@@ -156,6 +156,19 @@ def test_get_netlist_close_enough_fails() -> None:
     assert len(links) == 0
 
 
+def test_get_netlist_close_enough_tolerance() -> None:
+    """Move connection 1nm outwards and connect within tolerance."""
+    c = gf.Component()
+    i1 = c.add_ref(gf.components.straight(), "i1")
+    i2 = c.add_ref(gf.components.straight(), "i2")
+    i2.connect("o2", i1.ports["o1"])
+    i2.dmovex(0.001)
+    netlist = c.get_netlist(tolerance=1)
+    links = netlist["nets"]
+    assert len(links) == 1
+    assert len(netlist["warnings"]["optical"]["offset_mismatch"]) == 1
+
+
 def test_get_netlist_close_enough_orthogonal_fails() -> None:
     c = gf.Component()
     i1 = c.add_ref(gf.components.straight(), "i1")
@@ -43,3 +43,20 @@ def test_n_netlists():
     assert len(netlists) == 2
     assert "hcomponent_top" in netlists
     assert "hcomponent_l2" in netlists
+
+
+def test_netlist_each_cell_once():
+    calls = []
+
+    def get_netlist_func(component, **kwargs):
+        calls.append(component.name)
+        return gf.get_netlist.get_netlist(component, **kwargs)
+
+    c = hcomponent_top()
+    cache = {}
+    netlists = get_netlist_recursive(c, get_netlist_func=get_netlist_func, cache=cache)
+    assert sorted(calls) == ["hcomponent_l2", "hcomponent_top"]
+    assert len(netlists["hcomponent_top"]["instances"]) == 1
+
+    get_netlist_recursive(c, get_netlist_func=get_netlist_func, cache=cache)
+    assert len(calls) == 2
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import gdsfactory as gf
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, gdsfactory as gf; gf.Component(); gf.get_active_pdk(); "
+        "print(sorted(m for m in ('gdsfactory.components', 'gdsfactory.routing', "
+        "'gdsfactory.labels', 'gdsfactory.export') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_lazy_attributes() -> None:
+    import gdsfactory.grid
+    import gdsfactory.pack
+    import gdsfactory.read.from_yaml  # noqa: F401
+
+    assert callable(gf.pack)
+    assert callable(gf.grid)
+    assert callable(gf.read.from_yaml)
+    assert gf.c is gf.components
+    assert "straight" in gf.get_active_pdk().cells
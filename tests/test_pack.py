@@ -1,6 +1,7 @@
 import numpy as np
 
 import gdsfactory as gf
+from gdsfactory.pack import pack_rectangles
 
 
 def test_pack() -> None:
@@ -46,6 +47,37 @@ def test_pack_with_settings() -> None:
     assert components_packed_list[0]
 
 
+def test_pack_rectangles() -> None:
+    sizes = [(30, 10)] * 3 + [(10, 30)] * 3
+    bins = pack_rectangles(sizes, max_size=(30, 30), rotation=True)
+    assert len(bins) == 2
+    assert sorted(rid for b in bins for rid in b) == list(range(6))
+    for b in bins:
+        assert all(x + w <= 30 and y + h <= 30 for x, y, w, h in b.values())
+
+
+def test_pack_rectangles_keeps_last_bin() -> None:
+    # the last bin can not be shrunk to the aspect ratio, so it keeps max_size
+    sizes = [(49, 42), (18, 47), (57, 48), (41, 20)]
+    bins = pack_rectangles(sizes, aspect_ratio=(6, 8), max_size=(124, 80))
+    assert sorted(rid for b in bins for rid in b) == list(range(4))
+
+
+def test_pack_with_sizes() -> None:
+    """Test packing component specs with precomputed sizes."""
+    component_list = [
+        gf.components.rectangle(size=(i, 2), port_type=None) for i in range(1, 10)
+    ]
+    sizes = [(c.dxsize, c.dysize) for c in component_list]
+    specs = [
+        dict(component="rectangle", settings=dict(size=(i, 2), port_type=None))
+        for i in range(1, 10)
+    ]
+    c1 = gf.pack(component_list, spacing=1)[0]
+    c2 = gf.pack(specs, sizes=sizes, spacing=1)[0]
+    assert c1.dbbox() == c2.dbbox()
+
+
 if __name__ == "__main__":
     test_pack()
     test_pack_with_settings()
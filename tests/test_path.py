@@ -219,3 +219,19 @@ def test_dmirror() -> None:
     path.dmirror((0, 0), (0, 1))
     expected_points = np.array([[0, 0], [-1, 1], [-2, 0]])
     np.testing.assert_allclose(path.points, expected_points, atol=1e-4)
+
+
+def test_euler_batch() -> None:
+    radii = [5, 10, 10, 20]
+    angles = [90, -90, 45, 180]
+    paths = gf.path.euler_batch(radius=radii, angle=angles, npoints=100)
+    for path, radius, angle in zip(paths, radii, angles):
+        expected = gf.path.euler(radius=radius, angle=angle, npoints=100)
+        np.testing.assert_array_equal(path.points, expected.points)
+        assert path.end_angle == expected.end_angle
+        assert path.info == expected.info
+
+    p1 = gf.path.euler(radius=10, angle=90)
+    p1.points[0] = (1, 1)
+    p2 = gf.path.euler(radius=10, angle=90)
+    assert tuple(p2.points[0]) == (0, 0)
@@ -154,5 +154,54 @@ def test_extrude_component_along_path():
     assert c
 
 
+def test_along_path_arrays() -> None:
+    via = gf.c.rectangle(size=(1, 1), centered=True)
+    p = gf.path.straight(length=100)
+    p += gf.path.arc(10)
+    p += gf.path.straight(length=50)
+
+    c = gf.path.along_path(p, component=via, spacing=5, padding=2)
+    number = int((p.length() - 2 * 2) // 5 + 1)
+    assert sum(max(inst.na, 1) for inst in c.insts) == number
+    # one array per straight segment and one instance per via on the arc
+    assert c.insts[0].na == 20
+    assert c.insts[-1].na == 10
+
+
+def test_extrude_sections_batched() -> None:
+    p = gf.path.euler(radius=10, angle=90)
+    p += gf.path.straight(10)
+    p += gf.path.arc(10)
+    xs = gf.cross_section.pn_with_trenches(layer="WG")
+
+    c = gf.path.extrude(p, cross_section=xs)
+    ref = gf.path._extrude_sections_loop(p, cross_section=xs)
+    for layer_index in ref.kcl.layer_indexes():
+        polygons = sorted(str(s.polygon) for s in c.shapes(layer_index).each())
+        polygons_ref = sorted(str(s.polygon) for s in ref.shapes(layer_index).each())
+        assert polygons == polygons_ref
+
+
+def test_extrude_cache() -> None:
+    cache = gf.path.ExtrusionCache(maxsize=2)
+    key = (1, "strip")
+    assert cache.get(key, lambda: 1) == 1
+    assert cache.get(key, lambda: 2) == 1
+    cache.get((2, "strip"), lambda: 2)
+    cache.get((3, "strip"), lambda: 3)
+    assert cache.stats() == dict(hits=1, misses=3, evictions=1, size=2, maxsize=2)
+
+    p = gf.path.euler(radius=10, angle=90)
+    gf.path.extrusion_cache.clear()
+    hits = gf.path.extrusion_cache.hits
+    c1 = gf.path.extrude(p, cross_section="strip")
+    c1.add_polygon([(0, 0), (1, 0), (1, 1)], layer=(2, 0))
+    c2 = gf.path.extrude(p, cross_section="strip")
+    assert gf.path.extrusion_cache.hits == hits + 1
+    assert c2.ports["o2"].dcenter == c1.ports["o2"].dcenter
+    assert c2.area(layer=(1, 0)) == c1.area(layer=(1, 0))
+    assert not c2.area(layer=(2, 0))
+
+
 if __name__ == "__main__":
     test_transition_cross_section_different_layers()
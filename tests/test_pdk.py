@@ -12,6 +12,35 @@ def test_get_cross_section() -> None:
     assert xs.sections[0].width == 1
 
 
+def test_get_cross_section_cache() -> None:
+    pdk = gf.get_active_pdk()
+    xs = pdk.get_cross_section("strip", width=0.6)
+    assert pdk.get_cross_section("strip", width=0.6) is xs
+    assert pdk.get_cross_section("strip", width=0.7) is not xs
+
+    strip = pdk.cross_sections["strip"]
+    pdk.register_cross_sections(strip=gf.partial(strip, radius=20))
+    try:
+        assert pdk.get_cross_section("strip", width=0.6).radius == 20
+    finally:
+        pdk.register_cross_sections(strip=strip)
+    assert pdk.get_cross_section("strip", width=0.6) == xs
+
+
+def test_lazy_cells() -> None:
+    from gdsfactory.generic_tech import get_generic_cells
+    from gdsfactory.pdk import LazyCells
+
+    cells = LazyCells(get_generic_cells)
+    assert cells._load is not None
+    cells |= {"my_straight": gf.components.straight}
+    assert "straight" in cells and "my_straight" in cells
+
+    generic_cells = gf.get_active_pdk().cells
+    pdk = gf.Pdk(name="derived", cells=generic_cells, layers=LAYER)
+    assert len(pdk.cells) == len(generic_cells) > 0
+
+
 def test_get_layer():
     assert gf.get_layer(1) == LAYER.WG
     assert gf.get_layer((1, 0)) == LAYER.WG
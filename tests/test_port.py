@@ -62,3 +62,38 @@ def test_get_ports_sort_counter_clockwise() -> None:
 def test_rename_ports(port_type, data_regression: DataRegressionFixture):
     c = gf.components.nxn(port_type=port_type)
     data_regression.check(c.to_dict())
+
+
+def test_port_table() -> None:
+    c = gf.Component()
+    c.add_port("e1", center=(10, 0), width=1, orientation=0, layer=(1, 0))
+    c.add_port("e2", center=(10, 5), width=1, orientation=0, layer=(1, 0))
+    c.add_port("n1", center=(0, 10), width=2, orientation=90, layer=(2, 0))
+    c.add_port("w1", center=(-10, 0), width=1, orientation=180, layer=(1, 0))
+    c.add_port(
+        "s1", center=(0, -10), width=1, orientation=270, layer=(1, 0), port_type="dc"
+    )
+    table = gf.port.PortTable(c.ports)
+
+    assert list(table.x) == [10, 10, 0, -10, 0]
+    assert list(table.directions()) == [0, 0, 1, 2, 3]
+    assert table[table.select(orientation=0)] == [c.ports["e1"], c.ports["e2"]]
+    # like select_ports, orientations are not wrapped
+    assert not len(table.select(orientation=-90))
+    assert table[table.select(layer=(2, 0))] == [c.ports["n1"]]
+    assert table[table.select(port_type="dc")] == [c.ports["s1"]]
+    assert table[table.select(prefix="e", suffix="2")] == [c.ports["e2"]]
+    assert [p.name for p in table[table.sort_clockwise()]] == [
+        "w1",
+        "n1",
+        "e2",
+        "e1",
+        "s1",
+    ]
+    assert [p.name for p in table[table.sort_counter_clockwise()]] == [
+        "e1",
+        "e2",
+        "n1",
+        "w1",
+        "s1",
+    ]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from gdsfactory.watch import RebuildScheduler
+
+
+def test_rebuild_scheduler_debounce() -> None:
+    built: list[str] = []
+    scheduler = RebuildScheduler(build=built.append, debounce=0.2, max_workers=0)
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    for _ in range(5):
+        scheduler.submit("a.pic.yml")
+        time.sleep(0.02)
+    scheduler.submit("b.pic.yml")
+    time.sleep(1)
+    scheduler.shutdown()
+    thread.join()
+
+    assert sorted(built) == ["a.pic.yml", "b.pic.yml"]
+    assert set(scheduler.latencies) == {"a.pic.yml", "b.pic.yml"}
+    assert scheduler.latencies["a.pic.yml"] >= 0.2
+
+
+def test_rebuild_scheduler_slow_on_start() -> None:
+    built: list[str] = []
+    scheduler = RebuildScheduler(
+        build=built.append,
+        debounce=0.05,
+        max_workers=0,
+        on_start=lambda path: time.sleep(0.5),
+    )
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    scheduler.submit("a.pic.yml")
+    time.sleep(0.2)
+    # on_start of a.pic.yml is running, submitting must not wait for it
+    t = time.monotonic()
+    scheduler.submit("b.pic.yml")
+    assert time.monotonic() - t < 0.1
+    time.sleep(1.5)
+    scheduler.shutdown()
+    thread.join()
+
+    assert sorted(built) == ["a.pic.yml", "b.pic.yml"]
+
+
+def test_init_worker_registers_yaml_cells(tmp_path) -> None:
+    from gdsfactory.pdk import get_active_pdk
+    from gdsfactory.watch import _init_worker
+
+    (tmp_path / "watched_cell.pic.yml").write_text(
+        "instances:\n  s:\n    component: straight\n"
+    )
+    _init_worker(path=str(tmp_path))
+    pdk = get_active_pdk()
+    assert "watched_cell" in pdk.cells
+    pdk.remove_cell("watched_cell")
+
+
+def test_rebuild_scheduler_remove() -> None:
+    built: list[str] = []
+    forgotten: list[str] = []
+    scheduler = RebuildScheduler(
+        build=built.append, debounce=0.2, max_workers=0, forget=forgotten.append
+    )
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    scheduler.submit("a.pic.yml")
+    scheduler.remove("a.pic.yml")
+    time.sleep(0.5)
+    scheduler.shutdown()
+    thread.join()
+
+    assert built == []
+    assert forgotten == ["a.pic.yml"]